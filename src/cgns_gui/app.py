@@ -5,36 +5,55 @@ from __future__ import annotations
 import ctypes
 import os
 import sys
+import time
 import warnings
 from collections.abc import MutableMapping
+from contextlib import AbstractContextManager, nullcontext
 from ctypes.util import find_library
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from functools import lru_cache, partial
 from pathlib import Path
 
 # VTK requires explicit imports for rendering backends
 import vtkmodules.vtkRenderingOpenGL2  # noqa: F401
-from PySide6.QtCore import QModelIndex, Qt, QThread, Signal
-from PySide6.QtGui import QAction, QActionGroup, QFont, QFontDatabase
+from PySide6.QtCore import (
+    QItemSelectionModel,
+    QModelIndex,
+    QRegularExpression,
+    Qt,
+    QThread,
+    Signal,
+)
+from PySide6.QtGui import (
+    QAction,
+    QActionGroup,
+    QFont,
+    QFontDatabase,
+    QRegularExpressionValidator,
+)
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
+    QCheckBox,
     QComboBox,
     QDialog,
     QDialogButtonBox,
+    QDoubleSpinBox,
     QFileDialog,
     QFormLayout,
     QHBoxLayout,
     QLabel,
+    QLineEdit,
     QMainWindow,
     QMenu,
     QMessageBox,
     QProgressBar,
     QSlider,
+    QSpinBox,
     QSplitter,
     QStatusBar,
     QToolBar,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
@@ -42,19 +61,30 @@ from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 from vtkmodules.vtkCommonCore import vtkOutputWindow
 from vtkmodules.vtkInteractionWidgets import vtkOrientationMarkerWidget
 from vtkmodules.vtkRenderingAnnotation import vtkAxesActor
-from vtkmodules.vtkRenderingCore import vtkRenderer, vtkRenderWindow
+from vtkmodules.vtkRenderingCore import vtkRenderer, vtkRenderWindow, vtkTextActor
 
 # Suppress VTK output window popups
 vtkOutputWindow.SetGlobalWarningDisplay(0)
 
 # Handle both direct execution and package imports
 try:
+    from .backends import backend_for_file
+    from .cache import ModelCache
     from .i18n import install_translators
     from .interaction import AdaptiveTrackballCameraStyle, InteractionController
-    from .loader import CgnsLoader
-    from .model import CgnsModel, Section, Zone
-    from .scene import RenderStyle, SceneManager
+    from .loader import CancelToken, CgnsLoader, LoadCancelled, LoadProgress
+    from .model import VOLUME_ELEMENT_TYPES, CgnsModel, FamilyInfo, Section, Zone
+    from .profiling import (
+        PHASE_TREE_POPULATE,
+        PHASE_VTK_BUILD,
+        FrameSample,
+        PerformanceMonitor,
+        PhaseTimer,
+    )
+    from .rendering import RenderScheduler
+    from .scene import DEFAULT_FEATURE_ANGLE, CellPick, RenderStyle, SceneManager
     from .selection import SelectionController
+    from .tree import CgnsTreeModel
 except ImportError:
     # Fallback for direct execution
     package_root = Path(__file__).resolve().parent.parent
@@ -62,12 +92,23 @@ except ImportError:
     if package_path not in sys.path:
         sys.path.insert(0, package_path)
     
+    from cgns_gui.backends import backend_for_file
+    from cgns_gui.cache import ModelCache
     from cgns_gui.i18n import install_translators
     from cgns_gui.interaction import AdaptiveTrackballCameraStyle, InteractionController
-    from cgns_gui.loader import CgnsLoader
-    from cgns_gui.model import CgnsModel, Section, Zone
-    from cgns_gui.scene import RenderStyle, SceneManager
+    from cgns_gui.loader import CancelToken, CgnsLoader, LoadCancelled, LoadProgress
+    from cgns_gui.model import VOLUME_ELEMENT_TYPES, CgnsModel, FamilyInfo, Section, Zone
+    from cgns_gui.profiling import (
+        PHASE_TREE_POPULATE,
+        PHASE_VTK_BUILD,
+        FrameSample,
+        PerformanceMonitor,
+        PhaseTimer,
+    )
+    from cgns_gui.rendering import RenderScheduler
+    from cgns_gui.scene import DEFAULT_FEATURE_ANGLE, CellPick, RenderStyle, SceneManager
     from cgns_gui.selection import SelectionController
+    from cgns_gui.tree import CgnsTreeModel
 
 BACKGROUND_OPTIONS: dict[str, tuple[float, float, float]] = {
     "Dark Slate": (0.1, 0.1, 0.12),
@@ -80,13 +121,30 @@ DEFAULT_BACKGROUND_NAME = "Dark Slate"
 RENDER_STYLE_LABELS: dict[RenderStyle, str] = {
     RenderStyle.SURFACE: "Surface",
     RenderStyle.WIREFRAME: "Wireframe",
+    RenderStyle.FEATURE_EDGES: "Feature Edges",
 }
 
 
+# Zones decoded concurrently while loading a file
+DEFAULT_LOAD_WORKERS = min(4, os.cpu_count() or 1)
+MAX_LOAD_WORKERS = 64
+
+# Volume sections whose boundary surface is extracted concurrently
+SURFACE_WORKERS = 2
+
+# Camera motion switches to decimated proxies when full frames miss this rate (0 = never)
+DEFAULT_TARGET_FPS = 20
+MAX_TARGET_FPS = 120
+
+
 @dataclass
 class ViewerSettings:
     background: str
     render_style: RenderStyle
+    load_workers: int = DEFAULT_LOAD_WORKERS
+    batched_sections: bool = False
+    feature_angle: float = DEFAULT_FEATURE_ANGLE
+    target_fps: int = DEFAULT_TARGET_FPS
 
 
 @lru_cache(maxsize=1)
@@ -256,24 +314,83 @@ def _configure_application_font(app: QApplication) -> None:
             return
 
 
+def _format_bytes(size: int) -> str:
+    """Format a byte count using binary units."""
+
+    value = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(value) < 1024.0 or unit == "GiB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024.0
+    return f"{value:.1f} GiB"
+
+
 class CgnsLoaderThread(QThread):
     """后台线程用于加载 CGNS 文件，避免阻塞 UI"""
     
+    # 信号：一个 Zone 的结构(名称、类型、数量)已读取，传递 LoadProgress
+    zoneLoaded = Signal(object)
+    # 信号：一个 Zone 默认可见 sections 的数组已读取，可以加入场景
+    zoneReady = Signal(object)
     # 信号：加载完成(成功时传递模型)
     loaded = Signal(object)
     # 信号：加载失败(传递错误信息)
     error = Signal(str)
     
-    def __init__(self, file_path: str, parent=None) -> None:  # noqa: ANN001
+    def __init__(
+        self,
+        file_path: str,
+        parent=None,  # noqa: ANN001
+        *,
+        workers: int = 1,
+        phase_timer: PhaseTimer | None = None,
+    ) -> None:
         super().__init__(parent)
         self._file_path = file_path
+        self._workers = workers
+        self._phase_timer = phase_timer
+        self._cancel_token = CancelToken()
+
+    def cancel(self) -> None:
+        """请求取消加载；线程会在下一个检查点(Zone、Section 或分块读取之间)退出"""
+        self._cancel_token.cancel()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_token.cancelled
     
     def run(self) -> None:
         """在后台线程中加载 CGNS 文件"""
         try:
-            loader = CgnsLoader()
-            model = loader.load(self._file_path)
-            self.loaded.emit(model)
+            backend = backend_for_file(self._file_path)
+            # 设置 CGNS_GUI_CACHE_DIR 后启用磁盘缓存
+            loader = CgnsLoader(
+                backend=backend,
+                lazy=True,
+                cache=ModelCache.from_env(),
+                workers=self._workers,
+                cancel_token=self._cancel_token,
+                phase_timer=self._phase_timer,
+            )
+            families: dict[str, FamilyInfo] = {}
+            zones: list[Zone] = []
+            bytes_read = 0
+            # 逐个 Zone 流水线处理：结构读完即加入树，随后读取默认可见 sections 的数组
+            # 并交给场景，首个 Zone 读完即可交互；并行解码时后续 Zone 的结构同时在读取。
+            # 体单元推迟到首次显示时再读取
+            for progress in loader.iter_zones(self._file_path, families):
+                self.zoneLoaded.emit(progress)
+                for section in progress.zone.sections:
+                    self._cancel_token.raise_if_cancelled()
+                    if section.element_type not in VOLUME_ELEMENT_TYPES:
+                        section.mesh.load()
+                bytes_read += progress.zone.loaded_bytes
+                zones.append(progress.zone)
+                self.zoneReady.emit(replace(progress, bytes_read=bytes_read))
+            self.loaded.emit(CgnsModel(zones=zones, families=families))
+        except LoadCancelled:
+            # 被新的加载替换：已读取的数据随线程局部变量一起释放
+            return
         except Exception as e:  # noqa: BLE001
             self.error.emit(str(e))
 
@@ -281,6 +398,9 @@ class CgnsLoaderThread(QThread):
 class MainWindow(QMainWindow):
     """Main window embedding a VTK render view."""
 
+    # 信号：后台线程提取完一个体单元表面(由工作线程发出，排队到 GUI 线程处理)
+    surfaceReady = Signal()
+
     def __init__(self, parent: QWidget | None = None) -> None:  # noqa: D401
         super().__init__(parent)
         self.setWindowTitle(self.tr("CGNS Viewer"))
@@ -289,6 +409,14 @@ class MainWindow(QMainWindow):
         self._model: CgnsModel | None = None
         self._loader = CgnsLoader()
         self._loader_thread: CgnsLoaderThread | None = None  # 加载线程
+        # 帧耗时与加载各阶段耗时，可在工具栏显示为叠加层并导出
+        self.performance = PerformanceMonitor()
+        self._load_timer: PhaseTimer | None = None
+        self._hud_actor: vtkTextActor | None = None
+        self._hud_action: QAction | None = None
+        self._hud_observers: list[int] = []
+        self._frame_started: float | None = None
+        self._retired_threads: set[CgnsLoaderThread] = set()  # 已取消、尚未退出的加载线程
 
         central = QWidget(self)
         layout = QVBoxLayout(central)
@@ -324,10 +452,16 @@ class MainWindow(QMainWindow):
         splitter.setStretchFactor(1, 1)
 
         self.renderer = vtkRenderer()
-        self.scene = SceneManager(self.renderer)
+        self.scene = SceneManager(
+            self.renderer,
+            surface_workers=SURFACE_WORKERS,
+            on_surface_ready=self.surfaceReady.emit,
+        )
+        self.surfaceReady.connect(self._on_surface_ready)
         self._render_group: QActionGroup | None = None
         self._surface_action: QAction | None = None
         self._wireframe_action: QAction | None = None
+        self._feature_edges_action: QAction | None = None
         self._orientation_widget: vtkOrientationMarkerWidget | None = None
         self._axes_actor: vtkAxesActor | None = None
         self._orientation_action: QAction | None = None
@@ -346,6 +480,9 @@ class MainWindow(QMainWindow):
             render_style=RenderStyle.SURFACE,
         )
         self._loading_active = False
+        # 所有重绘请求经由调度器合并，每帧最多渲染一次
+        self.render_scheduler = RenderScheduler(self.vtk_widget.GetRenderWindow(), self)
+        self.render_scheduler.rendered.connect(self._on_frame_rendered)
         self._setup_renderer()
         self._create_actions()
         self._selection_controller = SelectionController(
@@ -353,8 +490,10 @@ class MainWindow(QMainWindow):
             self.tree,
             self.vtk_widget,
             self,
+            render_scheduler=self.render_scheduler,
         )
         self._selection_controller.sectionChanged.connect(self._on_section_changed)
+        self._selection_controller.cellPicked.connect(self._on_cell_picked)
         self.details.transparencyChanged.connect(self._on_section_transparency_changed)
         self.details.clear()
 
@@ -374,6 +513,8 @@ class MainWindow(QMainWindow):
         if interactor is not None:
             style = AdaptiveTrackballCameraStyle()
             style.set_renderer(self.renderer)
+            style.AddObserver("StartInteractionEvent", self._on_interaction_started)
+            style.AddObserver("EndInteractionEvent", self._on_interaction_ended)
             interactor.SetInteractorStyle(style)
             self._adaptive_style = style
             self._interaction_controller.attach(interactor)
@@ -405,40 +546,174 @@ class MainWindow(QMainWindow):
     def load_file(self, path: str) -> None:
         """异步加载 CGNS 文件，避免阻塞 UI"""
         
-        # 如果有正在运行的加载线程，先停止它
-        if self._loader_thread is not None and self._loader_thread.isRunning():
-            self._loader_thread.quit()
-            self._loader_thread.wait()
+        # 如果有正在运行的加载线程，取消它；不等待其结束，避免阻塞 UI
+        self._cancel_loader_thread()
         
         filename = Path(path).name
         self._show_loading(filename)
+        self._begin_streamed_model()
+        self._load_timer = self.performance.begin_load(path)
         
         # 创建并启动加载线程
-        self._loader_thread = CgnsLoaderThread(path, self)
+        self._loader_thread = CgnsLoaderThread(
+            path,
+            self,
+            workers=self._viewer_settings.load_workers,
+            phase_timer=self._load_timer,
+        )
+        self._loader_thread.zoneLoaded.connect(self._on_zone_loaded)
+        self._loader_thread.zoneReady.connect(self._on_zone_ready)
         self._loader_thread.loaded.connect(self._on_file_loaded)
         self._loader_thread.error.connect(self._on_file_load_error)
         self._loader_thread.start()
     
-    def _on_file_loaded(self, model: CgnsModel) -> None:
-        """当文件加载成功时调用（在主线程中）"""
-        self._hide_loading()  # 立即隐藏进度条
-        
-        self.load_model(model)
-        filename = "CGNS file"
+    def _cancel_loader_thread(self) -> None:
+        thread = self._loader_thread
+        self._loader_thread = None
+        if thread is None:
+            return
+        # 断开信号，旧线程已排队的 Zone 也不会再进入树和场景
+        for signal in (thread.zoneLoaded, thread.zoneReady, thread.loaded, thread.error):
+            signal.disconnect()
+        if self._load_timer is not None:
+            # 被取消的加载也结束其计时记录，导出时不会显示为仍在加载
+            self.performance.end_load(self._load_timer, cancelled=True)
+            self._load_timer = None
+        if not thread.isRunning():
+            thread.deleteLater()
+            return
+        # 线程对象在 run() 真正返回前必须保持存活；先连接 finished 再取消，
+        # 连接前已经结束的线程由下面的 isFinished() 检查释放
+        self._retired_threads.add(thread)
+        thread.finished.connect(partial(self._release_loader_thread, thread))
+        thread.cancel()
+        if thread.isFinished():
+            self._release_loader_thread(thread)
+
+    def _release_loader_thread(self, thread: CgnsLoaderThread) -> None:
+        if thread not in self._retired_threads:
+            return
+        self._retired_threads.discard(thread)
+        thread.deleteLater()
+
+    def closeEvent(self, event) -> None:  # noqa: ANN001, N802
+        self.render_scheduler.cancel()
+        self._selection_controller.close()
+        self.scene.close()
+        self._cancel_loader_thread()
+        for thread in list(self._retired_threads):
+            thread.wait()
+        super().closeEvent(event)
+
+    def _begin_streamed_model(self) -> None:
+        """清空当前模型，随后由加载线程逐个 Zone 填充树和场景"""
+        self._model = CgnsModel()
+        self.tree.begin_model(self._model)
+        self.scene.begin_model(self._model)
+        self._selection_controller.sync_scene()
+        self._selection_controller.clear()
+        self.render_scheduler.request()
+
+    def _from_stale_loader(self) -> bool:
+        """信号来自已被替换的加载线程(断开前已排队的事件)"""
+        sender = self.sender()
+        return isinstance(sender, CgnsLoaderThread) and sender is not self._loader_thread
+
+    def _loading_filename(self) -> str:
         if self._loader_thread:
-            filename = Path(self._loader_thread._file_path).name
+            return Path(self._loader_thread._file_path).name
+        return "CGNS file"
+
+    def _on_zone_loaded(self, progress: LoadProgress) -> None:
+        """Zone 结构读取完成：加入模型树"""
+        if self._from_stale_loader() or self._model is None:
+            return
+        self._model.families.update(progress.families)
+        self._model.add_zone(progress.zone)
+        with self._load_phase(PHASE_TREE_POPULATE):
+            self.tree.add_families(progress.families)
+            self.tree.add_zone(progress.zone)
+        # 每个 Zone 占进度条两格：结构读取一格，网格数组读取一格
+        self._set_load_progress(2 * progress.index + 1, 2 * progress.total)
         self._status_bar.showMessage(
-            self.tr("Load complete: {filename}").format(filename=filename),
-            5000,
+            self.tr("Reading {filename}: zone {index} of {total}").format(
+                filename=self._loading_filename(),
+                index=progress.index + 1,
+                total=progress.total,
+            )
         )
+
+    def _on_zone_ready(self, progress: LoadProgress) -> None:
+        """Zone 的网格数组读取完成：加入场景，首个 Zone 到达后即可交互"""
+        if self._from_stale_loader():
+            return
+        with self._load_phase(PHASE_VTK_BUILD):
+            self.scene.add_families(progress.families)
+            self.scene.add_zone(progress.zone)
+        self._selection_controller.sync_scene()
+        if progress.index == 0:
+            self._reset_camera()
+        else:
+            self.render_scheduler.request()
+        self._set_load_progress(2 * progress.index + 2, 2 * progress.total)
+        self._status_bar.showMessage(
+            self.tr("Loading {filename}: zone {index} of {total} ({size} read)").format(
+                filename=self._loading_filename(),
+                index=progress.index + 1,
+                total=progress.total,
+                size=_format_bytes(progress.bytes_read),
+            )
+        )
+
+    def _load_phase(self, phase: str) -> AbstractContextManager[None]:
+        if self._load_timer is None:
+            return nullcontext()
+        return self._load_timer.phase(phase)
+
+    def _set_load_progress(self, value: int, maximum: int) -> None:
+        self._progress.setRange(0, max(maximum, 1))
+        self._progress.setValue(value)
+
+    def _on_file_loaded(self, model: CgnsModel) -> None:
+        """当文件加载成功时调用（在主线程中）；zones 已经逐个加入树和场景"""
+        if self._from_stale_loader():
+            return
+        self._hide_loading()  # 立即隐藏进度条
+
+        with self._load_phase(PHASE_TREE_POPULATE):
+            if self._model is not None:
+                # 没有 Zone 的 Base 中的 Family 只在最后才完整
+                self._model.families.update(model.families)
+                self.tree.add_families(model.families)
+        if self._load_timer is not None:
+            # 记录模型查找索引的内存占用
+            index_bytes = None if self._model is None else self._model.index_memory().total_bytes
+            self.performance.end_load(self._load_timer, index_bytes=index_bytes)
+            self._load_timer = None
+        self._selection_controller.sync_scene()
+        self._reset_camera()
+        self._update_interactor_focus(force=True)
+        filename = self._loading_filename()
+        saved = self.scene.points_memory_report().saved_bytes
+        if saved > 0:
+            message = self.tr("Load complete: {filename} (shared coordinates saved {size})").format(
+                filename=filename,
+                size=_format_bytes(saved),
+            )
+        else:
+            message = self.tr("Load complete: {filename}").format(filename=filename)
+        self._status_bar.showMessage(message, 5000)
     
     def _on_file_load_error(self, error_msg: str) -> None:
         """当文件加载失败时调用（在主线程中）"""
+        if self._from_stale_loader():
+            return
         self._hide_loading()  # 立即隐藏进度条
+        if self._load_timer is not None:
+            self.performance.end_load(self._load_timer)
+            self._load_timer = None
         
-        filename = "CGNS file"
-        if self._loader_thread:
-            filename = Path(self._loader_thread._file_path).name
+        filename = self._loading_filename()
         self._show_error(
             self.tr("Failed to read {filename}").format(filename=filename),
             error_msg,
@@ -454,6 +729,8 @@ class MainWindow(QMainWindow):
         self._update_interactor_focus(force=True)
 
     def _on_section_changed(self, key: tuple[str, int] | None) -> None:
+        # 选择变化时移除上一次跳转标出的单元
+        self.scene.mark_cell(None)
         info = self.tree.section_info(key)
         if info is None:
             self.details.clear()
@@ -469,10 +746,15 @@ class MainWindow(QMainWindow):
         self.details.update_section(zone, section, key=key, transparency=transparency)
         self._update_interactor_focus(key, force=True)
 
+    def _on_cell_picked(self, pick: CellPick | None) -> None:
+        if pick is not None:
+            self.details.show_cell(pick)
+        self.render_scheduler.request()
+
     def _on_section_transparency_changed(self, payload: tuple[tuple[str, int], float]) -> None:
         key, transparency = payload
         self.scene.set_section_transparency(key, transparency)
-        self.vtk_widget.GetRenderWindow().Render()
+        self.render_scheduler.request()
 
     def _create_actions(self) -> None:
         toolbar = QToolBar("main", self)
@@ -502,21 +784,50 @@ class MainWindow(QMainWindow):
         self._render_group.addAction(self._wireframe_action)
         toolbar.addAction(self._wireframe_action)
 
+        self._feature_edges_action = QAction(self.tr("Feature Edges"), self)
+        self._feature_edges_action.setCheckable(True)
+        self._feature_edges_action.triggered.connect(self._set_feature_edges_mode)
+        self._render_group.addAction(self._feature_edges_action)
+        toolbar.addAction(self._feature_edges_action)
+
         toolbar.addSeparator()
 
         reset_action = QAction(self.tr("Reset Camera"), self)
         reset_action.triggered.connect(self._reset_camera)
         toolbar.addAction(reset_action)
 
+        go_to_action = QAction(self.tr("Go to Element..."), self)
+        go_to_action.setToolTip(self.tr("Select and frame a cell by its CGNS element id"))
+        go_to_action.triggered.connect(self._open_element_dialog)
+        toolbar.addAction(go_to_action)
+
+        hover_action = QAction(self.tr("Hover Highlight"), self)
+        hover_action.setCheckable(True)
+        hover_action.setToolTip(self.tr("Pre-highlight the section under the mouse"))
+        hover_action.triggered.connect(self._toggle_hover_highlight)
+        toolbar.addAction(hover_action)
+
         self._orientation_action = QAction(self.tr("Show Axes"), self)
         self._orientation_action.setCheckable(True)
         self._orientation_action.setChecked(True)
         self._orientation_action.triggered.connect(self._toggle_orientation_marker)
         toolbar.addAction(self._orientation_action)
 
+        self._hud_action = QAction(self.tr("Performance"), self)
+        self._hud_action.setCheckable(True)
+        self._hud_action.setToolTip(self.tr("Show frame and load timings over the view"))
+        self._hud_action.triggered.connect(self._toggle_performance_hud)
+        toolbar.addAction(self._hud_action)
+
+        export_action = QAction(self.tr("Export Timings..."), self)
+        export_action.setToolTip(self.tr("Save frame and load timings as JSON lines"))
+        export_action.triggered.connect(self._export_performance)
+        toolbar.addAction(export_action)
+
         self._interaction_controller.register_shortcut("r", self._reset_camera)
         self._interaction_controller.register_shortcut("w", self._activate_wireframe)
         self._interaction_controller.register_shortcut("s", self._activate_surface)
+        self._interaction_controller.register_shortcut("e", self._activate_feature_edges)
         self._interaction_controller.register_shortcut("o", self._toggle_orientation_shortcut)
 
         toolbar.addSeparator()
@@ -534,13 +845,74 @@ class MainWindow(QMainWindow):
             return
 
         settings = dialog.selected_settings()
+        self._viewer_settings.load_workers = settings.load_workers
+        self._viewer_settings.batched_sections = settings.batched_sections
+        self._viewer_settings.feature_angle = settings.feature_angle
+        self._viewer_settings.target_fps = settings.target_fps
+        # 合批设置在下次加载文件时生效
+        self.scene.batched = settings.batched_sections
+        self.scene.feature_angle = settings.feature_angle
         self._apply_background(settings.background)
         if settings.render_style is RenderStyle.SURFACE:
             self._activate_surface()
+        elif settings.render_style is RenderStyle.FEATURE_EDGES:
+            self._activate_feature_edges()
         else:
             self._activate_wireframe()
         self._status_bar.showMessage(self.tr("Settings updated"), 3000)
 
+    def _open_element_dialog(self) -> None:
+        if self._model is None or not self._model.zones:
+            self._status_bar.showMessage(self.tr("No model loaded"), 3000)
+            return
+        dialog = _ElementDialog([zone.name for zone in self._model.zones], self)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        selection = dialog.selected_element()
+        if selection is not None:
+            self.go_to_element(*selection)
+
+    def go_to_element(self, zone_name: str, element_id: int) -> bool:
+        """Select the section of a CGNS element id, outline the cell and frame it."""
+        location = None
+        if self._model is not None:
+            location = self._model.locate_element(zone_name, element_id)
+        if location is None:
+            self._status_bar.showMessage(
+                self.tr("Element {element} not found in {zone}").format(
+                    element=element_id,
+                    zone=zone_name,
+                ),
+                5000,
+            )
+            return False
+        key, cell = location
+        section = self._model.section(key)
+        if not self.scene.is_section_visible(key) and section.mesh.is_loaded:
+            self._set_sections_visibility([key], True)
+        # 未加载的隐藏 section(通常是大体单元)不整体显示，只读取并标出这一个单元
+        self._selection_controller.select(key, hidden=True)
+        bounds = self.scene.mark_cell(key, cell)
+        pick = self.scene.describe_cell(key, cell)
+        if pick is not None:
+            self.details.show_cell(pick)
+        if bounds is not None:
+            # 相机对准该单元；裁剪范围仍按整个场景计算，避免其余几何被裁掉
+            self.renderer.ResetCamera(bounds)
+            self.renderer.ResetCameraClippingRange()
+            if self._adaptive_style is not None:
+                self._adaptive_style.focus_on_bounds(bounds)
+        self.render_scheduler.request()
+        self._status_bar.showMessage(
+            self.tr("Element {element}: {section}, cell {cell}").format(
+                element=element_id,
+                section=section.name,
+                cell=cell + 1,
+            ),
+            5000,
+        )
+        return True
+
     def _open_dialog(self) -> None:
         file_path, _ = QFileDialog.getOpenFileName(
             self,
@@ -553,8 +925,7 @@ class MainWindow(QMainWindow):
 
     def _reset_camera(self) -> None:
         self.renderer.ResetCamera()
-        render_window = self.vtk_widget.GetRenderWindow()
-        render_window.Render()
+        self.render_scheduler.request()
         self._update_interactor_focus(force=False)
 
     def _toggle_orientation_marker(self, checked: bool) -> None:
@@ -567,7 +938,7 @@ class MainWindow(QMainWindow):
             # 禁用交互模式以避免拖动后卡住的问题
             # 用户仍然可以看到坐标轴，但不能拖动它
             self._orientation_widget.InteractiveOff()
-        self.vtk_widget.GetRenderWindow().Render()
+        self.render_scheduler.request()
 
     def _ensure_orientation_widget(self, interactor) -> None:
         if self._orientation_widget is not None:
@@ -592,69 +963,230 @@ class MainWindow(QMainWindow):
         if checked:
             self.scene.set_render_style(RenderStyle.SURFACE)
             self._viewer_settings.render_style = RenderStyle.SURFACE
-            self.vtk_widget.GetRenderWindow().Render()
+            self.render_scheduler.request()
 
     def _set_wireframe_mode(self, checked: bool) -> None:
         if checked:
             self.scene.set_render_style(RenderStyle.WIREFRAME)
             self._viewer_settings.render_style = RenderStyle.WIREFRAME
-            self.vtk_widget.GetRenderWindow().Render()
+            self.render_scheduler.request()
+
+    def _set_feature_edges_mode(self, checked: bool) -> None:
+        if checked:
+            self.scene.set_render_style(RenderStyle.FEATURE_EDGES)
+            self._viewer_settings.render_style = RenderStyle.FEATURE_EDGES
+            self.render_scheduler.request()
 
 
     def _on_tree_context_menu(self, position) -> None:  # noqa: ANN001
-        item = self.tree.itemAt(position)
-        if item is None or not hasattr(self.tree, "section_key"):
+        index = self.tree.indexAt(position).siblingAtColumn(0)
+        if not index.isValid() or not hasattr(self.tree, "item_section_keys"):
             return
-        key = self.tree.section_key(item)  # type: ignore[attr-defined]
-        if key is None:
+        # 在选中项上右键时作用于整个多选，否则只作用于该节点（Family/Zone 展开为其 sections）
+        selected = self.tree.selected_indexes()  # type: ignore[attr-defined]
+        if index in selected and len(selected) > 1:
+            keys = self.tree.selected_section_keys()  # type: ignore[attr-defined]
+        else:
+            keys = self.tree.item_section_keys(index)  # type: ignore[attr-defined]
+        if not keys:
             return
 
         menu = QMenu(self.tree)
-        visible = self.scene.is_section_visible(key)
-        if visible:
-            action = menu.addAction(self.tr("Hide Section"))
-            action.triggered.connect(partial(self._set_section_visibility, key, False))
+        visible = [self.scene.is_section_visible(key) for key in keys]
+        if self.tree.section_key(index) is not None and len(keys) == 1:  # type: ignore[attr-defined]
+            if visible[0]:
+                action = menu.addAction(self.tr("Hide Section"))
+                action.triggered.connect(partial(self._set_section_visibility, keys[0], False))
+            else:
+                action = menu.addAction(self.tr("Show Section"))
+                action.triggered.connect(partial(self._set_section_visibility, keys[0], True))
         else:
-            action = menu.addAction(self.tr("Show Section"))
-            action.triggered.connect(partial(self._set_section_visibility, key, True))
+            if any(visible):
+                action = menu.addAction(self.tr("Hide {count} Sections").format(count=len(keys)))
+                action.triggered.connect(partial(self._set_sections_visibility, keys, False))
+            if not all(visible):
+                action = menu.addAction(self.tr("Show {count} Sections").format(count=len(keys)))
+                action.triggered.connect(partial(self._set_sections_visibility, keys, True))
+            transparency_menu = menu.addMenu(self.tr("Transparency"))
+            for percent in (0, 30, 50, 80):
+                action = transparency_menu.addAction(f"{percent}%")
+                action.triggered.connect(
+                    partial(self._set_sections_transparency, keys, percent / 100.0)
+                )
         menu.exec(self.tree.viewport().mapToGlobal(position))
 
-
     def _set_section_visibility(self, key: tuple[str, int], visible: bool) -> None:
-        changed = self.scene.set_section_visible(key, visible)
+        self._set_sections_visibility([key], visible)
+
+    def _set_sections_visibility(self, keys: list[tuple[str, int]], visible: bool) -> None:
+        changed = self.scene.set_sections_visible(keys, visible)
         if not changed:
             return
 
-        current_item = self.tree.currentItem()
         current_key = None
         if hasattr(self.tree, "section_key"):
-            current_key = self.tree.section_key(current_item)  # type: ignore[attr-defined]
+            current_key = self.tree.section_key(self.tree.currentIndex())  # type: ignore[attr-defined]
 
-        if current_key == key:
+        if current_key is not None and current_key in changed:
             if visible:
-                self.scene.highlight(key)
+                self.scene.highlight(current_key)
             else:
                 self.scene.highlight(None)
             self._on_section_changed(current_key)
 
+        # 无论改变了多少 sections，只刷新一次拾取列表并请求一次渲染
         self._selection_controller.sync_scene()
-        self.vtk_widget.GetRenderWindow().Render()
+        self.render_scheduler.request()
         self._update_interactor_focus(current_key if visible else None, force=False)
 
+    def _on_surface_ready(self) -> None:
+        """体单元表面或简化代理生成完成：挂到对应 actor 上并重绘"""
+        if self.scene.apply_ready_surfaces() or self.scene.interactive:
+            self.render_scheduler.request()
+        self._report_scene_failures()
+
+    def _report_scene_failures(self) -> None:
+        """后台构建失败的表面、代理或拾取定位器：其余结果照常显示，失败在状态栏提示"""
+        failures = self.scene.take_failures()
+        if not failures:
+            return
+        key, error = failures[-1]
+        section = None if key is None or self._model is None else self._model.section(key)
+        name = self.tr("a merged zone") if section is None else f"{key[0]}/{section.name}"
+        self._status_bar.showMessage(
+            self.tr("Could not prepare {name} for display: {error} ({count} failed)").format(
+                name=name,
+                error=error,
+                count=len(failures),
+            ),
+            10000,
+        )
+
+    def _full_frames_too_slow(self) -> bool:
+        target_fps = self._viewer_settings.target_fps
+        return target_fps > 0 and self.renderer.GetLastRenderTimeInSeconds() > 1.0 / target_fps
+
+    def _on_frame_rendered(self) -> None:
+        # 完整分辨率帧已慢于目标帧率：提前在后台生成简化代理
+        if not self.scene.interactive and self._full_frames_too_slow():
+            self.scene.prepare_lod()
+
+    def _on_interaction_started(self, obj, event) -> None:  # noqa: ANN001 - VTK callback
+        """相机开始移动：完整分辨率帧过慢时改绘简化代理"""
+        if self._full_frames_too_slow():
+            self.scene.set_interactive(True)
+
+    def _on_interaction_ended(self, obj, event) -> None:  # noqa: ANN001 - VTK callback
+        # 交互样式随后以完整分辨率重绘一帧
+        self.scene.set_interactive(False)
+
+    def _set_sections_transparency(self, keys: list[tuple[str, int]], value: float) -> None:
+        self.scene.set_sections_transparency(keys, value)
+        current_key = None
+        if hasattr(self.tree, "section_key"):
+            current_key = self.tree.section_key(self.tree.currentIndex())  # type: ignore[attr-defined]
+        info = self.tree.section_info(current_key) if current_key in keys else None
+        if info is not None:
+            # 只刷新详情面板的透明度显示，不移动相机焦点
+            zone, section = info
+            self.details.update_section(zone, section, key=current_key, transparency=value)
+        self.render_scheduler.request()
 
     def _activate_surface(self) -> None:
         self._set_surface_mode(True)
+        # 动作组互斥，勾选一个即取消其他
         if self._surface_action is not None:
             self._surface_action.setChecked(True)
-        if self._wireframe_action is not None:
-            self._wireframe_action.setChecked(False)
 
     def _activate_wireframe(self) -> None:
         self._set_wireframe_mode(True)
         if self._wireframe_action is not None:
             self._wireframe_action.setChecked(True)
-        if self._surface_action is not None:
-            self._surface_action.setChecked(False)
+
+    def _activate_feature_edges(self) -> None:
+        self._set_feature_edges_mode(True)
+        if self._feature_edges_action is not None:
+            self._feature_edges_action.setChecked(True)
+
+    def _toggle_hover_highlight(self, checked: bool) -> None:
+        self._selection_controller.set_hover_enabled(checked)
+
+    def _toggle_performance_hud(self, checked: bool) -> None:
+        render_window = self.vtk_widget.GetRenderWindow()
+        if checked and self._hud_actor is None:
+            actor = vtkTextActor()
+            actor.PickableOff()
+            coordinate = actor.GetPositionCoordinate()
+            coordinate.SetCoordinateSystemToNormalizedViewport()
+            coordinate.SetValue(0.01, 0.99)
+            text = actor.GetTextProperty()
+            text.SetFontFamilyToCourier()
+            text.SetFontSize(13)
+            text.SetColor(1.0, 1.0, 1.0)
+            text.SetBackgroundColor(0.0, 0.0, 0.0)
+            text.SetBackgroundOpacity(0.5)
+            text.SetVerticalJustificationToTop()
+            actor.SetInput(self.performance.summary())
+            self.renderer.AddViewProp(actor)
+            self._hud_actor = actor
+            # 只统计开启之后的流水线耗时
+            self.scene.take_pipeline_seconds()
+            self._hud_observers = [
+                render_window.AddObserver("StartEvent", self._on_render_started),
+                render_window.AddObserver("EndEvent", self._on_render_finished),
+            ]
+        elif not checked and self._hud_actor is not None:
+            for observer in self._hud_observers:
+                render_window.RemoveObserver(observer)
+            self._hud_observers = []
+            self.renderer.RemoveViewProp(self._hud_actor)
+            self._hud_actor = None
+            self._frame_started = None
+        self.render_scheduler.request()
+
+    def _on_render_started(self, obj, event) -> None:  # noqa: ANN001 - VTK callback
+        self._frame_started = time.perf_counter()
+
+    def _on_render_finished(self, obj, event) -> None:  # noqa: ANN001 - VTK callback
+        """记录一帧的耗时与绘制量；叠加层文字在下一帧显示"""
+        if self._frame_started is None:
+            return
+        frame_seconds = time.perf_counter() - self._frame_started
+        self._frame_started = None
+        stats = self.scene.draw_stats()
+        self.performance.record_frame(
+            FrameSample(
+                frame_seconds=frame_seconds,
+                actors=stats.actors,
+                cells=stats.cells,
+                pipeline_seconds=self.scene.take_pipeline_seconds(),
+                pick_seconds=self._selection_controller.last_pick_seconds,
+            )
+        )
+        if self._hud_actor is not None:
+            self._hud_actor.SetInput(self.performance.summary())
+
+    def _export_performance(self) -> None:
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            self.tr("Export Timings"),
+            "cgns-gui-timings.jsonl",
+            self.tr("JSON Lines (*.jsonl);;All Files (*)"),
+        )
+        if not file_path:
+            return
+        try:
+            count = self.performance.export_jsonl(file_path)
+        except OSError as exc:
+            QMessageBox.critical(self, self.tr("Export failed"), str(exc))
+            return
+        self._status_bar.showMessage(
+            self.tr("Exported {count} timing records to {filename}").format(
+                count=count,
+                filename=Path(file_path).name,
+            ),
+            5000,
+        )
 
     def _toggle_orientation_shortcut(self) -> None:
         if self._orientation_action is None:
@@ -671,11 +1203,12 @@ class MainWindow(QMainWindow):
         self.renderer.SetBackground(*color)
         self._background_name = name
         self._viewer_settings.background = name
-        render_window = self.vtk_widget.GetRenderWindow()
-        render_window.Render()
+        self.render_scheduler.request()
 
     def _show_loading(self, filename: str) -> None:
         self._loading_active = True
+        # 在第一个 Zone 到达前显示为不确定进度
+        self._progress.setRange(0, 0)
         self._progress.setVisible(True)
         if self._toolbar is not None:
             self._toolbar.setEnabled(False)
@@ -724,7 +1257,40 @@ class _SettingsDialog(QDialog):
             self.render_combo.setCurrentIndex(0)
 
         form.addRow(self.tr("Background Color"), self.background_combo)
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, MAX_LOAD_WORKERS)
+        self.workers_spin.setValue(settings.load_workers)
+        self.workers_spin.setToolTip(self.tr("Number of zones decoded in parallel when loading"))
+
+        self.batched_check = QCheckBox(self.tr("Merge sections of a zone into one actor"))
+        self.batched_check.setChecked(settings.batched_sections)
+        self.batched_check.setToolTip(
+            self.tr("Faster rendering for models with many sections; applies to the next file")
+        )
+
+        self.feature_angle_spin = QDoubleSpinBox()
+        self.feature_angle_spin.setRange(0.0, 180.0)
+        self.feature_angle_spin.setDecimals(1)
+        self.feature_angle_spin.setSuffix("°")
+        self.feature_angle_spin.setValue(settings.feature_angle)
+        self.feature_angle_spin.setToolTip(
+            self.tr("Feature Edges mode draws edges whose faces meet at a sharper angle")
+        )
+
         form.addRow(self.tr("Render Style"), self.render_combo)
+        form.addRow(self.tr("Feature Angle"), self.feature_angle_spin)
+        self.target_fps_spin = QSpinBox()
+        self.target_fps_spin.setRange(0, MAX_TARGET_FPS)
+        self.target_fps_spin.setSpecialValueText(self.tr("Off"))
+        self.target_fps_spin.setSuffix(" fps")
+        self.target_fps_spin.setValue(settings.target_fps)
+        self.target_fps_spin.setToolTip(
+            self.tr("Draw simplified geometry while the camera moves if frames are slower")
+        )
+
+        form.addRow(self.tr("Interactive Frame Rate"), self.target_fps_spin)
+        form.addRow(self.tr("Loader Threads"), self.workers_spin)
+        form.addRow(self.tr("Batch Rendering"), self.batched_check)
 
         layout.addLayout(form)
 
@@ -741,172 +1307,144 @@ class _SettingsDialog(QDialog):
             render_style = RenderStyle(style_value)
         except ValueError:
             render_style = RenderStyle.SURFACE
-        return ViewerSettings(background=background, render_style=render_style)
+        return ViewerSettings(
+            background=background,
+            render_style=render_style,
+            load_workers=self.workers_spin.value(),
+            batched_sections=self.batched_check.isChecked(),
+            feature_angle=self.feature_angle_spin.value(),
+            target_fps=self.target_fps_spin.value(),
+        )
 
 
-class _ModelTreeWidget(QTreeWidget):
-    """Tree widget to display CGNS zones and sections."""
+class _ElementDialog(QDialog):
+    def __init__(self, zone_names: list[str], parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle(self.tr("Go to Element"))
+        self.setModal(True)
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+
+        self.zone_combo = QComboBox()
+        self.zone_combo.addItems(zone_names)
+        # CGNS 单元编号在 Zone 内唯一，单个 Zone 时无需选择
+        self.zone_combo.setEnabled(len(zone_names) > 1)
+
+        self.element_edit = QLineEdit()
+        self.element_edit.setValidator(
+            QRegularExpressionValidator(QRegularExpression(r"[1-9][0-9]{0,18}"), self)
+        )
+        self.element_edit.setPlaceholderText(self.tr("Global element id, e.g. 18734221"))
+
+        form.addRow(self.tr("Zone"), self.zone_combo)
+        form.addRow(self.tr("Element"), self.element_edit)
+        layout.addLayout(form)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def selected_element(self) -> tuple[str, int] | None:
+        text = self.element_edit.text()
+        if not text:
+            return None
+        return self.zone_combo.currentText(), int(text)
+
+
+class _ModelTreeWidget(QTreeView):
+    """Tree view of CGNS families, zones and sections over a :class:`CgnsTreeModel`.
+
+    Rows are created as nodes are expanded, so the API takes model indexes.
+    """
+
+    # 与 QTreeWidget 相同的信号：选中的行变化
+    itemSelectionChanged = Signal()
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self.setHeaderLabels([self.tr("Name"), self.tr("Type"), self.tr("Cells")])
+        self._tree_model = CgnsTreeModel(self)
+        self.setModel(self._tree_model)
         self.setColumnWidth(0, 200)
-        self._section_index: dict[tuple[str, int], QTreeWidgetItem] = {}
-        self._section_data: dict[tuple[str, int], tuple[Zone, Section]] = {}
-        self._family_sections: dict[str, list[tuple[str, int]]] = {}  # family_name -> section keys
-        self._model: CgnsModel | None = None
+        # 行高一致，滚动大量行时无需逐行测量
+        self.setUniformRowHeights(True)
+        # Ctrl/Shift 多选，右键菜单对所有选中的 sections 批量操作
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.selectionModel().selectionChanged.connect(self.itemSelectionChanged)
+
+    def tree_model(self) -> CgnsTreeModel:
+        return self._tree_model
 
     def populate(self, model: CgnsModel) -> None:
-        self.clear()
-        self._section_index.clear()
-        self._section_data.clear()
-        self._family_sections.clear()
-        self._model = model
-        
-        # 构建 Family -> Sections 映射
-        family_to_sections: dict[str, list[tuple[Zone, Section]]] = {}
-        for zone in model.zones:
-            for section in zone.iter_boundary_sections():
-                if section.boundary and section.boundary.family:
-                    family_name = section.boundary.family
-                    if family_name not in family_to_sections:
-                        family_to_sections[family_name] = []
-                    family_to_sections[family_name].append((zone, section))
-        
-        # 添加 Families 分组（如果存在）
-        if model.families:
-            families_group = QTreeWidgetItem([self.tr("Families"), "", ""])
-            families_group.setFlags(families_group.flags() & ~Qt.ItemIsSelectable)
-            self.addTopLevelItem(families_group)
-            
-            for family_name, family_info in sorted(model.families.items()):
-                type_str = family_info.bc_type or "Family"
-                
-                # 计算该 Family 下的总单元数
-                total_cells = 0
-                section_keys = []
-                if family_name in family_to_sections:
-                    for zone, section in family_to_sections[family_name]:
-                        total_cells += section.mesh.connectivity.shape[0]
-                        section_keys.append((zone.name, section.id))
-                
-                cells_str = str(total_cells) if total_cells > 0 else ""
-                family_item = QTreeWidgetItem([family_name, type_str, cells_str])
-                
-                # Family 节点存储特殊标记
-                family_item.setData(0, Qt.UserRole, ("family", family_name))
-                families_group.addChild(family_item)
-                
-                # 记录该 Family 包含的 sections
-                if section_keys:
-                    self._family_sections[family_name] = section_keys
-                    
-                    # 在 Family 下添加所属的 BC sections
-                    if family_name in family_to_sections:
-                        for zone, section in family_to_sections[family_name]:
-                            self._add_single_section(family_item, zone, section, boundary=True)
-        
-        # 添加 Zones
+        self.begin_model(model)
         for zone in model.zones:
-            zone_item = QTreeWidgetItem([zone.name, self.tr("Zone"), str(zone.total_cells)])
-            self.addTopLevelItem(zone_item)
-            body_sections = list(zone.iter_body_sections())
-            boundary_sections = list(zone.iter_boundary_sections())
-            self._add_sections(zone_item, zone, body_sections, boundary=False)
-            
-            # 只添加没有 Family 关联的 BC sections
-            orphan_bcs = [s for s in boundary_sections if not (s.boundary and s.boundary.family)]
-            if orphan_bcs:
-                boundary_group = QTreeWidgetItem([self.tr("Boundary Conditions"), "", ""])
-                boundary_group.setFlags(boundary_group.flags() & ~Qt.ItemIsSelectable)
-                zone_item.addChild(boundary_group)
-                self._add_sections(boundary_group, zone, orphan_bcs, boundary=True)
-        
-        self.expandAll()
+            self.add_zone(zone)
 
-    def _add_sections(
-        self,
-        parent: QTreeWidgetItem,
-        zone: Zone,
-        sections: list[Section],
-        *,
-        boundary: bool,
-    ) -> None:
-        for section in sections:
-            self._add_single_section(parent, zone, section, boundary=boundary)
-    
-    def _add_single_section(
-        self,
-        parent: QTreeWidgetItem,
-        zone: Zone,
-        section: Section,
-        *,
-        boundary: bool,
-    ) -> None:
-        """添加单个 section 到树中"""
-        display_name = section.name
-        type_label = section.element_type
-        if boundary and section.boundary is not None:
-            display_name = section.boundary.name or section.name
-            location = section.boundary.grid_location
-            if location:
-                type_label = self.tr("Boundary ({element}, {location})").format(
-                    element=section.element_type,
-                    location=location,
-                )
-            else:
-                type_label = self.tr("Boundary ({element})").format(
-                    element=section.element_type,
-                )
-        cells = str(section.mesh.connectivity.shape[0])
-        item = QTreeWidgetItem([display_name, type_label, cells])
-        key = (zone.name, section.id)
-        item.setData(0, Qt.UserRole, key)
-        parent.addChild(item)
-        self._section_index[key] = item
-        self._section_data[key] = (zone, section)
-
-    def section_key(self, item: QTreeWidgetItem | None) -> tuple[str, int] | None:
+    def begin_model(self, model: CgnsModel) -> None:
+        """Clear the tree for ``model``; zones are then added with :meth:`add_zone`."""
+        self._tree_model.begin_model(model)
+        self.expand(self._tree_model.families_index())
+
+    def add_families(self, families: dict[str, FamilyInfo]) -> None:
+        """添加尚未显示的 Family 节点（按名称排序）"""
+        self._tree_model.add_families(families)
+        # Family 数量有限，分组默认展开；Zone 与 section 行在展开时才创建
+        self.expand(self._tree_model.families_index())
+
+    def add_zone(self, zone: Zone) -> None:
+        """Append ``zone``: its BC sections go under their Family, the rest under the zone."""
+        self._tree_model.add_zone(zone)
+
+    def section_key(self, index: QModelIndex | None) -> tuple[str, int] | None:
         """获取 section key，如果是 Family 节点则返回 None"""
-        if item is None:
-            return None
-        data = item.data(0, Qt.UserRole)
-        if isinstance(data, tuple) and len(data) == 2:
-            # 检查是否是 ("family", family_name) 格式
-            if data[0] == "family":
-                return None  # Family 节点不返回单个 section key
-            return data  # type: ignore[return-value]
-        return None
-    
-    def get_family_sections(self, item: QTreeWidgetItem | None) -> list[tuple[str, int]] | None:
+        return self._tree_model.section_key(index)
+
+    def get_family_sections(self, index: QModelIndex | None) -> list[tuple[str, int]] | None:
         """如果是 Family 节点，返回该 Family 下所有 section keys"""
-        if item is None:
-            return None
-        data = item.data(0, Qt.UserRole)
-        if isinstance(data, tuple) and len(data) == 2 and data[0] == "family":
-            family_name = data[1]
-            return self._family_sections.get(family_name)
-        return None
+        return self._tree_model.get_family_sections(index)
+
+    def item_section_keys(self, index: QModelIndex | None) -> list[tuple[str, int]]:
+        """Section keys under ``index``: itself, its Family's BCs, or all of a Zone/group."""
+        return self._tree_model.item_section_keys(index)
+
+    def selected_indexes(self) -> list[QModelIndex]:
+        """First-column index of every selected row."""
+        return self.selectionModel().selectedRows(0)
+
+    def selected_section_keys(self) -> list[tuple[str, int]]:
+        """Section keys of every selected row, without duplicates."""
+        keys: dict[tuple[str, int], None] = {}
+        for index in self.selected_indexes():
+            keys.update(dict.fromkeys(self.item_section_keys(index)))
+        return list(keys)
 
     def select_section(self, key: tuple[str, int] | None) -> None:
         try:
             self.blockSignals(True)
+            selection_model = self.selectionModel()
             if key is None:
-                selection_model = self.selectionModel()
-                if selection_model is not None:
-                    selection_model.clearSelection()
+                selection_model.clearSelection()
                 self.setCurrentIndex(QModelIndex())
                 return
-            item = self._section_index.get(key)
-            if item is not None:
-                self.setCurrentItem(item)
+            index = self._tree_model.index_for_key(key)
+            if not index.isValid():
+                return
+            parent = index.parent()
+            while parent.isValid():
+                self.expand(parent)
+                parent = parent.parent()
+            selection_model.setCurrentIndex(
+                index,
+                QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows,
+            )
+            self.scrollTo(index)
         finally:
             self.blockSignals(False)
 
     def section_info(self, key: tuple[str, int] | None) -> tuple[Zone, Section] | None:
-        if key is None:
-            return None
-        return self._section_data.get(key)
+        return self._tree_model.section_info(key)
 
 
 class SectionDetailsWidget(QWidget):
@@ -926,6 +1464,9 @@ class SectionDetailsWidget(QWidget):
         self._cells_label = QLabel()
         self._points_label = QLabel()
         self._range_label = QLabel()
+        # 拾取或跳转到的单元
+        self._element_label = QLabel()
+        self._nodes_label = QLabel()
         self._transparency_slider = QSlider(Qt.Horizontal)
         self._transparency_slider.setRange(0, 100)
         self._transparency_slider.setSingleStep(5)
@@ -950,6 +1491,8 @@ class SectionDetailsWidget(QWidget):
             self._cells_label,
             self._points_label,
             self._range_label,
+            self._element_label,
+            self._nodes_label,
         ):
             label.setTextInteractionFlags(Qt.TextSelectableByMouse)
 
@@ -959,12 +1502,15 @@ class SectionDetailsWidget(QWidget):
         layout.addRow(self.tr("Cells"), self._cells_label)
         layout.addRow(self.tr("Points"), self._points_label)
         layout.addRow(self.tr("Range"), self._range_label)
+        layout.addRow(self.tr("Element"), self._element_label)
+        layout.addRow(self.tr("Nodes"), self._nodes_label)
         layout.addRow(self.tr("Transparency"), controls)
 
         self.clear()
 
     def clear(self) -> None:
         self._set_text("-", "-", "-", "-", "-", "-")
+        self._clear_cell()
         self._current_key = None
         self._set_transparency_value(0.0)
         self._transparency_slider.setEnabled(False)
@@ -1001,11 +1547,29 @@ class SectionDetailsWidget(QWidget):
             str(point_count),
             f"{section.range[0]} - {section.range[1]}",
         )
+        self._clear_cell()
         self._current_key = key
         value = 0.0 if transparency is None else float(max(0.0, min(1.0, transparency)))
         self._set_transparency_value(value)
         self._transparency_slider.setEnabled(key is not None)
 
+    def show_cell(self, pick: CellPick) -> None:
+        """Show the element id, node ids and node coordinates of a picked cell."""
+
+        self._element_label.setText(
+            self.tr("{element} (cell {cell})").format(element=pick.element_id, cell=pick.cell + 1)
+        )
+        self._nodes_label.setText(
+            "\n".join(
+                f"{node}: ({x:.6g}, {y:.6g}, {z:.6g})"
+                for node, (x, y, z) in zip(pick.node_ids, pick.coordinates)
+            )
+        )
+
+    def _clear_cell(self) -> None:
+        self._element_label.setText("-")
+        self._nodes_label.setText("-")
+
     def _set_text(
         self,
         zone: str,
@@ -1032,6 +1596,8 @@ class SectionDetailsWidget(QWidget):
             "cells": self._cells_label.text(),
             "points": self._points_label.text(),
             "range": self._range_label.text(),
+            "element": self._element_label.text(),
+            "nodes": self._nodes_label.text(),
             "transparency": self._transparency_label.text(),
         }
 
@@ -0,0 +1,224 @@
+"""Tree backends used by :class:`~cgns_gui.loader.CgnsLoader`.
+
+A backend opens a CGNS file and exposes it as a CGNS/Python tree
+(``[name, value, children, type]``).  The pyCGNS backend reads the whole file
+through ``CGNS.MAP``; the h5py backend walks the HDF5 layout directly, only
+visits the nodes the viewer needs and leaves large arrays as unread
+``h5py.Dataset`` handles that :func:`read_into` copies into preallocated
+buffers with hyperslab reads.  Those handles can also be turned into
+:class:`DatasetRef` locations that are reopened later, which is how skeleton
+loads defer array reads until a section is first used.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+import h5py
+import numpy as np
+
+try:
+    from CGNS import MAP as cgnsmap
+except ImportError:  # pragma: no cover - depends on the conda environment
+    cgnsmap = None
+
+# Elements read per hyperslab when copying a dataset into a buffer
+READ_CHUNK_SIZE = 1 << 22
+
+# Arrays with more entries than this stay on disk until they are read
+_LAZY_ARRAY_THRESHOLD = 64
+
+_LAZY_LABELS = {"DataArray_t", "IndexArray_t"}
+
+# Child labels visited at each depth of the h5py walk; deeper levels are read whole
+_ROOT_LABELS = {"CGNSBase_t", "Base_t"}
+_BASE_LABELS = {"Family_t", "Zone_t"}
+_ZONE_LABELS = {"GridCoordinates_t", "Elements_t", "ZoneBC_t"}
+
+
+class TreeBackend(Protocol):
+    """Interface shared by the loader backends."""
+
+    name: str
+
+    def open(self, path: Path) -> AbstractContextManager[list]:
+        """Context manager yielding the CGNS/Python tree of ``path``."""
+
+
+class PyCgnsBackend:
+    """Load the complete tree with ``CGNS.MAP.load``."""
+
+    name = "pycgns"
+
+    @contextmanager
+    def open(self, path: Path) -> Iterator[list]:
+        if cgnsmap is None:
+            msg = (
+                "pyCGNS is required for CGNS file loading. "
+                "Please install it using: conda install -c conda-forge pycgns"
+            )
+            raise ImportError(msg)
+        # Returns: (tree, links, paths)
+        tree, _, _ = cgnsmap.load(str(path))
+        yield tree
+
+
+class H5pyBackend:
+    """Walk the CGNS/HDF5 layout and read only the viewer's nodes.
+
+    GridCoordinates_t, Elements_t, ZoneBC_t and Family_t subtrees are
+    visited; FlowSolution_t and other zone children are never opened.
+    """
+
+    name = "h5py"
+
+    @contextmanager
+    def open(self, path: Path) -> Iterator[list]:
+        with h5py.File(path, "r") as handle:
+            children = self._children(handle, _ROOT_LABELS)
+            yield ["CGNSTree", None, children, "CGNSTree_t"]
+
+    def _children(self, group: h5py.Group, labels: set[str] | None) -> list[list]:
+        nodes: list[list] = []
+        for key, child in group.items():
+            if key.startswith(" "):
+                continue
+            if isinstance(child, h5py.Dataset):
+                # Bare datasets are accepted as DataArray_t leaves
+                if labels is None:
+                    nodes.append([key, self._value(child, "DataArray_t", ""), [], "DataArray_t"])
+                continue
+            label = _attr_text(child.attrs.get("label"))
+            if labels is not None and label not in labels:
+                continue
+            nodes.append(self._node(key, child, label))
+        return nodes
+
+    def _node(self, key: str, group: h5py.Group, label: str) -> list:
+        if label in _ROOT_LABELS:
+            child_labels: set[str] | None = _BASE_LABELS
+        elif label == "Zone_t":
+            child_labels = _ZONE_LABELS
+        else:
+            child_labels = None
+        value = None
+        data = group.get(" data")
+        if isinstance(data, h5py.Dataset):
+            value = self._value(data, label, _attr_text(group.attrs.get("type")))
+        return [key, value, self._children(group, child_labels), label]
+
+    @staticmethod
+    def _value(dataset: h5py.Dataset, label: str, data_type: str) -> np.ndarray | h5py.Dataset:
+        if label in _LAZY_LABELS and dataset.size > _LAZY_ARRAY_THRESHOLD:
+            return dataset
+        array = dataset[()]
+        if data_type == "C1":
+            array = np.asarray(array, dtype=np.int8).view("S1")
+        # Match pyCGNS, which exposes HDF5 arrays with Fortran dimension order
+        return np.asarray(array).T if np.ndim(array) > 1 else np.asarray(array)
+
+
+_BACKENDS: dict[str, type] = {
+    PyCgnsBackend.name: PyCgnsBackend,
+    H5pyBackend.name: H5pyBackend,
+}
+
+
+def get_backend(backend: str | TreeBackend) -> TreeBackend:
+    """Resolve a backend name (``"pycgns"`` or ``"h5py"``) to an instance."""
+
+    if not isinstance(backend, str):
+        return backend
+    try:
+        return _BACKENDS[backend]()
+    except KeyError:
+        msg = f"Unknown CGNS loader backend: {backend}"
+        raise ValueError(msg) from None
+
+
+def available_backends() -> list[str]:
+    return list(_BACKENDS)
+
+
+def backend_for_file(path: str | Path) -> str:
+    """Pick ``"h5py"`` for CGNS/HDF5 files and ``"pycgns"`` for anything else (ADF)."""
+
+    try:
+        return H5pyBackend.name if h5py.is_hdf5(str(path)) else PyCgnsBackend.name
+    except OSError:
+        return PyCgnsBackend.name
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetRef:
+    """Location of an unread HDF5 dataset, reopened when it is needed."""
+
+    filename: str
+    name: str
+
+
+def dataset_ref(value: object) -> DatasetRef | None:
+    """Return a :class:`DatasetRef` for an unread dataset, ``None`` otherwise."""
+
+    if isinstance(value, h5py.Dataset):
+        return DatasetRef(filename=value.file.filename, name=value.name)
+    return None
+
+
+@contextmanager
+def open_datasets(refs: Sequence[DatasetRef]) -> Iterator[list[h5py.Dataset]]:
+    """Open the file of ``refs`` once and yield their datasets in order."""
+
+    filenames = {ref.filename for ref in refs}
+    if len(filenames) != 1:
+        raise ValueError("Dataset references must point into a single file")
+    with h5py.File(filenames.pop(), "r") as handle:
+        yield [handle[ref.name] for ref in refs]
+
+
+def read_into(
+    value: np.ndarray | h5py.Dataset,
+    out: np.ndarray,
+    column: int | None = None,
+    check: Callable[[], None] | None = None,
+) -> None:
+    """Copy a node value into ``out`` (or into ``out[:, column]``).
+
+    In-memory arrays are assigned with NumPy; 1-D datasets are read in
+    hyperslabs of :data:`READ_CHUNK_SIZE` elements, straight into ``out`` when
+    the dtypes match and through one reused scratch buffer otherwise (HDF5's
+    own type conversion and strided memory selections are much slower).
+    ``check`` is called before every hyperslab and may raise to abort the read.
+    """
+
+    target = out if column is None else out[:, column]
+    if not isinstance(value, h5py.Dataset) or value.ndim != 1:
+        if isinstance(value, h5py.Dataset):
+            value = value[()].T
+        target[...] = np.asarray(value).reshape(-1)
+        return
+    size = value.shape[0]
+    direct = column is None and value.dtype == out.dtype
+    scratch = None if direct else np.empty(min(size, READ_CHUNK_SIZE), dtype=value.dtype)
+    for start in range(0, size, READ_CHUNK_SIZE):
+        if check is not None:
+            check()
+        stop = min(start + READ_CHUNK_SIZE, size)
+        if scratch is None:
+            value.read_direct(out, np.s_[start:stop], np.s_[start:stop])
+            continue
+        chunk = scratch[: stop - start]
+        value.read_direct(chunk, np.s_[start:stop])
+        target[start:stop] = chunk
+
+
+def _attr_text(value: object) -> str:
+    if isinstance(value, np.ndarray):
+        value = value.tobytes()
+    if isinstance(value, bytes):
+        value = value.split(b"\x00", 1)[0].decode("utf-8", errors="ignore")
+    return str(value).strip() if value is not None else ""
@@ -0,0 +1,308 @@
+"""Persistent on-disk cache of parsed :class:`~cgns_gui.model.CgnsModel` objects.
+
+Each entry is a directory holding a JSON manifest (names, element types,
+ranges, boundary and family metadata) and one ``.npy`` file per array.  The
+arrays are memory-mapped when an entry is read back, so reopening an
+unchanged case skips parsing and boundary matching entirely.
+
+Entries are keyed by a file fingerprint: resolved path, size, modification
+time and a BLAKE2b hash of sampled file content.  The cache is size-capped and
+evicts the least recently used entries first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .model import BoundaryInfo, CgnsModel, FamilyInfo, MeshData, Section, Zone, is_deferred
+
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_BYTES = 4 << 30
+
+# Environment variables enabling the cache for the GUI
+CACHE_DIR_ENV = "CGNS_GUI_CACHE_DIR"
+CACHE_MAX_MB_ENV = "CGNS_GUI_CACHE_MAX_MB"
+
+# Content sampled for the fingerprint: head, tail and evenly spaced blocks
+_SAMPLE_BLOCK = 1 << 16
+_SAMPLE_EDGE = 1 << 20
+_SAMPLE_COUNT = 16
+
+_MANIFEST = "manifest.json"
+
+# Elements of a deferred array copied into its .npy file at a time
+_WRITE_BLOCK = 1 << 22
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEntry:
+    """One cached model as reported by :meth:`ModelCache.entries`."""
+
+    key: str
+    source: str
+    size_bytes: int
+    last_access: float
+
+
+class ModelCache:
+    """Size-capped LRU cache of parsed models in ``directory``."""
+
+    def __init__(self, directory: str | Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+
+    @classmethod
+    def from_env(cls, environ: dict[str, str] | None = None) -> ModelCache | None:
+        """Build the cache configured by ``CGNS_GUI_CACHE_DIR``, or ``None``."""
+
+        environ = os.environ if environ is None else environ
+        directory = environ.get(CACHE_DIR_ENV)
+        if not directory:
+            return None
+        max_mb = environ.get(CACHE_MAX_MB_ENV)
+        max_bytes = int(float(max_mb) * (1 << 20)) if max_mb else DEFAULT_MAX_BYTES
+        return cls(directory, max_bytes=max_bytes)
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def fingerprint(self, path: str | Path, variant: str = "") -> str:
+        """Key for ``path`` in its current state; ``variant`` separates loader options."""
+
+        path = Path(path).resolve()
+        stat = path.stat()
+        digest = hashlib.blake2b(digest_size=20)
+        header = f"{CACHE_FORMAT_VERSION}|{path}|{stat.st_size}|{stat.st_mtime_ns}|{variant}"
+        digest.update(header.encode())
+        with path.open("rb") as handle:
+            for offset in _sample_offsets(stat.st_size):
+                handle.seek(offset)
+                digest.update(handle.read(_SAMPLE_BLOCK))
+        return digest.hexdigest()
+
+    def get(self, path: str | Path, variant: str = "") -> CgnsModel | None:
+        """Return the cached model of ``path`` with memory-mapped arrays, if any."""
+
+        entry = self._directory / self.fingerprint(path, variant)
+        manifest_path = entry / _MANIFEST
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if manifest.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        try:
+            model = _model_from_manifest(entry, manifest)
+        except (OSError, ValueError, KeyError):
+            # A damaged entry is dropped and the file parsed again
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+        # The manifest's mtime records the last access for LRU eviction
+        os.utime(manifest_path)
+        return model
+
+    def put(self, path: str | Path, model: CgnsModel, variant: str = "") -> None:
+        """Store ``model`` for ``path``, then evict.
+
+        Deferred arrays are streamed into the entry in blocks of rows and
+        stay deferred in ``model``.
+        """
+
+        key = self.fingerprint(path, variant)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self._directory))
+        try:
+            manifest = _write_model(staging, model)
+            manifest["source"] = str(Path(path).resolve())
+            (staging / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+            target = self._directory / key
+            shutil.rmtree(target, ignore_errors=True)
+            os.replace(staging, target)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        self.evict()
+
+    def entries(self) -> list[CacheEntry]:
+        """Cached models, most recently used first."""
+
+        entries: list[CacheEntry] = []
+        if not self._directory.is_dir():
+            return entries
+        for entry in self._directory.iterdir():
+            manifest_path = entry / _MANIFEST
+            if entry.name.startswith(".") or not manifest_path.is_file():
+                continue
+            try:
+                source = json.loads(manifest_path.read_text(encoding="utf-8")).get("source", "")
+            except (OSError, ValueError):
+                source = ""
+            entries.append(
+                CacheEntry(
+                    key=entry.name,
+                    source=source,
+                    size_bytes=_directory_size(entry),
+                    last_access=manifest_path.stat().st_mtime,
+                )
+            )
+        entries.sort(key=lambda item: item.last_access, reverse=True)
+        return entries
+
+    def total_size(self) -> int:
+        return sum(entry.size_bytes for entry in self.entries())
+
+    def evict(self, max_bytes: int | None = None) -> list[str]:
+        """Drop least recently used entries until the cache fits; return their keys."""
+
+        limit = self._max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(entry.size_bytes for entry in entries)
+        removed: list[str] = []
+        while entries and total > limit:
+            entry = entries.pop()
+            shutil.rmtree(self._directory / entry.key, ignore_errors=True)
+            total -= entry.size_bytes
+            removed.append(entry.key)
+        return removed
+
+    def remove(self, path: str | Path, variant: str = "") -> bool:
+        entry = self._directory / self.fingerprint(path, variant)
+        if not entry.is_dir():
+            return False
+        shutil.rmtree(entry, ignore_errors=True)
+        return True
+
+    def clear(self) -> None:
+        if not self._directory.is_dir():
+            return
+        for entry in self._directory.iterdir():
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+
+
+def _sample_offsets(size: int) -> list[int]:
+    if size <= 2 * _SAMPLE_EDGE:
+        return list(range(0, size, _SAMPLE_BLOCK))
+    offsets = list(range(0, _SAMPLE_EDGE, _SAMPLE_BLOCK))
+    step = (size - 2 * _SAMPLE_EDGE) // (_SAMPLE_COUNT + 1)
+    offsets.extend(_SAMPLE_EDGE + step * index for index in range(1, _SAMPLE_COUNT + 1))
+    offsets.extend(range(size - _SAMPLE_EDGE, size, _SAMPLE_BLOCK))
+    return offsets
+
+
+def _directory_size(directory: Path) -> int:
+    return sum(item.stat().st_size for item in directory.iterdir() if item.is_file())
+
+
+def _write_model(directory: Path, model: CgnsModel) -> dict:
+    # Sections of a zone share one coordinate array; write it once
+    arrays: dict[int, str] = {}
+
+    def save(array: object, stem: str) -> str:
+        name = arrays.get(id(array))
+        if name is None:
+            name = f"{stem}.npy"
+            _save_array(directory / name, array)
+            arrays[id(array)] = name
+        return name
+
+    zones = []
+    for zone_index, zone in enumerate(model.zones):
+        sections = []
+        for section in zone.sections:
+            mesh = section.mesh
+            stem = f"z{zone_index}_s{section.id}"
+            boundary = section.boundary
+            sections.append(
+                {
+                    "id": section.id,
+                    "name": section.name,
+                    "element_type": section.element_type,
+                    "range": [int(value) for value in section.range],
+                    "cell_type": mesh.cell_type,
+                    "points": save(mesh.points, f"z{zone_index}_points_{len(arrays)}"),
+                    "connectivity": save(mesh.connectivity, f"{stem}_connectivity"),
+                    "node_ids": (
+                        None if mesh.node_ids is None else save(mesh.node_ids, f"{stem}_node_ids")
+                    ),
+                    "boundary": None
+                    if boundary is None
+                    else {
+                        "name": boundary.name,
+                        "grid_location": boundary.grid_location,
+                        "family": boundary.family,
+                    },
+                }
+            )
+        zones.append({"name": zone.name, "vertex_count": zone.vertex_count, "sections": sections})
+    families = {
+        key: {"name": family.name, "bc_type": family.bc_type}
+        for key, family in model.families.items()
+    }
+    return {"version": CACHE_FORMAT_VERSION, "zones": zones, "families": families}
+
+
+def _save_array(path: Path, array: object) -> None:
+    if not is_deferred(array):
+        np.save(path, np.asarray(array))
+        return
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=array.dtype, shape=array.shape)
+    step = max(_WRITE_BLOCK // max(int(np.prod(array.shape[1:])), 1), 1)
+    for start in range(0, array.shape[0], step):
+        out[start : start + step] = array.read_rows(start, start + step)
+    out.flush()
+    del out
+
+
+def _model_from_manifest(directory: Path, manifest: dict) -> CgnsModel:
+    arrays: dict[str, np.ndarray] = {}
+
+    def load(name: str) -> np.ndarray:
+        if name not in arrays:
+            arrays[name] = np.load(directory / name, mmap_mode="r")
+        return arrays[name]
+
+    zones = []
+    for zone_data in manifest["zones"]:
+        sections = []
+        for data in zone_data["sections"]:
+            node_ids = data["node_ids"]
+            boundary = data["boundary"]
+            sections.append(
+                Section(
+                    id=data["id"],
+                    name=data["name"],
+                    element_type=data["element_type"],
+                    range=tuple(data["range"]),
+                    mesh=MeshData(
+                        points=load(data["points"]),
+                        connectivity=load(data["connectivity"]),
+                        cell_type=data["cell_type"],
+                        node_ids=None if node_ids is None else load(node_ids),
+                    ),
+                    boundary=None if boundary is None else BoundaryInfo(**boundary),
+                )
+            )
+        zones.append(
+            Zone(
+                name=zone_data["name"],
+                sections=sections,
+                vertex_count=zone_data["vertex_count"],
+            )
+        )
+    families = {key: FamilyInfo(**value) for key, value in manifest["families"].items()}
+    return CgnsModel(zones=zones, families=families)
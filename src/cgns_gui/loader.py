@@ -1,21 +1,29 @@
-"""CGNS file loader built on pyCGNS."""
+"""CGNS file loader built on pyCGNS or h5py."""
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, ExitStack, nullcontext
+from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
 
-try:
-    from CGNS import MAP as cgnsmap
-except ImportError as e:
-    msg = (
-        "pyCGNS is required for CGNS file loading. "
-        "Please install it using: conda install -c conda-forge pycgns"
-    )
-    raise ImportError(msg) from e
-
-from .model import BoundaryInfo, CgnsModel, FamilyInfo, MeshData, Section, Zone
+from .backends import TreeBackend, dataset_ref, get_backend, open_datasets, read_into
+from .cache import ModelCache
+from .model import (
+    BoundaryInfo,
+    CgnsModel,
+    FamilyInfo,
+    LazyArray,
+    MeshData,
+    Section,
+    Zone,
+    compact_mesh,
+)
+from .profiling import PHASE_BC_MATCH, PHASE_PARSE, PHASE_RESHAPE, PhaseTimer
 
 # CGNS element type codes (pyCGNS values)
 # Reference: CGNS/SIDS Element Type definitions
@@ -51,49 +59,237 @@ _ELEMENT_TYPE_BY_NAME: dict[str, str] = {
 }
 
 
+class LoadCancelled(Exception):
+    """Raised inside a load when its :class:`CancelToken` has been cancelled."""
+
+
+class CancelToken:
+    """Thread-safe flag checked by :class:`CgnsLoader` at its checkpoints.
+
+    Checkpoints sit between zones, between sections and between the
+    hyperslabs of every array read, so a cancelled load stops after at most
+    one :data:`~cgns_gui.backends.READ_CHUNK_SIZE` read.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise LoadCancelled
+
+
+@dataclass(frozen=True, slots=True)
+class LoadProgress:
+    """A zone yielded by :meth:`CgnsLoader.iter_zones`.
+
+    ``bytes_read`` counts the in-memory mesh arrays of the zones yielded so
+    far; deferred (lazy) arrays are not included until they are read.
+    ``families`` holds the families read up to this zone.
+    """
+
+    zone: Zone
+    index: int
+    total: int
+    bytes_read: int
+    families: dict[str, FamilyInfo]
+
+
 class CgnsLoader:
-    """Parse CGNS files using pyCGNS library.
+    """Parse CGNS files into a :class:`CgnsModel`.
     
     This loader handles CGNS/Python tree structure: [name, value, children, type]
     where:
         - name: string node name
-        - value: numpy array or None
+        - value: numpy array, unread h5py dataset or None
         - children: list of child nodes
         - type: CGNS node type string (e.g., 'Zone_t', 'Elements_t')
+
+    The tree comes from a backend (see :mod:`cgns_gui.backends`): ``"pycgns"``
+    reads the whole file with pyCGNS, ``"h5py"`` walks the HDF5 layout and
+    reads only coordinates, elements, ZoneBC and families.
+
+    With ``compact_boundaries=True`` every boundary section keeps only the
+    zone points its faces reference (see :func:`~cgns_gui.model.compact_mesh`).
+
+    With ``lazy=True`` only the skeleton is read: names, element types,
+    ranges, counts and boundary metadata.  Coordinates and connectivity that
+    the backend left on disk become :class:`~cgns_gui.model.LazyArray`
+    placeholders that reopen the file the first time they are used (one
+    shared placeholder per zone for the points).  Arrays the backend already
+    read, e.g. everything from pyCGNS, are used as they are.  Boundary
+    compaction needs the connectivity and is skipped for deferred sections.
+
+    With a :class:`~cgns_gui.cache.ModelCache` an unchanged file is served
+    from the cache with memory-mapped arrays; a parsed file is stored in it
+    (which reads any deferred arrays).
+
+    ``workers`` sets how many zones are decoded concurrently (coordinate
+    stacking, connectivity conversion and BC matching).  Zones keep their
+    file order in the model whatever the pool size.
+
+    A ``cancel_token`` makes the load cooperative: once it is cancelled the
+    next checkpoint raises :class:`LoadCancelled`.  The pyCGNS backend parses
+    the whole file in one call, so its loads stop only after that parse.
+
+    A ``phase_timer`` receives the time spent parsing the tree, reshaping
+    arrays (including deferred ones, whenever they are read) and matching
+    boundary conditions.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        backend: str | TreeBackend = "pycgns",
+        compact_boundaries: bool = False,
+        lazy: bool = False,
+        cache: ModelCache | None = None,
+        workers: int = 1,
+        cancel_token: CancelToken | None = None,
+        phase_timer: PhaseTimer | None = None,
+    ) -> None:
         self._path: Path | None = None
         self._tree: list | None = None
+        self._backend = get_backend(backend)
+        self._compact_boundaries = compact_boundaries
+        self._lazy = lazy
+        self._cache = cache
+        self._workers = max(1, int(workers))
+        self._cancel_token = cancel_token
+        self._phase_timer = phase_timer
+
+    @property
+    def backend_name(self) -> str:
+        return self._backend.name
 
     def load(self, path: str | Path) -> CgnsModel:
         """Load a CGNS file and return a CgnsModel."""
+        zones: list[Zone] = []
+        families: dict[str, FamilyInfo] = {}
+        for progress in self.iter_zones(path, families):
+            zones.append(progress.zone)
+        return CgnsModel(zones=zones, families=families)
+
+    def iter_zones(
+        self,
+        path: str | Path,
+        families: dict[str, FamilyInfo] | None = None,
+    ) -> Iterator[LoadProgress]:
+        """Yield each zone of ``path`` as soon as it has been read.
+
+        Zones come in file order.  ``families`` (if given) is filled in place
+        as bases are read, so it is complete once the iteration ends, even for
+        files without zones.  The model is stored in the cache only when the
+        iteration runs to the end.
+        """
         path = Path(path)
         if not path.exists():
             msg = f"CGNS file not found: {path}"
             raise FileNotFoundError(msg)
         self._path = path
+        if families is None:
+            families = {}
 
-        # Load CGNS tree using pyCGNS
-        # Returns: (tree, links, paths)
-        self._tree, _, _ = cgnsmap.load(str(path))
+        # Loader options that change the parsed model get separate cache entries
+        variant = f"compact={int(self._compact_boundaries)},lazy={int(self._lazy)}"
+        if self._cache is not None:
+            with self._timed(PHASE_PARSE):
+                cached = self._cache.get(path, variant)
+            if cached is not None:
+                families.update(cached.families)
+                yield from self._progress(cached.zones, len(cached.zones), families)
+                return
 
         zones: list[Zone] = []
-        families: dict[str, FamilyInfo] = {}
-        
-        # Find all Base nodes
-        for base in self._get_children_by_type(self._tree, ['CGNSBase_t', 'Base_t']):
-            # Collect families from this base
-            base_families = self._read_families(base)
-            families.update(base_families)
-            
-            # Find all Zone nodes in this base
-            for zone_node in self._get_children_by_type(base, 'Zone_t'):
-                zone = self._read_zone(zone_node, base)
-                if zone:
-                    zones.append(zone)
-        
-        return CgnsModel(zones=zones, families=families)
+
+        # The backend keeps the file open while unread arrays are copied out
+        with ExitStack() as stack:
+            with self._timed(PHASE_PARSE):
+                tree = stack.enter_context(self._backend.open(path))
+            self._checkpoint()
+            self._tree = tree
+            bases = self._get_children_by_type(tree, ['CGNSBase_t', 'Base_t'])
+            total = sum(len(self._get_children_by_type(base, 'Zone_t')) for base in bases)
+            for base in bases:
+                with self._timed(PHASE_PARSE):
+                    # Collect families from this base
+                    base_families = self._read_families(base)
+                    families.update(base_families)
+
+                    # Family names used by BC matching are shared by every zone
+                    bc_families = self._collect_families(base)
+
+                # Find all Zone nodes in this base
+                zone_nodes = self._get_children_by_type(base, 'Zone_t')
+                decoded = (
+                    zone for zone in self._map_zones(zone_nodes, base, bc_families) if zone
+                )
+                for progress in self._progress(decoded, total, families, start=len(zones)):
+                    zones.append(progress.zone)
+                    yield progress
+
+        if self._cache is not None:
+            self._cache.put(path, CgnsModel(zones=zones, families=dict(families)), variant)
+
+    @staticmethod
+    def _progress(
+        zones: Iterable[Zone],
+        total: int,
+        families: dict[str, FamilyInfo],
+        *,
+        start: int = 0,
+    ) -> Iterator[LoadProgress]:
+        bytes_read = 0
+        for index, zone in enumerate(zones, start=start):
+            bytes_read += zone.loaded_bytes
+            yield LoadProgress(
+                zone=zone,
+                index=index,
+                total=total,
+                bytes_read=bytes_read,
+                families=dict(families),
+            )
+
+    def _map_zones(
+        self,
+        zone_nodes: list[list],
+        base_node: list,
+        families: dict[str, str],
+    ) -> Iterator[Zone | None]:
+        """Read zones on the worker pool; results come back in ``zone_nodes`` order."""
+        def read(zone_node: list) -> Zone | None:
+            self._checkpoint()
+            return self._read_zone(zone_node, base_node, families)
+
+        workers = min(self._workers, len(zone_nodes))
+        if workers <= 1:
+            for zone_node in zone_nodes:
+                yield read(zone_node)
+            return
+        # Threads rather than processes: zones share the in-memory tree and the
+        # open file, and the NumPy/HDF5 copies release the GIL
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cgns-zone")
+        try:
+            yield from pool.map(read, zone_nodes)
+        finally:
+            # On cancellation (or an abandoned iteration) drop the queued zones
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _checkpoint(self) -> None:
+        if self._cancel_token is not None:
+            self._cancel_token.raise_if_cancelled()
+
+    def _timed(self, phase: str) -> AbstractContextManager[None]:
+        if self._phase_timer is None:
+            return nullcontext()
+        return self._phase_timer.phase(phase)
 
     def _get_children_by_type(self, parent: list, node_types: str | list[str]) -> list[list]:
         """Get all child nodes of given type(s) from parent node.
@@ -119,7 +315,12 @@ class CgnsLoader:
                 return child
         return None
 
-    def _read_zone(self, zone_node: list, base_node: list) -> Zone | None:
+    def _read_zone(
+        self,
+        zone_node: list,
+        base_node: list,
+        families: dict[str, str] | None = None,
+    ) -> Zone | None:
         """Read a Zone node and return a Zone object."""
         zone_name = zone_node[0]
         sections: list[Section] = []
@@ -135,6 +336,7 @@ class CgnsLoader:
             self._get_children_by_type(zone_node, 'Elements_t'),
             start=1,
         ):
+            self._checkpoint()
             section = self._read_section(elem_node, points, section_idx)
             if section:
                 sections.append(section)
@@ -144,15 +346,23 @@ class CgnsLoader:
                     section_lookup.setdefault(key, []).append(section)
         
         # Attach boundary condition metadata
-        self._attach_boundary_metadata(zone_node, base_node, section_lookup)
+        with self._timed(PHASE_BC_MATCH):
+            self._attach_boundary_metadata(zone_node, base_node, section_lookup, families)
+
+        # Optionally shrink boundary sections to the points they reference
+        if self._compact_boundaries:
+            with self._timed(PHASE_RESHAPE):
+                for section in sections:
+                    if section.boundary is not None and section.mesh.is_loaded:
+                        section.mesh = compact_mesh(section.mesh)
         
         # Renumber section IDs
         for new_id, section in enumerate(sections, start=1):
             section.id = new_id
         
-        return Zone(name=zone_name, sections=sections)
+        return Zone(name=zone_name, sections=sections, vertex_count=points.shape[0])
 
-    def _read_coordinates(self, zone_node: list) -> np.ndarray | None:
+    def _read_coordinates(self, zone_node: list) -> np.ndarray | LazyArray | None:
         """Read grid coordinates from GridCoordinates_t node."""
         # Find GridCoordinates node
         grid_coords_nodes = self._get_children_by_type(zone_node, 'GridCoordinates_t')
@@ -162,7 +372,7 @@ class CgnsLoader:
         grid_coords = grid_coords_nodes[0]  # Use first GridCoordinates node
         
         # Read X, Y, Z coordinates
-        coord_arrays = []
+        coord_values = []
         for axis in ('X', 'Y', 'Z'):
             coord_node = self._get_child_by_name(grid_coords, f'Coordinate{axis}')
             if coord_node is None:
@@ -172,12 +382,29 @@ class CgnsLoader:
             coord_data = coord_node[1]
             if coord_data is None:
                 raise ValueError(f"Coordinate{axis} has no data")
-            
-            coord_arrays.append(np.asarray(coord_data, dtype=float).reshape(-1))
-        
-        return np.column_stack(coord_arrays)
+            coord_values.append(coord_data)
 
-    def _read_section(self, elem_node: list, points: np.ndarray, section_id: int) -> Section | None:
+        sizes = {int(value.size) for value in coord_values}
+        if len(sizes) != 1:
+            raise ValueError(f"Coordinate arrays differ in length in zone {zone_node[0]}")
+
+        count = sizes.pop()
+        return self._read_array(
+            coord_values,
+            (count, 3),
+            np.float64,
+            lambda values: _fill_points(values, count, self._checkpoint),
+            lambda values, start, stop: np.column_stack(
+                [value[start:stop] for value in values]
+            ),
+        )
+
+    def _read_section(
+        self,
+        elem_node: list,
+        points: np.ndarray | LazyArray,
+        section_id: int,
+    ) -> Section | None:
         """Read an Elements_t node and return a Section object."""
         section_name = elem_node[0]
         
@@ -203,20 +430,26 @@ class CgnsLoader:
         if conn_node is None or conn_node[1] is None:
             return None
         
-        connectivity_raw = np.asarray(conn_node[1], dtype=np.int64)
-        
         # Get element size
         element_size = _SUPPORTED_ELEMENT_SIZES[element_type]
         
         # Reshape connectivity
-        if connectivity_raw.size % element_size != 0:
+        connectivity_size = int(conn_node[1].size)
+        if connectivity_size % element_size != 0:
             # Cannot reshape, skip this section
             return None
         
-        connectivity_raw = connectivity_raw.reshape(-1, element_size)
-        
-        # CGNS uses 1-based indexing, convert to 0-based for VTK
-        connectivity = connectivity_raw - 1
+        shape = (connectivity_size // element_size, element_size)
+        connectivity = self._read_array(
+            [conn_node[1]],
+            shape,
+            np.int64,
+            lambda values: _fill_connectivity(values[0], shape, self._checkpoint),
+            lambda values, start, stop: (
+                values[0][start * element_size : stop * element_size].reshape(-1, element_size)
+                - 1
+            ),
+        )
         
         # Get element range
         range_node = self._get_child_by_name(elem_node, 'ElementRange')
@@ -243,11 +476,44 @@ class CgnsLoader:
             mesh=mesh,
         )
 
+    def _read_array(
+        self,
+        values: list,
+        shape: tuple[int, ...],
+        dtype: type,
+        fill: Callable[[Sequence], np.ndarray],
+        rows: Callable[[Sequence, int, int], np.ndarray],
+    ) -> np.ndarray | LazyArray:
+        """Fill an array from node values now, or defer it in lazy mode.
+
+        ``rows(datasets, start, stop)`` reads a range of rows of a deferred
+        array with hyperslab reads.
+        """
+        refs = [dataset_ref(value) for value in values]
+        if not self._lazy or any(ref is None for ref in refs):
+            with self._timed(PHASE_RESHAPE):
+                return fill(values)
+
+        def load() -> np.ndarray:
+            # Reopen by path: the backend's file handle is closed by then
+            with open_datasets(refs) as datasets, self._timed(PHASE_RESHAPE):
+                return fill(datasets)
+
+        def load_rows(start: int, stop: int) -> np.ndarray:
+            with open_datasets(refs) as datasets:
+                if any(dataset.ndim != 1 for dataset in datasets):
+                    # Multi-dimensional layouts are only read whole, as in read_into
+                    return fill(datasets)[start:stop]
+                return rows(datasets, start, stop)
+
+        return LazyArray(shape, dtype, load, load_rows)
+
     def _attach_boundary_metadata(
         self,
         zone_node: list,
         base_node: list,
         section_lookup: dict[str, list[Section]],
+        families: dict[str, str] | None = None,
     ) -> None:
         """Attach boundary condition metadata to sections."""
         # Find ZoneBC node
@@ -257,8 +523,9 @@ class CgnsLoader:
         
         zonebc = zonebc_nodes[0]
         
-        # Collect family names from base
-        families = self._collect_families(base_node)
+        # Collect family names from base unless the caller already did
+        if families is None:
+            families = self._collect_families(base_node)
         
         # Process each BC_t node
         for bc_node in self._get_children_by_type(zonebc, 'BC_t'):
@@ -317,11 +584,7 @@ class CgnsLoader:
         
         value = grid_loc_node[1]
         if isinstance(value, np.ndarray) and value.size > 0:
-            # Handle both string and bytes
-            loc = value.flat[0]
-            if isinstance(loc, bytes):
-                return loc.decode('utf-8', errors='ignore').strip()
-            return str(loc).strip()
+            return self._decode_text(value)
         return None
 
     def _read_family_name(self, bc_node: list, families: dict[str, str]) -> str | None:
@@ -331,12 +594,7 @@ class CgnsLoader:
             value = family_node[1]
             if isinstance(value, np.ndarray) and value.size > 0:
                 # Decode family name
-                if value.dtype.kind in ('S', 'a'):  # bytes
-                    family_name = b''.join(value.flat).decode('utf-8', errors='ignore').strip()
-                elif value.dtype.kind == 'U':  # unicode
-                    family_name = ''.join(value.flat).strip()
-                else:
-                    family_name = str(value.flat[0]).strip()
+                family_name = self._decode_text(value)
                 
                 clean = self._clean_name(family_name)
                 if clean:
@@ -384,11 +642,7 @@ class CgnsLoader:
                 if bc_node[1] is not None and isinstance(bc_node[1], np.ndarray):
                     bc_value = bc_node[1]
                     if bc_value.size > 0:
-                        raw = bc_value.flat[0]
-                        if isinstance(raw, bytes):
-                            bc_type = raw.decode('utf-8', errors='ignore').strip()
-                        else:
-                            bc_type = str(raw).strip()
+                        bc_type = self._decode_text(bc_value)
             
             families[display_name] = FamilyInfo(name=display_name, bc_type=bc_type)
         
@@ -425,6 +679,18 @@ class CgnsLoader:
         
         return None
 
+    @staticmethod
+    def _decode_text(value: np.ndarray) -> str:
+        """Decode a CGNS character array (``C1`` data) into a string."""
+        if value.dtype.kind in ('S', 'a'):  # bytes
+            # pyCGNS returns C1 data as an array of single characters
+            return b''.join(value.flat).decode('utf-8', errors='ignore').strip()
+        if value.dtype.kind == 'U':  # unicode
+            return ''.join(value.flat).strip()
+        if value.dtype.kind in ('i', 'u') and value.dtype.itemsize == 1:
+            return value.tobytes().split(b'\x00', 1)[0].decode('utf-8', errors='ignore').strip()
+        return str(value.flat[0]).strip()
+
     @staticmethod
     def _clean_name(value: str | bytes | None) -> str:
         """Clean and normalize a name string."""
@@ -442,3 +708,23 @@ class CgnsLoader:
         """Normalize a name for use as a lookup key."""
         clean = CgnsLoader._clean_name(name)
         return clean.upper() if clean else ""
+
+
+def _fill_points(values: Sequence, count: int, check: Callable[[], None]) -> np.ndarray:
+    """Fill one preallocated (N, 3) buffer column by column."""
+    points = np.empty((count, 3), dtype=float)
+    for column, value in enumerate(values):
+        read_into(value, points, column, check)
+    return points
+
+
+def _fill_connectivity(
+    value: object,
+    shape: tuple[int, int],
+    check: Callable[[], None],
+) -> np.ndarray:
+    connectivity = np.empty(shape, dtype=np.int64)
+    read_into(value, connectivity.reshape(-1), check=check)
+    # CGNS uses 1-based indexing, convert to 0-based for VTK
+    connectivity -= 1
+    return connectivity
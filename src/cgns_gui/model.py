@@ -2,11 +2,137 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import sys
+import threading
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 
 import numpy as np
 
+VOLUME_ELEMENT_TYPES = frozenset({"TETRA_4", "PYRA_5", "PENTA_6", "HEXA_8"})
+
+
+class LazyArray:
+    """Array placeholder whose payload is read the first time it is used.
+
+    ``shape``, ``dtype``, ``ndim``, ``size`` and ``nbytes`` are available
+    without loading, so tree and details views can show counts; any NumPy
+    operation (``np.asarray``, indexing, ``reshape``) loads and caches the data.
+    ``rows(start, stop)``, if given, reads a range of rows on its own;
+    :meth:`read_rows` uses it to look at part of an array that stays deferred.
+    """
+
+    __slots__ = ("shape", "dtype", "_loader", "_rows", "_value", "_lock")
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        dtype: np.dtype | type,
+        loader: Callable[[], np.ndarray],
+        rows: Callable[[int, int], np.ndarray] | None = None,
+    ) -> None:
+        self.shape = tuple(int(extent) for extent in shape)
+        self.dtype = np.dtype(dtype)
+        self._loader: Callable[[], np.ndarray] | None = loader
+        self._rows = rows
+        self._value: np.ndarray | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.dtype.itemsize
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._value is not None
+
+    def materialize(self) -> np.ndarray:
+        """Load (once) and return the underlying array."""
+
+        if self._value is None:
+            with self._lock:
+                if self._value is None:
+                    value = np.asarray(self._loader(), dtype=self.dtype)
+                    if value.shape != self.shape:
+                        msg = f"lazy array loaded shape {value.shape}, expected {self.shape}"
+                        raise ValueError(msg)
+                    self._value = value
+                    self._loader = None
+                    self._rows = None
+        return self._value
+
+    def read_rows(self, start: int, stop: int) -> np.ndarray:
+        """Rows ``start:stop``, read without loading the rest when possible.
+
+        The rows are not kept; without a row reader the whole array is loaded.
+        """
+
+        start, stop, _ = slice(start, stop).indices(self.shape[0])
+        rows = self._rows
+        if self._value is not None or rows is None:
+            return self.materialize()[start:stop]
+        value = np.asarray(rows(start, max(start, stop)), dtype=self.dtype)
+        expected = (max(stop - start, 0), *self.shape[1:])
+        if value.shape != expected:
+            msg = f"lazy array read rows of shape {value.shape}, expected {expected}"
+            raise ValueError(msg)
+        return value
+
+    def take(self, rows: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Rows at the indices ``rows``, read one contiguous run at a time when deferred."""
+
+        rows = np.asarray(rows, dtype=np.int64).reshape(-1)
+        if self._value is not None or self._rows is None:
+            return self.materialize()[rows]
+        if rows.size == 0:
+            return np.empty((0, *self.shape[1:]), dtype=self.dtype)
+        unique, inverse = np.unique(rows, return_inverse=True)
+        runs = np.split(unique, np.flatnonzero(np.diff(unique) != 1) + 1)
+        blocks = [self.read_rows(int(run[0]), int(run[-1]) + 1) for run in runs]
+        return np.concatenate(blocks)[inverse]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:  # noqa: ANN001
+        array = self.materialize()
+        if dtype is not None and np.dtype(dtype) != array.dtype:
+            return array.astype(dtype)
+        return array.copy() if copy else array
+
+    def __getitem__(self, index):  # noqa: ANN001, ANN204
+        return self.materialize()[index]
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def reshape(self, *shape: int) -> np.ndarray:
+        return self.materialize().reshape(*shape)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "deferred"
+        return f"LazyArray(shape={self.shape}, dtype={self.dtype}, {state})"
+
+
+def is_deferred(array: np.ndarray | LazyArray) -> bool:
+    """Whether ``array`` is a :class:`LazyArray` that has not been read yet."""
+
+    return isinstance(array, LazyArray) and not array.is_loaded
+
+
+def take_rows(array: np.ndarray | LazyArray, rows: Iterable[int] | np.ndarray) -> np.ndarray:
+    """Rows ``rows`` of ``array``; a deferred :class:`LazyArray` reads only those rows."""
+
+    if isinstance(array, LazyArray):
+        return array.take(rows)
+    return np.asarray(array)[np.asarray(rows, dtype=np.int64)]
+
 
 @dataclass(slots=True)
 class FamilyInfo:
@@ -29,9 +155,10 @@ class BoundaryInfo:
 class MeshData:
     """Point and connectivity information for a mesh fragment."""
 
-    points: np.ndarray
-    connectivity: np.ndarray
+    points: np.ndarray | LazyArray
+    connectivity: np.ndarray | LazyArray
     cell_type: str
+    node_ids: np.ndarray | None = None  # 局部点 -> Zone 点（0 基）映射，压缩后才有
 
     def __post_init__(self) -> None:
         if self.points.ndim != 2 or self.points.shape[1] != 3:
@@ -43,6 +170,327 @@ class MeshData:
         if not isinstance(self.cell_type, str):
             msg = "cell_type must be a string"
             raise TypeError(msg)
+        if self.node_ids is not None and self.node_ids.shape != (self.points.shape[0],):
+            msg = "node_ids must map every local point"
+            raise ValueError(msg)
+
+    @property
+    def is_compact(self) -> bool:
+        return self.node_ids is not None
+
+    @property
+    def is_loaded(self) -> bool:
+        return not (is_deferred(self.points) or is_deferred(self.connectivity))
+
+    def load(self) -> None:
+        """Read any deferred point or connectivity payload."""
+
+        for array in (self.points, self.connectivity):
+            if isinstance(array, LazyArray):
+                array.materialize()
+
+    def to_global(self, local_ids: np.ndarray | int) -> np.ndarray:
+        """Map local point indices to zero-based zone point indices."""
+
+        local = np.asarray(local_ids)
+        if self.node_ids is None:
+            return local
+        return self.node_ids[local]
+
+    def to_local(self, global_ids: np.ndarray | int) -> np.ndarray:
+        """Map zone point indices to local indices; ``-1`` marks unused points."""
+
+        global_ = np.asarray(global_ids)
+        if self.node_ids is None:
+            return global_
+        if self.node_ids.size == 0:
+            return np.full(global_.shape, -1, dtype=np.intp)
+        # node_ids 由 np.unique 生成，天然有序
+        position = np.searchsorted(self.node_ids, global_)
+        position = np.minimum(position, self.node_ids.size - 1)
+        return np.where(self.node_ids[position] == global_, position, -1)
+
+    def bounds(self) -> tuple[float, float, float, float, float, float] | None:
+        """Axis-aligned bounds of the points referenced by the connectivity."""
+
+        if self.connectivity.size == 0 or self.points.shape[0] == 0:
+            return None
+        points = np.asarray(self.points)
+        # Fall back to the whole point set while connectivity is still on disk
+        if not is_deferred(self.connectivity):
+            connectivity = np.asarray(self.connectivity).reshape(-1)
+            if connectivity.size < points.shape[0]:
+                # Small sections of a large shared point set: gather only their points
+                points = points[connectivity]
+            else:
+                used = np.zeros(points.shape[0], dtype=bool)
+                used[connectivity] = True
+                if not used.all():
+                    points = points[used]
+        lower = points.min(axis=0)
+        upper = points.max(axis=0)
+        return (
+            float(lower[0]),
+            float(upper[0]),
+            float(lower[1]),
+            float(upper[1]),
+            float(lower[2]),
+            float(upper[2]),
+        )
+
+
+def compact_mesh(mesh: MeshData) -> MeshData:
+    """Return a copy of ``mesh`` holding only the points its cells reference.
+
+    Connectivity is renumbered to the local point set and ``node_ids`` keeps
+    the local-to-zone mapping so original CGNS node ids remain available.
+    """
+
+    if mesh.node_ids is not None:
+        return mesh
+    node_ids, inverse = np.unique(mesh.connectivity, return_inverse=True)
+    return MeshData(
+        points=mesh.points[node_ids],
+        connectivity=inverse.reshape(mesh.connectivity.shape),
+        cell_type=mesh.cell_type,
+        node_ids=node_ids,
+    )
+
+
+# Faces of the linear volume cells (0-based CGNS node order), normals pointing outwards
+_CELL_FACES: dict[str, tuple[tuple[int, ...], ...]] = {
+    "TETRA_4": ((0, 2, 1), (0, 1, 3), (1, 2, 3), (2, 0, 3)),
+    "PYRA_5": ((0, 3, 2, 1), (0, 1, 4), (1, 2, 4), (2, 3, 4), (3, 0, 4)),
+    "PENTA_6": ((0, 1, 4, 3), (1, 2, 5, 4), (2, 0, 3, 5), (0, 2, 1), (3, 4, 5)),
+    "HEXA_8": (
+        (0, 3, 2, 1),
+        (0, 1, 5, 4),
+        (1, 2, 6, 5),
+        (2, 3, 7, 6),
+        (0, 4, 7, 3),
+        (4, 5, 6, 7),
+    ),
+}
+
+# Odd 64-bit multiplier used to hash sorted face node tuples
+_FACE_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+# Compare-exchange networks sorting the nodes of triangles and quads
+_SORTING_NETWORKS = {
+    3: ((0, 1), (1, 2), (0, 1)),
+    4: ((0, 1), (2, 3), (0, 2), (1, 3), (1, 2)),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ExternalFaces:
+    """Faces bounding a volume section, in the numbering of its connectivity.
+
+    Each face keeps the node order of its cell, so normals point outwards,
+    and ``*_cells`` gives the row of the cell it belongs to.
+    """
+
+    triangles: np.ndarray
+    triangle_cells: np.ndarray
+    quads: np.ndarray
+    quad_cells: np.ndarray
+
+    @property
+    def face_count(self) -> int:
+        return int(self.triangles.shape[0] + self.quads.shape[0])
+
+
+def external_faces(mesh: MeshData) -> ExternalFaces:
+    """Return the faces of ``mesh`` that belong to exactly one of its cells.
+
+    Works on TETRA_4, PYRA_5, PENTA_6 and HEXA_8 connectivity with NumPy
+    alone, so it can also run in worker processes.  Faces are matched by
+    their sorted node tuples, hashed to 64 bits and sorted once; equal
+    neighbours are interior.  Faces come out ordered by cell, then by their
+    position in the cell.
+    """
+
+    face_table = _CELL_FACES.get(mesh.cell_type)
+    if face_table is None:
+        msg = f"No faces defined for cell type: {mesh.cell_type}"
+        raise ValueError(msg)
+    connectivity = np.asarray(mesh.connectivity)
+    if connectivity.size and int(connectivity.max()) < 2**31:
+        # Halves the memory traffic of every step below
+        connectivity = connectivity.astype(np.int32, copy=False)
+    cell_count = max(connectivity.shape[0], 1)
+    result: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    for size in (3, 4):
+        local = [face for face in face_table if len(face) == size]
+        if not local:
+            result[size] = (
+                np.empty((0, size), dtype=connectivity.dtype),
+                np.empty(0, dtype=np.intp),
+            )
+            continue
+        # One array per face node; faces are stacked face-major (all first faces, ...)
+        columns = [
+            np.concatenate([connectivity[:, face[slot]] for face in local])
+            for slot in range(size)
+        ]
+        exterior = np.flatnonzero(_unmatched_faces(columns))
+        position, cells = np.divmod(exterior, cell_count)
+        order = np.lexsort((position, cells))
+        exterior = exterior[order]
+        result[size] = (np.column_stack([column[exterior] for column in columns]), cells[order])
+    triangles, triangle_cells = result[3]
+    quads, quad_cells = result[4]
+    return ExternalFaces(
+        triangles=triangles,
+        triangle_cells=triangle_cells,
+        quads=quads,
+        quad_cells=quad_cells,
+    )
+
+
+def _unmatched_faces(columns: list[np.ndarray]) -> np.ndarray:
+    """Mask of the faces (given node by node) whose node set occurs only once."""
+
+    count = columns[0].shape[0]
+    if count == 0:
+        return np.zeros(0, dtype=bool)
+    nodes = list(columns)
+    for first, second in _SORTING_NETWORKS[len(nodes)]:
+        low = np.minimum(nodes[first], nodes[second])
+        nodes[second] = np.maximum(nodes[first], nodes[second])
+        nodes[first] = low
+    nodes = [column.astype(np.uint64) for column in nodes]
+    words = nodes
+    if int(nodes[-1].max()) < 2**32:
+        # Pairs of sorted node ids packed in 64-bit words still identify a face exactly
+        words = [
+            (nodes[index] << np.uint64(32)) | nodes[index + 1]
+            if index + 1 < len(nodes)
+            else nodes[index]
+            for index in range(0, len(nodes), 2)
+        ]
+    digest = words[0].copy()
+    for word in words[1:]:
+        digest *= _FACE_HASH_MULTIPLIER
+        digest ^= word
+    digest *= _FACE_HASH_MULTIPLIER
+    # The well-mixed high bits of the hash sit above the face index, so a plain
+    # sort (much faster than argsort) yields both the order and the positions
+    shift = np.uint64(max(int(count - 1).bit_length(), 1))
+    index_mask = (np.uint64(1) << shift) - np.uint64(1)
+    keys = np.sort((digest & ~index_mask) | np.arange(count, dtype=np.uint64))
+    order = keys & index_mask
+    prefix = keys >> shift
+    candidates = np.flatnonzero(prefix[1:] == prefix[:-1])
+    first, second = order[candidates], order[candidates + 1]
+    equal = np.ones(candidates.size, dtype=bool)
+    for word in words:
+        equal &= word[first] == word[second]
+    matched = np.zeros(count, dtype=bool)
+    matched[first[equal]] = True
+    matched[second[equal]] = True
+    if not equal.all():
+        # Distinct faces sharing a hash may separate equal ones: redo those exactly
+        collided = np.unique(prefix[candidates[~equal]])
+        starts = np.searchsorted(prefix, collided, side="left")
+        stops = np.searchsorted(prefix, collided, side="right")
+        rows = order[np.concatenate([np.arange(a, b) for a, b in zip(starts, stops, strict=True)])]
+        subset = np.column_stack([word[rows] for word in words])
+        exact = np.lexsort(subset.T[::-1])
+        same = np.all(subset[exact[1:]] == subset[exact[:-1]], axis=1)
+        resolved = np.zeros(rows.size, dtype=bool)
+        resolved[:-1] |= same
+        resolved[1:] |= same
+        matched[rows[exact]] = resolved
+    return ~matched
+
+
+def section_edges(
+    mesh: MeshData,
+    *,
+    feature_angle: float | None = None,
+    faces: ExternalFaces | None = None,
+) -> np.ndarray:
+    """Return the edges drawn for a section as unique sorted ``(E, 2)`` node pairs.
+
+    Each edge of a surface cell is listed once, however many cells share it.
+    Volume cells are represented by their external faces; pass ``faces`` to
+    reuse ones already computed.  With ``feature_angle`` (degrees) only
+    boundary edges, non-manifold edges and edges whose two faces' normals
+    differ by more than the angle are kept.  Line cells are returned as they are.
+    """
+
+    if mesh.cell_type == "BAR_2":
+        connectivity = np.asarray(mesh.connectivity)
+        pairs, _, _ = _unique_pairs(connectivity.min(axis=1), connectivity.max(axis=1))
+        return pairs
+    if mesh.cell_type in VOLUME_ELEMENT_TYPES:
+        if faces is None:
+            faces = external_faces(mesh)
+        polygons = [faces.triangles, faces.quads]
+    else:
+        polygons = [np.asarray(mesh.connectivity)]
+    polygons = [block for block in polygons if block.shape[0]]
+    if not polygons:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Edge i of a polygon joins its nodes i and i + 1; edges are listed polygon by polygon
+    first = np.concatenate([block.reshape(-1) for block in polygons])
+    second = np.concatenate([np.roll(block, -1, axis=1).reshape(-1) for block in polygons])
+    pairs, inverse, counts = _unique_pairs(np.minimum(first, second), np.maximum(first, second))
+    if feature_angle is None:
+        return pairs
+
+    points = np.asarray(mesh.points)
+    normals = np.concatenate([_unit_normals(points, block) for block in polygons])
+    owners = np.concatenate(
+        [np.repeat(np.arange(block.shape[0]), block.shape[1]) for block in polygons]
+    )
+    offsets = np.cumsum([0] + [block.shape[0] for block in polygons[:-1]])
+    owners += np.repeat(offsets, [block.size for block in polygons])
+    # Occurrences grouped by edge: the two faces of a manifold edge are adjacent
+    order = np.argsort(inverse, kind="stable")
+    starts = np.cumsum(counts) - counts
+    feature = counts != 2
+    manifold = np.flatnonzero(~feature)
+    left = normals[owners[order[starts[manifold]]]]
+    right = normals[owners[order[starts[manifold] + 1]]]
+    cosine = np.einsum("ij,ij->i", left, right)
+    feature[manifold] = cosine < np.cos(np.radians(feature_angle))
+    return pairs[feature]
+
+
+def _unique_pairs(
+    low: np.ndarray,
+    high: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Unique ``(low, high)`` rows with the inverse mapping and occurrence counts."""
+
+    low = low.astype(np.int64, copy=False)
+    high = high.astype(np.int64, copy=False)
+    if high.size and int(high.max()) >= 2**32:
+        pairs, inverse, counts = np.unique(
+            np.column_stack([low, high]),
+            axis=0,
+            return_inverse=True,
+            return_counts=True,
+        )
+        return pairs, inverse.reshape(-1), counts
+    keys, inverse, counts = np.unique(
+        (low << 32) | high,
+        return_inverse=True,
+        return_counts=True,
+    )
+    return np.column_stack([keys >> 32, keys & 0xFFFFFFFF]), inverse.reshape(-1), counts
+
+
+def _unit_normals(points: np.ndarray, polygons: np.ndarray) -> np.ndarray:
+    """Newell normals of ``(N, K)`` polygons, scaled to unit length."""
+
+    corners = points[polygons]
+    normals = np.cross(corners, np.roll(corners, -1, axis=1)).sum(axis=1)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    return normals / np.maximum(lengths, np.finfo(float).tiny)
 
 
 @dataclass(slots=True)
@@ -63,6 +511,7 @@ class Zone:
 
     name: str
     sections: list[Section] = field(default_factory=list)
+    vertex_count: int = 0  # Zone 的点数；为 0 时按 sections 推算
 
     @property
     def total_cells(self) -> int:
@@ -70,10 +519,26 @@ class Zone:
 
     @property
     def total_points(self) -> int:
+        if self.vertex_count:
+            return self.vertex_count
         if not self.sections:
             return 0
         return int(max(section.mesh.points.shape[0] for section in self.sections))
 
+    @property
+    def loaded_bytes(self) -> int:
+        """Bytes of mesh arrays held in memory (shared coordinates counted once)."""
+        seen: set[int] = set()
+        total = 0
+        for section in self.sections:
+            mesh = section.mesh
+            for array in (mesh.points, mesh.connectivity, mesh.node_ids):
+                if array is None or is_deferred(array) or id(array) in seen:
+                    continue
+                seen.add(id(array))
+                total += int(array.nbytes)
+        return total
+
     def iter_sections(self) -> Iterable[Section]:
         return iter(self.sections)
 
@@ -84,18 +549,253 @@ class Zone:
         return (section for section in self.sections if section.boundary is not None)
 
 
+SectionKey = tuple[str, int]
+
+
+@dataclass(frozen=True, slots=True)
+class IndexMemoryReport:
+    """Approximate bytes held by the lookup indexes of a :class:`CgnsModel`.
+
+    Counts the dictionaries, lists and key tuples of the indexes, not the
+    zones and sections they point to.
+    """
+
+    sections: int = 0
+    families: int = 0
+    element_types: int = 0
+    zones: int = 0
+    element_ids: int = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return (
+            self.sections + self.families + self.element_types + self.zones + self.element_ids
+        )
+
+
+class ElementRangeIndex:
+    """Sorted CGNS element ranges of one zone's sections.
+
+    CGNS numbers the elements of a zone across its sections
+    (``Section.range``); this maps a global element id back to its section
+    and to the row of the section's connectivity.  Ranges of a valid zone do
+    not overlap.  A section covers at most as many ids as it has cells.
+    """
+
+    __slots__ = ("starts", "stops", "section_ids", "_start_list")
+
+    def __init__(self, sections: Iterable[Section]) -> None:
+        ranges = sorted(
+            (
+                int(section.range[0]),
+                int(section.range[0])
+                + min(
+                    int(section.range[1]) - int(section.range[0]) + 1,
+                    int(section.mesh.connectivity.shape[0]),
+                ),
+                section.id,
+            )
+            for section in sections
+        )
+        columns = np.array(ranges, dtype=np.int64).reshape(-1, 3)
+        self.starts = columns[:, 0]
+        # One past the last element id of each section
+        self.stops = columns[:, 1]
+        self.section_ids = columns[:, 2]
+        self._start_list = self.starts.tolist()
+
+    def __len__(self) -> int:
+        return len(self._start_list)
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.starts.nbytes
+            + self.stops.nbytes
+            + self.section_ids.nbytes
+            + sys.getsizeof(self._start_list)
+        )
+
+    def locate(self, element_id: int) -> tuple[int, int] | None:
+        """``(section_id, cell)`` of ``element_id``, ``None`` outside every range."""
+
+        position = bisect_right(self._start_list, element_id) - 1
+        if position < 0 or element_id >= self.stops[position]:
+            return None
+        return int(self.section_ids[position]), int(element_id - self._start_list[position])
+
+    def locate_many(self, element_ids: np.ndarray | Iterable[int]) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized :meth:`locate`: section ids and cells, ``-1`` where not found."""
+
+        ids = np.asarray(element_ids, dtype=np.int64)
+        if not len(self):
+            missing = np.full(ids.shape, -1, dtype=np.int64)
+            return missing, missing.copy()
+        positions = np.searchsorted(self.starts, ids, side="right") - 1
+        clipped = np.maximum(positions, 0)
+        found = (positions >= 0) & (ids < self.stops[clipped])
+        section_ids = np.where(found, self.section_ids[clipped], -1)
+        cells = np.where(found, ids - self.starts[clipped], -1)
+        return section_ids, cells
+
+
+class _ModelIndex:
+    """Lookups over the zones of a model, extended zone by zone."""
+
+    __slots__ = (
+        "zone_count",
+        "last_zone",
+        "zones",
+        "sections",
+        "families",
+        "element_types",
+        "element_ranges",
+    )
+
+    def __init__(self) -> None:
+        # Number of entries of CgnsModel.zones indexed so far, and the last of them
+        self.zone_count = 0
+        self.last_zone: Zone | None = None
+        self.zones: dict[str, Zone] = {}
+        self.sections: dict[SectionKey, Section] = {}
+        self.families: dict[str, list[SectionKey]] = {}
+        self.element_types: dict[str, list[SectionKey]] = {}
+        # Zone name -> its element-id ranges, built on first use
+        self.element_ranges: dict[str, ElementRangeIndex] = {}
+
+    def add(self, zone: Zone) -> None:
+        self.zone_count += 1
+        self.last_zone = zone
+        self.zones[zone.name] = zone
+        self.element_ranges.pop(zone.name, None)
+        for section in zone.sections:
+            key = (zone.name, section.id)
+            self.sections[key] = section
+            self.element_types.setdefault(section.element_type, []).append(key)
+            if section.boundary is not None and section.boundary.family:
+                self.families.setdefault(section.boundary.family, []).append(key)
+
+    def memory(self) -> IndexMemoryReport:
+        def lists(index: dict[str, list[SectionKey]]) -> int:
+            return sys.getsizeof(index) + sum(
+                sys.getsizeof(name) + sys.getsizeof(keys) for name, keys in index.items()
+            )
+
+        # The key tuples are shared by every index; count them with the sections
+        return IndexMemoryReport(
+            sections=sys.getsizeof(self.sections)
+            + sum(sys.getsizeof(key) for key in self.sections),
+            families=lists(self.families),
+            element_types=lists(self.element_types),
+            zones=sys.getsizeof(self.zones),
+            element_ids=sys.getsizeof(self.element_ranges)
+            + sum(ranges.nbytes for ranges in self.element_ranges.values()),
+        )
+
+
 @dataclass(slots=True)
 class CgnsModel:
-    """Root container for a CGNS dataset."""
+    """Root container for a CGNS dataset.
+
+    The model indexes its sections by key, family, element type and zone
+    name, so lookups take constant time; the element-id ranges of a zone
+    (:class:`ElementRangeIndex`) are indexed the first time they are used.
+    Zones should be added with :meth:`add_zone`; zones appended to
+    :attr:`zones` directly are indexed on the next lookup, and the indexes
+    are rebuilt if the list was replaced or shortened.
+    """
 
     zones: list[Zone] = field(default_factory=list)
     families: dict[str, FamilyInfo] = field(default_factory=dict)  # Family name -> FamilyInfo
+    _index: _ModelIndex = field(
+        default_factory=_ModelIndex, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._synced_index()
+
+    def add_zone(self, zone: Zone) -> None:
+        """Append ``zone`` and index its sections; a zone already in the model is ignored."""
+
+        index = self._synced_index()
+        if index.zones.get(zone.name) is zone:
+            return
+        self.zones.append(zone)
+        index.add(zone)
+
+    def zone(self, name: str) -> Zone | None:
+        return self._synced_index().zones.get(name)
+
+    def section(self, key: SectionKey) -> Section | None:
+        return self._synced_index().sections.get(key)
+
+    def section_info(self, key: SectionKey | None) -> tuple[Zone, Section] | None:
+        """The zone and section of ``key``, ``None`` for an unknown key."""
+
+        if key is None:
+            return None
+        index = self._synced_index()
+        section = index.sections.get(key)
+        if section is None:
+            return None
+        return index.zones[key[0]], section
 
     def find_section(self, zone_name: str, section_id: int) -> Section | None:
-        for zone in self.zones:
-            if zone.name != zone_name:
-                continue
-            for section in zone.sections:
-                if section.id == section_id:
-                    return section
-        return None
+        return self.section((zone_name, section_id))
+
+    def family_section_keys(self, family: str) -> list[SectionKey]:
+        """Keys of the BC sections that refer to ``family``, in load order."""
+
+        return list(self._synced_index().families.get(family, ()))
+
+    def element_type_section_keys(self, element_type: str) -> list[SectionKey]:
+        """Keys of the sections of ``element_type``, in load order."""
+
+        return list(self._synced_index().element_types.get(element_type, ()))
+
+    def element_ranges(self, zone_name: str) -> ElementRangeIndex | None:
+        """Element-id index of a zone, built the first time it is asked for."""
+
+        index = self._synced_index()
+        ranges = index.element_ranges.get(zone_name)
+        if ranges is None:
+            zone = index.zones.get(zone_name)
+            if zone is None:
+                return None
+            ranges = index.element_ranges[zone_name] = ElementRangeIndex(zone.sections)
+        return ranges
+
+    def locate_element(self, zone_name: str, element_id: int) -> tuple[SectionKey, int] | None:
+        """Section key and connectivity row of a zone's global element id."""
+
+        ranges = self.element_ranges(zone_name)
+        location = None if ranges is None else ranges.locate(element_id)
+        if location is None:
+            return None
+        section_id, cell = location
+        return (zone_name, section_id), cell
+
+    def locate_elements(
+        self,
+        zone_name: str,
+        element_ids: np.ndarray | Iterable[int],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Section ids and connectivity rows of many element ids, ``-1`` where unknown."""
+
+        ranges = self.element_ranges(zone_name)
+        if ranges is None:
+            ranges = ElementRangeIndex(())
+        return ranges.locate_many(element_ids)
+
+    def index_memory(self) -> IndexMemoryReport:
+        return self._synced_index().memory()
+
+    def _synced_index(self) -> _ModelIndex:
+        index = self._index
+        count = index.zone_count
+        # The indexed zones must still be the first ones of the list
+        if count > len(self.zones) or (count and self.zones[count - 1] is not index.last_zone):
+            index = self._index = _ModelIndex()
+        for zone in self.zones[index.zone_count :]:
+            index.add(zone)
+        return index
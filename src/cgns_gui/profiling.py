@@ -0,0 +1,189 @@
+"""Timing instrumentation for loading and rendering.
+
+:class:`PhaseTimer` adds up the time spent in the named phases of a load
+(:data:`LOAD_PHASES`); :class:`CgnsLoader <cgns_gui.loader.CgnsLoader>`
+reports into one, and the GUI adds the scene and tree phases.
+:class:`PerformanceMonitor` keeps the recent frame samples and loads, formats
+them for the viewer's overlay and exports them as JSON lines.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+PHASE_PARSE = "parse"
+PHASE_RESHAPE = "reshape"
+PHASE_BC_MATCH = "bc_match"
+PHASE_VTK_BUILD = "vtk_build"
+PHASE_TREE_POPULATE = "tree_populate"
+
+LOAD_PHASES = (
+    PHASE_PARSE,
+    PHASE_RESHAPE,
+    PHASE_BC_MATCH,
+    PHASE_VTK_BUILD,
+    PHASE_TREE_POPULATE,
+)
+
+# Frame samples kept by a PerformanceMonitor
+DEFAULT_HISTORY = 1000
+
+
+class PhaseTimer:
+    """Thread-safe totals of the time spent in named phases.
+
+    Zones decoded on several threads add their times up, so the totals can
+    exceed the wall-clock time of the load.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._seconds: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._seconds[name] = self._seconds.get(name, 0.0) + seconds
+
+    def totals(self) -> dict[str, float]:
+        """Seconds per phase, the :data:`LOAD_PHASES` first and in order."""
+
+        with self._lock:
+            seconds = dict(self._seconds)
+        totals = {name: seconds.pop(name, 0.0) for name in LOAD_PHASES}
+        totals.update(sorted(seconds.items()))
+        return totals
+
+
+@dataclass(frozen=True, slots=True)
+class FrameSample:
+    """What one rendered frame cost and drew."""
+
+    frame_seconds: float
+    actors: int
+    cells: int
+    # Scene work that built or swapped VTK data since the previous frame
+    pipeline_seconds: float
+    # Latency of the last pick, if any pick happened yet
+    pick_seconds: float | None = None
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass(slots=True)
+class LoadRecord:
+    """Phase timings of one file load."""
+
+    path: str
+    timer: PhaseTimer
+    started: float = field(default_factory=time.perf_counter)
+    wall_seconds: float | None = None
+    # Bytes held by the model's lookup indexes once loaded
+    index_bytes: int | None = None
+    # Replaced by another load before it finished
+    cancelled: bool = False
+    timestamp: float = field(default_factory=time.time)
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "type": "load",
+            "timestamp": self.timestamp,
+            "path": self.path,
+            "wall_seconds": self.wall_seconds,
+            "index_bytes": self.index_bytes,
+            "cancelled": self.cancelled,
+            "phases": self.timer.totals(),
+        }
+
+
+class PerformanceMonitor:
+    """Recent frame samples and file loads of a viewer session."""
+
+    def __init__(self, *, history: int = DEFAULT_HISTORY) -> None:
+        self._frames: deque[FrameSample] = deque(maxlen=history)
+        self._loads: list[LoadRecord] = []
+
+    @property
+    def last_frame(self) -> FrameSample | None:
+        return self._frames[-1] if self._frames else None
+
+    @property
+    def last_load(self) -> LoadRecord | None:
+        return self._loads[-1] if self._loads else None
+
+    def begin_load(self, path: str | Path) -> PhaseTimer:
+        """Start recording a load; report its phases into the returned timer."""
+
+        record = LoadRecord(path=str(path), timer=PhaseTimer())
+        self._loads.append(record)
+        return record.timer
+
+    def end_load(
+        self,
+        timer: PhaseTimer,
+        *,
+        index_bytes: int | None = None,
+        cancelled: bool = False,
+    ) -> None:
+        for record in reversed(self._loads):
+            if record.timer is timer:
+                record.wall_seconds = time.perf_counter() - record.started
+                record.index_bytes = index_bytes
+                record.cancelled = cancelled
+                return
+
+    def record_frame(self, sample: FrameSample) -> None:
+        self._frames.append(sample)
+
+    def records(self) -> Iterator[dict[str, object]]:
+        for record in self._loads:
+            yield record.as_dict()
+        for sample in self._frames:
+            yield {"type": "frame", **asdict(sample)}
+
+    def export_jsonl(self, path: str | Path) -> int:
+        """Write every record as one JSON object per line; return the count."""
+
+        count = 0
+        with Path(path).open("w", encoding="utf-8") as handle:
+            for record in self.records():
+                handle.write(json.dumps(record) + "\n")
+                count += 1
+        return count
+
+    def summary(self) -> str:
+        """Multi-line text for the overlay: last frame, then the last load."""
+
+        lines: list[str] = []
+        frame = self.last_frame
+        if frame is not None:
+            fps = 1.0 / frame.frame_seconds if frame.frame_seconds > 0 else 0.0
+            pick = "-" if frame.pick_seconds is None else f"{frame.pick_seconds * 1000:.1f} ms"
+            lines += [
+                f"Frame {frame.frame_seconds * 1000:.1f} ms ({fps:.0f} fps)",
+                f"Actors {frame.actors:,}  Cells {frame.cells:,}",
+                f"Pipeline {frame.pipeline_seconds * 1000:.1f} ms  Pick {pick}",
+            ]
+        load = self.last_load
+        if load is not None:
+            wall = "loading" if load.wall_seconds is None else f"{load.wall_seconds:.2f} s"
+            if load.cancelled:
+                wall += " (cancelled)"
+            lines.append(f"Load {Path(load.path).name}: {wall}")
+            lines += [f"  {name} {seconds:.2f} s" for name, seconds in load.timer.totals().items()]
+            if load.index_bytes is not None:
+                lines.append(f"  indexes {load.index_bytes / (1 << 20):.1f} MiB")
+        return "\n".join(lines)
@@ -0,0 +1,99 @@
+"""Coalesced rendering for the VTK view."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+# Minimum spacing between two scheduled renders (about 60 frames per second)
+DEFAULT_FRAME_INTERVAL_MS = 16
+
+
+@dataclass(frozen=True, slots=True)
+class RenderStats:
+    """Counters reported by :class:`RenderScheduler`."""
+
+    requested: int = 0
+    rendered: int = 0
+    # Requests served by a render that another request had already scheduled
+    coalesced: int = 0
+
+
+class RenderScheduler(QObject):
+    """Turn render requests into at most one render per frame.
+
+    :meth:`request` only marks the view dirty and arms a single-shot timer;
+    every request made before the timer fires is served by the same
+    ``Render()`` call.  Renders are spaced by at least ``frame_interval_ms``
+    so that bursts (streamed zones, bulk visibility changes) cannot keep the
+    event loop busy with back-to-back frames.
+    """
+
+    rendered = Signal()
+
+    def __init__(
+        self,
+        render_window,  # noqa: ANN001 - vtkRenderWindow or anything with Render()
+        parent: QObject | None = None,
+        *,
+        frame_interval_ms: int = DEFAULT_FRAME_INTERVAL_MS,
+    ) -> None:
+        super().__init__(parent)
+        self._render_window = render_window
+        self._frame_interval = frame_interval_ms / 1000.0
+        self._last_render = float("-inf")
+        self._requested = 0
+        self._served = 0
+        self._renders = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def pending(self) -> bool:
+        return self._requested > self._served
+
+    @property
+    def stats(self) -> RenderStats:
+        return RenderStats(
+            requested=self._requested,
+            rendered=self._renders,
+            coalesced=self._served - self._renders,
+        )
+
+    def reset_stats(self) -> None:
+        pending = self._requested - self._served
+        self._requested = pending
+        self._served = 0
+        self._renders = 0
+
+    def request(self) -> None:
+        """Schedule a render on a later event-loop iteration."""
+
+        self._requested += 1
+        if self._timer.isActive():
+            return
+        elapsed = time.perf_counter() - self._last_render
+        delay = max(self._frame_interval - elapsed, 0.0)
+        self._timer.start(round(delay * 1000))
+
+    def flush(self) -> None:
+        """Render now if a request is pending."""
+
+        self._timer.stop()
+        if not self.pending:
+            return
+        # Requests made during Render() (e.g. by observers) get the next frame
+        served = self._requested
+        self._render_window.Render()
+        self._last_render = time.perf_counter()
+        self._renders += 1
+        self._served = served
+        self.rendered.emit()
+
+    def cancel(self) -> None:
+        """Stop the timer of a pending render (e.g. when the view is closing)."""
+
+        self._timer.stop()
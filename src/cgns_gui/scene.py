@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
 from enum import Enum
+from functools import wraps
+from typing import Concatenate, ParamSpec, TypeVar
 
-from vtkmodules.util.numpy_support import numpy_to_vtk
-from vtkmodules.vtkCommonCore import vtkIdList, vtkPoints
+import numpy as np
+from vtkmodules.util.numpy_support import (
+    get_vtk_to_numpy_typemap,
+    numpy_to_vtk,
+)
+from vtkmodules.vtkCommonCore import (
+    VTK_ID_TYPE,
+    VTK_UNSIGNED_CHAR,
+    mutable,
+    vtkIdTypeArray,
+    vtkLookupTable,
+    vtkPoints,
+)
 from vtkmodules.vtkCommonDataModel import (
     VTK_HEXAHEDRON,
     VTK_LINE,
@@ -16,11 +31,36 @@ from vtkmodules.vtkCommonDataModel import (
     VTK_TRIANGLE,
     VTK_WEDGE,
     vtkCellArray,
+    vtkDataSet,
+    vtkGenericCell,
+    vtkPolyData,
+    vtkStaticCellLocator,
     vtkUnstructuredGrid,
 )
-from vtkmodules.vtkRenderingCore import vtkActor, vtkDataSetMapper, vtkRenderer
+from vtkmodules.vtkFiltersCore import vtkQuadricClustering
+from vtkmodules.vtkFiltersGeometry import vtkGeometryFilter
+from vtkmodules.vtkFiltersSources import vtkOutlineSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkDataSetMapper,
+    vtkMapper,
+    vtkPolyDataMapper,
+    vtkProperty,
+    vtkRenderer,
+)
 
-from .model import CgnsModel, MeshData, Section
+from .model import (
+    VOLUME_ELEMENT_TYPES,
+    CgnsModel,
+    LazyArray,
+    MeshData,
+    Section,
+    Zone,
+    external_faces,
+    section_edges,
+    take_rows,
+)
+from .surfaces import ORIGINAL_CELL_IDS, SurfaceCache, surface_bytes
 
 _ELEMENT_TYPE_TO_VTK = {
     "BAR_2": VTK_LINE,
@@ -32,136 +72,1004 @@ _ELEMENT_TYPE_TO_VTK = {
     "HEXA_8": VTK_HEXAHEDRON,
 }
 
+_VTK_ID_DTYPE = np.dtype(get_vtk_to_numpy_typemap()[VTK_ID_TYPE])
+
+# Cell-data array holding the batch-local section index of every cell
+SECTION_INDEX_ARRAY = "SectionIndex"
+
+# Angle between face normals above which an edge is drawn in feature-edge mode
+DEFAULT_FEATURE_ANGLE = 30.0
+
+# Actors drawing more cells than this get a decimated proxy during camera motion
+DEFAULT_LOD_CELLS = 20_000
+DEFAULT_LOD_BYTES = 128 << 20
+
+# Memory cap of the cached pick geometry of sections, see SceneManager.pick_cell
+DEFAULT_LOCATOR_BYTES = 256 << 20
+
+# Cells whose pick locators one pick_cell call may build on the calling thread;
+# the locators of further sections are built by the surface workers
+LOCATOR_SYNC_CELLS = 100_000
+
+Bounds = tuple[float, float, float, float, float, float]
+
+
+def _build_cell_array(connectivity: np.ndarray) -> vtkCellArray:
+    """Hand a fixed-size ``(M, K)`` connectivity block to VTK in one call.
+
+    The flattened connectivity and a computed offsets array are wrapped as
+    ``vtkIdTypeArray`` without copying when the input already has VTK's id
+    dtype and C layout; otherwise NumPy performs a single vectorised cast.
+    """
+
+    connectivity = np.ascontiguousarray(connectivity, dtype=_VTK_ID_DTYPE)
+    cell_count, nodes_per_cell = connectivity.shape
+    offsets = np.arange(
+        0,
+        (cell_count + 1) * nodes_per_cell,
+        nodes_per_cell,
+        dtype=_VTK_ID_DTYPE,
+    )
+    cell_array = vtkCellArray()
+    id_arrays = (_wrap_ids(offsets), _wrap_ids(connectivity.reshape(-1)))
+    cell_array.SetData(*id_arrays)
+    cell_array.id_arrays = id_arrays
+    return cell_array
+
+
+def _wrap_ids(values: np.ndarray) -> vtkIdTypeArray:
+    """Wrap a contiguous 1-D id array without copying it.
+
+    VTK only borrows ``values``; the returned wrapper holds the reference.
+    Unlike ``numpy_to_vtkIdTypeArray(deep=False)`` no temporary ``vtkBuffer``
+    wrapper is created: VTK keeps a list of Python wrappers released while
+    their object is still alive and scans it every time another one is
+    released, so one such wrapper per section made scene construction
+    quadratic.  Callers keep the wrappers they create for the same reason.
+    """
+
+    array = vtkIdTypeArray()
+    array.SetVoidArray(values, values.size, 1)
+    array.numpy_buffer = values
+    return array
+
+
+def _build_points(points: np.ndarray | LazyArray) -> tuple[vtkPoints, int]:
+    """Wrap an ``(N, 3)`` coordinate array as ``vtkPoints``.
+
+    Returns the points together with the number of bytes that had to be
+    copied; contiguous floating-point input is shared with VTK as-is.
+    """
+
+    points = np.asarray(points)
+    data = points
+    if data.dtype.kind != "f":
+        data = data.astype(np.float64)
+    data = np.ascontiguousarray(data)
+    copied = 0 if np.may_share_memory(data, points) else data.nbytes
+    vtk_points = vtkPoints()
+    vtk_points.SetData(numpy_to_vtk(data, deep=False))
+    return vtk_points, copied
+
+
+def _build_surface(mesh: MeshData) -> vtkPolyData:
+    """Exterior faces of a volume section as polydata with its own points.
+
+    Only the points on the faces are copied, so the surface reports the
+    section's bounds and no longer depends on the zone's coordinate array.
+    """
+
+    faces = external_faces(mesh)
+    sizes = np.repeat(
+        np.array([3, 4], dtype=_VTK_ID_DTYPE),
+        [faces.triangles.shape[0], faces.quads.shape[0]],
+    )
+    surface = _compact_polydata(
+        mesh.points,
+        sizes,
+        np.concatenate([faces.triangles.reshape(-1), faces.quads.reshape(-1)]),
+        lines=False,
+    )
+    cell_ids = _wrap_ids(
+        np.concatenate([faces.triangle_cells, faces.quad_cells]).astype(_VTK_ID_DTYPE)
+    )
+    cell_ids.SetName(ORIGINAL_CELL_IDS)
+    surface.GetCellData().AddArray(cell_ids)
+    surface.arrays += (cell_ids,)
+    # Edge modes derive the section's edges from the same faces
+    surface.faces = faces
+    return surface
+
+
+def _build_lines(points: np.ndarray | LazyArray, pairs: np.ndarray) -> vtkPolyData:
+    """``(E, 2)`` node pairs as line polydata holding only the points they use."""
+
+    sizes = np.full(pairs.shape[0], 2, dtype=_VTK_ID_DTYPE)
+    return _compact_polydata(points, sizes, pairs.reshape(-1), lines=True)
+
+
+def _build_locator(mesh: MeshData) -> vtkPolyData:
+    """Pickable geometry of a section with a static cell locator over it.
+
+    Volume sections are represented by their exterior faces, which map back
+    to cells through :data:`ORIGINAL_CELL_IDS`; the polydata cells of other
+    sections are their connectivity rows.  The locator is kept on
+    ``polydata.locator``.
+    """
+
+    if mesh.cell_type in VOLUME_ELEMENT_TYPES:
+        polydata = _build_surface(mesh)
+    else:
+        connectivity = np.asarray(mesh.connectivity)
+        sizes = np.full(connectivity.shape[0], connectivity.shape[1], dtype=_VTK_ID_DTYPE)
+        polydata = _compact_polydata(
+            mesh.points,
+            sizes,
+            connectivity.reshape(-1),
+            lines=mesh.cell_type == "BAR_2",
+        )
+    locator = vtkStaticCellLocator()
+    locator.SetDataSet(polydata)
+    locator.BuildLocator()
+    polydata.locator = locator
+    return polydata
+
+
+def _locator_bytes(polydata: vtkPolyData) -> int:
+    """Memory of pick geometry from :func:`_build_locator`, its locator included.
+
+    ``vtkStaticCellLocator`` does not report its size, so it is estimated
+    from its cached cell bounds, its cell-to-bucket map (at least one entry
+    per cell) and its bucket offsets.
+    """
+
+    locator = polydata.locator
+    cells = polydata.GetNumberOfCells()
+    id_bytes = 8 if locator.GetLargeIds() else 4
+    buckets = int(np.prod(locator.GetDivisions()))
+    size = 2 * id_bytes * cells + id_bytes * (buckets + 1)
+    if locator.GetCacheCellBounds():
+        size += 6 * 8 * cells
+    return surface_bytes(polydata) + size
+
+
+def _decimate(source: vtkDataSet, target_cells: int) -> vtkPolyData:
+    """Quadric-clustering proxy of ``source`` with roughly ``target_cells`` cells.
+
+    Cell data (section indices of batches) is carried over from one of the
+    cells merged into each output cell.
+    """
+
+    if not source.IsA("vtkPolyData"):
+        geometry = vtkGeometryFilter()
+        geometry.SetInputData(source)
+        geometry.Update()
+        source = geometry.GetOutput()
+    # A closed surface crossing an n x n x n grid of bins keeps about 12 n^2 triangles
+    divisions = max(int(np.sqrt(target_cells / 12)), 2)
+    clustering = vtkQuadricClustering()
+    clustering.SetInputData(source)
+    clustering.SetNumberOfDivisions(divisions, divisions, divisions)
+    clustering.CopyCellDataOn()
+    clustering.Update()
+    return clustering.GetOutput()
+
+
+def _outline(bounds: Bounds) -> vtkPolyData:
+    outline = vtkOutlineSource()
+    outline.SetBounds(*bounds)
+    outline.Update()
+    return outline.GetOutput()
+
+
+def _data_stamp(data: vtkDataSet) -> tuple[str, int]:
+    return data.GetAddressAsString("vtkObject"), data.GetMTime()
+
+
+def _compact_polydata(
+    points: np.ndarray | LazyArray,
+    sizes: np.ndarray,
+    nodes: np.ndarray,
+    *,
+    lines: bool,
+) -> vtkPolyData:
+    # Unused points would otherwise count in the polydata's bounds
+    used, local = np.unique(nodes, return_inverse=True)
+    offsets = np.zeros(sizes.size + 1, dtype=_VTK_ID_DTYPE)
+    np.cumsum(sizes, out=offsets[1:])
+    cells = vtkCellArray()
+    id_arrays = (_wrap_ids(offsets), _wrap_ids(local.reshape(-1).astype(_VTK_ID_DTYPE)))
+    cells.SetData(*id_arrays)
+    cells.id_arrays = id_arrays
+    vtk_points = _build_points(np.asarray(points)[used])[0]
+
+    polydata = vtkPolyData()
+    polydata.SetPoints(vtk_points)
+    if lines:
+        polydata.SetLines(cells)
+    else:
+        polydata.SetPolys(cells)
+    # Keep the wrappers alive with the polydata (see _wrap_ids)
+    polydata.arrays = (vtk_points, cells)
+    return polydata
+
+
+def _union_bounds(candidates: Iterable[Bounds | None]) -> Bounds | None:
+    rows = [
+        candidate
+        for candidate in candidates
+        if candidate is not None and candidate[0] <= candidate[1]
+    ]
+    if not rows:
+        return None
+    array = np.asarray(rows, dtype=float)
+    lower = array[:, 0::2].min(axis=0)
+    upper = array[:, 1::2].max(axis=0)
+    return (
+        float(lower[0]),
+        float(upper[0]),
+        float(lower[1]),
+        float(upper[1]),
+        float(lower[2]),
+        float(upper[2]),
+    )
+
+
+# Row stored for sections without bounds; it never wins a min/max reduction
+_EMPTY_BOUNDS_ROW = (np.inf, -np.inf, np.inf, -np.inf, np.inf, -np.inf)
+
+
+def _envelope(rows: np.ndarray) -> Bounds | None:
+    """Union of ``(N, 6)`` bounds rows in one vectorised reduction."""
+
+    if rows.shape[0] == 0:
+        return None
+    lower = rows[:, 0::2].min(axis=0)
+    upper = rows[:, 1::2].max(axis=0)
+    if lower[0] > upper[0]:
+        return None
+    return (
+        float(lower[0]),
+        float(upper[0]),
+        float(lower[1]),
+        float(upper[1]),
+        float(lower[2]),
+        float(upper[2]),
+    )
+
+
+def _segment_entries(
+    rows: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+    margin: float,
+) -> np.ndarray:
+    """Parameter in ``[0, 1]`` at which a segment enters each ``(N, 6)`` bounds row.
+
+    Boxes are grown by ``margin`` first; rows the segment misses get ``inf``.
+    """
+
+    enter = np.zeros(rows.shape[0])
+    leave = np.ones(rows.shape[0])
+    hit = rows[:, 0] <= rows[:, 1]
+    # 逐轴处理一维数组：方向分量为标量，近端与远端无需逐行比较
+    for axis in range(3):
+        lower = rows[:, 2 * axis] - margin
+        upper = rows[:, 2 * axis + 1] + margin
+        delta = end[axis] - start[axis]
+        if delta == 0:
+            hit &= (lower <= start[axis]) & (start[axis] <= upper)
+            continue
+        near, far = (lower, upper) if delta > 0 else (upper, lower)
+        np.maximum(enter, (near - start[axis]) / delta, out=enter)
+        np.minimum(leave, (far - start[axis]) / delta, out=leave)
+    hit &= enter <= leave
+    return np.where(hit, enter, np.inf)
+
+
+def _first_hit(
+    start: tuple[float, float, float],
+    end: tuple[float, float, float],
+    tolerance: float,
+    candidates: Iterable[tuple[float, tuple[str, int]]],
+    geometry: Callable[[tuple[str, int]], vtkPolyData | None],
+    cancelled: Callable[[], bool] | None = None,
+) -> tuple[tuple[str, int], int, tuple[float, float, float]] | None:
+    """Nearest cell hit by a segment: its section key, connectivity row and position.
+
+    ``candidates`` holds the entry parameter of each section's box, nearest
+    first, with its key; ``geometry`` returns the :func:`_build_locator`
+    polydata of a key.  The search stops at the first box beyond the best
+    hit.  It gives up and returns ``None`` at a section without polydata or
+    once ``cancelled()`` is true.
+    """
+
+    t = mutable(0.0)
+    sub_id = mutable(0)
+    cell_id = mutable(0)
+    position = [0.0, 0.0, 0.0]
+    pcoords = [0.0, 0.0, 0.0]
+    # 每次调用使用自己的 vtkGenericCell，定位器查询因此可在任意线程进行
+    cell = vtkGenericCell()
+    best: tuple[tuple[str, int], vtkPolyData, int, tuple[float, float, float]] | None = None
+    best_t = np.inf
+    for entry, key in candidates:
+        if entry > best_t:
+            break
+        polydata = None if cancelled is not None and cancelled() else geometry(key)
+        if polydata is None:
+            return None
+        found = polydata.locator.IntersectWithLine(
+            start, end, tolerance, t, position, pcoords, sub_id, cell_id, cell
+        )
+        if found and t.get() < best_t:
+            best_t = t.get()
+            best = (key, polydata, cell_id.get(), (position[0], position[1], position[2]))
+    if best is None:
+        return None
+    key, polydata, face, point = best
+    # 体单元的表面面片映射回所属单元
+    original = polydata.GetCellData().GetArray(ORIGINAL_CELL_IDS)
+    row = face if original is None else int(original.GetValue(face))
+    return key, row, point
+
+
+# Outline colour of the cell marked by SceneManager.mark_cell
+_CELL_MARKER_COLOR = (1.0, 0.85, 0.1)
+
+
+def _highlight_color(color: tuple[float, float, float]) -> tuple[float, float, float]:
+    return tuple(min(component + 0.25, 1.0) for component in color)
+
+
+def _hover_color(color: tuple[float, float, float]) -> tuple[float, float, float]:
+    return tuple(min(component + 0.12, 1.0) for component in color)
+
+
+class _SectionBatch:
+    """Several sections of one zone drawn by a single actor.
+
+    The cells of all sections are concatenated, in key order, into one
+    mixed-type grid with a per-cell :data:`SECTION_INDEX_ARRAY`.  The mapper
+    colours cells through a lookup table holding one RGBA entry per section,
+    so colour, highlight and opacity changes only rewrite table entries.
+    Hidden sections are dropped from the grid when its cells are rebuilt.
+    """
+
+    def __init__(
+        self,
+        keys: list[tuple[str, int]],
+        meshes: list[MeshData],
+        points: vtkPoints,
+        point_offsets: list[int],
+    ) -> None:
+        self.keys = keys
+        blocks: list[np.ndarray] = []
+        nodes: list[np.ndarray] = []
+        types: list[np.ndarray] = []
+        counts: list[int] = []
+        for mesh, offset in zip(meshes, point_offsets, strict=True):
+            vtk_type = _ELEMENT_TYPE_TO_VTK.get(mesh.cell_type)
+            if vtk_type is None:
+                msg = f"Unsupported cell type: {mesh.cell_type}"
+                raise ValueError(msg)
+            connectivity = np.asarray(mesh.connectivity, dtype=_VTK_ID_DTYPE)
+            cell_count, nodes_per_cell = connectivity.shape
+            blocks.append(connectivity.reshape(-1) + offset)
+            nodes.append(np.full(cell_count, nodes_per_cell, dtype=_VTK_ID_DTYPE))
+            types.append(np.full(cell_count, vtk_type, dtype=np.uint8))
+            counts.append(cell_count)
+        self._connectivity = np.concatenate(blocks)
+        self._nodes_per_cell = np.concatenate(nodes)
+        self._types = np.concatenate(types)
+        self._sections = np.repeat(np.arange(len(keys), dtype=np.int32), counts)
+        self._cells = (self._connectivity, self._nodes_per_cell, self._types, self._sections)
+        self._point_offsets = point_offsets
+        self._cell_sections = self._sections
+        self._visible = np.ones(len(keys), dtype=bool)
+        # RGBA table shared with the lookup table without copying
+        self._colors = np.zeros((len(keys), 4), dtype=np.uint8)
+
+        self.lookup_table = vtkLookupTable()
+        self.lookup_table.SetNumberOfTableValues(len(keys))
+        self.lookup_table.SetTable(
+            numpy_to_vtk(self._colors, deep=False, array_type=VTK_UNSIGNED_CHAR)
+        )
+        self.lookup_table.SetTableRange(0, max(len(keys) - 1, 0))
+        self.grid = vtkUnstructuredGrid()
+        self.grid.SetPoints(points)
+        mapper = vtkDataSetMapper()
+        mapper.SetInputData(self.grid)
+        mapper.SetLookupTable(self.lookup_table)
+        mapper.SetScalarModeToUseCellData()
+        mapper.SetColorModeToMapScalars()
+        mapper.UseLookupTableScalarRangeOn()
+        mapper.ScalarVisibilityOn()
+        self.actor = vtkActor()
+        self.actor.SetMapper(mapper)
+        self.actor.GetProperty().SetLineWidth(1.0)
+        self.actor.GetProperty().SetEdgeColor(0.15, 0.15, 0.15)
+        self._rebuild()
+
+    @property
+    def cell_count(self) -> int:
+        """Number of cells currently drawn (hidden sections excluded)."""
+
+        return len(self._cell_sections)
+
+    def set_color(
+        self,
+        index: int,
+        color: tuple[float, float, float],
+        opacity: float,
+    ) -> None:
+        self._colors[index, :3] = np.round(np.asarray(color) * 255.0)
+        self._colors[index, 3] = round(opacity * 255.0)
+        self.lookup_table.Modified()
+
+    def color(self, index: int) -> tuple[tuple[float, float, float], float]:
+        """RGB colour and opacity of the section at ``index``."""
+
+        rgba = self._colors[index] / 255.0
+        return (float(rgba[0]), float(rgba[1]), float(rgba[2])), float(rgba[3])
+
+    def set_visible(self, indices: Iterable[int], visible: bool) -> None:
+        """Show or hide several sections with a single rebuild of the cells."""
+
+        self._visible[list(indices)] = visible
+        self._rebuild()
+
+    def set_edges(self, edges: list[np.ndarray] | None) -> None:
+        """Draw the given ``(E, 2)`` edges of every section instead of its cells.
+
+        ``None`` goes back to drawing the cells.
+        """
+
+        if edges is None:
+            source = self._cells
+        else:
+            counts = [len(pairs) for pairs in edges]
+            total = sum(counts)
+            source = (
+                np.concatenate(
+                    [
+                        np.asarray(pairs, dtype=_VTK_ID_DTYPE).reshape(-1) + offset
+                        for pairs, offset in zip(edges, self._point_offsets, strict=True)
+                    ]
+                ),
+                np.full(total, 2, dtype=_VTK_ID_DTYPE),
+                np.full(total, VTK_LINE, dtype=np.uint8),
+                np.repeat(np.arange(len(self.keys), dtype=np.int32), counts),
+            )
+        self._connectivity, self._nodes_per_cell, self._types, self._sections = source
+        self._rebuild()
+
+    def key_for_cell(self, cell_id: int) -> tuple[str, int] | None:
+        if not 0 <= cell_id < len(self._cell_sections):
+            return None
+        return self.keys[self._cell_sections[cell_id]]
+
+    def _rebuild(self) -> None:
+        if self._visible.all():
+            keep = None
+            connectivity = self._connectivity
+            nodes = self._nodes_per_cell
+            types = self._types
+            sections = self._sections
+        else:
+            keep = self._visible[self._sections]
+            connectivity = self._connectivity[np.repeat(keep, self._nodes_per_cell)]
+            nodes = self._nodes_per_cell[keep]
+            types = self._types[keep]
+            sections = self._sections[keep]
+        offsets = np.zeros(len(nodes) + 1, dtype=_VTK_ID_DTYPE)
+        np.cumsum(nodes, out=offsets[1:])
+        cell_array = vtkCellArray()
+        id_arrays = (
+            _wrap_ids(offsets),
+            _wrap_ids(np.ascontiguousarray(connectivity, dtype=_VTK_ID_DTYPE)),
+        )
+        cell_array.SetData(*id_arrays)
+        cell_array.id_arrays = id_arrays
+        self.grid.SetCells(
+            numpy_to_vtk(types, deep=False, array_type=VTK_UNSIGNED_CHAR),
+            cell_array,
+        )
+        scalars = numpy_to_vtk(sections, deep=False)
+        scalars.SetName(SECTION_INDEX_ARRAY)
+        self.grid.GetCellData().SetScalars(scalars)
+        self._cell_sections = sections
+        visible = keep is None or bool(keep.any())
+        self.actor.SetVisibility(1 if visible else 0)
+        self.actor.SetPickable(1 if visible else 0)
+
+
+@dataclass(frozen=True, slots=True)
+class PointsMemoryReport:
+    """Coordinate memory held by VTK for a loaded model."""
+
+    shared_bytes: int = 0
+    copied_bytes: int = 0
+    per_section_bytes: int = 0
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes saved compared with one deep copy of the points per section."""
+
+        return max(self.per_section_bytes - self.copied_bytes, 0)
+
+
+@dataclass(frozen=True, slots=True)
+class CellPick:
+    """One cell of a section, as picked by :meth:`SceneManager.pick_cell`."""
+
+    key: tuple[str, int]
+    # Connectivity row of the cell in its section
+    cell: int
+    # CGNS element id: the section's ElementRange start plus ``cell``
+    element_id: int
+    # One-based zone node ids of the cell and their coordinates
+    node_ids: tuple[int, ...]
+    coordinates: tuple[tuple[float, float, float], ...]
+    # Where the pick ray hit the cell, if it was picked
+    position: tuple[float, float, float] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RayQuery:
+    """A pick ray with the pick geometry of the sections it may hit.
+
+    Built by :meth:`SceneManager.ray_query`; :meth:`run` only reads VTK data
+    the scene no longer modifies, so it can run on any thread.
+    """
+
+    start: tuple[float, float, float]
+    end: tuple[float, float, float]
+    tolerance: float
+    # Entry parameter of each section's box and its key, nearest first
+    candidates: tuple[tuple[float, tuple[str, int]], ...]
+    geometry: dict[tuple[str, int], vtkPolyData]
+
+    def run(
+        self,
+        cancelled: Callable[[], bool] | None = None,
+    ) -> tuple[tuple[str, int], int, tuple[float, float, float]] | None:
+        """Key, connectivity row and position of the nearest hit cell.
+
+        ``cancelled`` is checked before each section; once it returns true the
+        query stops with ``None``.
+        """
+
+        return _first_hit(
+            self.start,
+            self.end,
+            self.tolerance,
+            self.candidates,
+            self.geometry.get,
+            cancelled,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DrawStats:
+    """What the visible actors currently hand to the renderer."""
+
+    actors: int = 0
+    cells: int = 0
+
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+def _pipeline_work(
+    method: Callable[Concatenate[SceneManager, _P], _R],
+) -> Callable[Concatenate[SceneManager, _P], _R]:
+    """Count the time spent in a SceneManager method as pipeline work.
+
+    Nested calls are counted once, by the outermost timed method.  Pipeline
+    work may change what is drawn, so it also drops the cached draw stats.
+    """
+
+    @wraps(method)
+    def timed(self: SceneManager, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        if self._pipeline_depth:
+            return method(self, *args, **kwargs)
+        self._pipeline_depth += 1
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._pipeline_depth -= 1
+            self._pipeline_seconds += time.perf_counter() - start
+            self._draw_stats = None
+
+    return timed
+
 
 class RenderStyle(str, Enum):
-    """Rendering modes supported by the scene manager."""
+    """Rendering modes supported by the scene manager.
+
+    ``WIREFRAME`` draws every edge of a section once; ``FEATURE_EDGES`` only
+    its boundary edges and the edges sharper than the feature angle.
+    """
 
     SURFACE = "surface"
     WIREFRAME = "wireframe"
+    FEATURE_EDGES = "feature_edges"
 
 
 class SceneManager:
-    """Manage VTK actors corresponding to CGNS sections."""
+    """Manage VTK actors corresponding to CGNS sections.
+
+    By default every section gets its own actor.  With ``batched=True`` the
+    sections of a zone that are shown initially (surfaces and boundaries) are
+    merged into one :class:`_SectionBatch` actor, which keeps draw calls low
+    for models with many thousands of boundary sections; volume sections keep
+    their own lazily built actors.  Section keys mean the same in both modes.
+
+    Volume sections are drawn from their exterior faces, kept in a
+    :class:`~cgns_gui.surfaces.SurfaceCache` while shown and released from the
+    actor when hidden.  With ``surface_workers > 0`` the faces are extracted on
+    worker threads: the actor stays empty until :meth:`apply_ready_surfaces`
+    is called, which ``on_surface_ready`` (invoked from a worker) should
+    trigger on the GUI thread.
 
-    def __init__(self, renderer: vtkRenderer) -> None:
+    :meth:`pick_cell` resolves a pick ray to a single cell through static
+    cell locators built per section on first use (by the same workers) and
+    kept in a third cache.
+
+    While :meth:`set_interactive` is on, actors with more than
+    :attr:`lod_cells` cells draw a decimated proxy through a second mapper
+    (their bounding box until the proxy is ready).  Proxies are built by the
+    same workers and cached per actor; :meth:`prepare_lod` starts them ahead
+    of the next camera motion.
+    """
+
+    def __init__(
+        self,
+        renderer: vtkRenderer,
+        *,
+        batched: bool = False,
+        surface_workers: int = 0,
+        on_surface_ready: Callable[[], None] | None = None,
+    ) -> None:
         self._renderer = renderer
+        self._batched = batched
+        self._batches: list[_SectionBatch] = []
+        self._batch_of: dict[tuple[str, int], tuple[_SectionBatch, int]] = {}
+        self._batch_lookup: dict[vtkActor, _SectionBatch] = {}
+        # Sections are looked up through the model's key index
+        self._model = CgnsModel()
         self._actors: dict[tuple[str, int], vtkActor] = {}
         self._actor_lookup: dict[vtkActor, tuple[str, int]] = {}
         self._base_colors: dict[tuple[str, int], tuple[float, float, float]] = {}
         self._section_transparency: dict[tuple[str, int], float] = {}
         self._section_visibility: dict[tuple[str, int], bool] = {}
+        # Per-section bounds from NumPy, also kept as an (N, 6) table with a
+        # visibility mask so that the envelopes below are one reduction away
+        self._section_bounds: dict[tuple[str, int], Bounds | None] = {}
+        self._bounds_row: dict[tuple[str, int], int] = {}
+        self._bounds_keys: list[tuple[str, int]] = []
+        self._bounds_table = np.empty((0, 6))
+        self._visible_rows = np.empty(0, dtype=bool)
+        self._visible_envelope: Bounds | None = None
+        self._visible_envelope_valid = True
+        self._scene_envelope: Bounds | None = None
+        self._scene_envelope_valid = True
+        self._vtk_points: dict[int, vtkPoints] = {}
+        self._surfaces = SurfaceCache(
+            _build_surface,
+            workers=surface_workers,
+            on_ready=on_surface_ready,
+        )
+        # Input of volume actors whose surface is hidden or not extracted yet
+        self._empty_input = vtkPolyData()
+        # Line polydata drawn per section in the edge styles
+        self._edges: dict[tuple[str, int], vtkPolyData] = {}
+        self._feature_angle = DEFAULT_FEATURE_ANGLE
+        # Decimated proxies keyed by actor, stamped with the data they were built from
+        self._lods = SurfaceCache(
+            self._build_lod,
+            max_bytes=DEFAULT_LOD_BYTES,
+            workers=surface_workers,
+            on_ready=on_surface_ready,
+        )
+        self._lod_cells = DEFAULT_LOD_CELLS
+        # Pick geometry with a static cell locator, keyed by section
+        self._locators = SurfaceCache(
+            _build_locator,
+            max_bytes=DEFAULT_LOCATOR_BYTES,
+            workers=surface_workers,
+            on_ready=on_surface_ready,
+            size=_locator_bytes,
+        )
+        # Sections whose locator failed to build are left out of picks
+        self._unpickable: set[tuple[str, int]] = set()
+        # Failed surface, proxy and locator builds, see take_failures()
+        self._failures: list[tuple[tuple[str, int] | None, Exception]] = []
+        self._interactive = False
+        # Full-resolution mapper of every actor currently drawing its proxy
+        self._lod_swapped: dict[vtkActor, vtkMapper] = {}
+        # Time spent building or swapping VTK data, see take_pipeline_seconds()
+        self._pipeline_seconds = 0.0
+        self._pipeline_depth = 0
+        # Counted on demand after pipeline work, see draw_stats()
+        self._draw_stats: DrawStats | None = None
         self._highlighted: tuple[str, int] | None = None
+        # Section pre-highlighted under the mouse, see hover()
+        self._hovered: tuple[str, int] | None = None
+        # Outline of a single marked cell, see mark_cell()
+        self._cell_marker: vtkActor | None = None
+        # Every highlighted key (single or family selection); restyling is diffed against it
+        self._highlighted_keys: set[tuple[str, int]] = set()
+        # Actors with equal colour, opacity and highlight state share one property
+        self._properties: dict[tuple[tuple[float, float, float], float, bool], vtkProperty] = {}
         self._color_palette = self._build_palette()
         self._style = RenderStyle.SURFACE
+        self._points_memory = PointsMemoryReport()
+        self._family_colors: dict[str, tuple[float, float, float]] = {}
+        self._zone_count = 0
 
     def clear(self) -> None:
+        self.mark_cell(None)
         for actor in self._actors.values():
             self._renderer.RemoveActor(actor)
+        for batch in self._batches:
+            self._renderer.RemoveActor(batch.actor)
+        self._batches.clear()
+        self._batch_of.clear()
+        self._batch_lookup.clear()
+        self._model = CgnsModel()
         self._actors.clear()
         self._actor_lookup.clear()
         self._base_colors.clear()
         self._section_transparency.clear()
         self._section_visibility.clear()
+        self._section_bounds.clear()
+        self._bounds_row.clear()
+        self._bounds_keys.clear()
+        self._bounds_table = np.empty((0, 6))
+        self._visible_rows = np.empty(0, dtype=bool)
+        self._visible_envelope = None
+        self._visible_envelope_valid = True
+        self._scene_envelope = None
+        self._scene_envelope_valid = True
+        self._vtk_points.clear()
+        self._surfaces.clear()
+        self._edges.clear()
+        self._lods.clear()
+        self._locators.clear()
+        self._unpickable.clear()
+        self._failures.clear()
+        self._lod_swapped.clear()
+        self._draw_stats = None
         self._highlighted = None
+        self._hovered = None
+        self._highlighted_keys.clear()
+        self._properties.clear()
+        self._points_memory = PointsMemoryReport()
+        self._family_colors.clear()
+        self._zone_count = 0
+
+    def close(self) -> None:
+        """Stop the surface workers; call before the renderer goes away."""
+
+        self._surfaces.close()
+        self._lods.close()
+        self._locators.close()
 
     @property
     def renderer(self) -> vtkRenderer:
         return self._renderer
 
+    @property
+    def surface_cache(self) -> SurfaceCache:
+        return self._surfaces
+
+    @property
+    def lod_cells(self) -> int:
+        return self._lod_cells
+
+    @lod_cells.setter
+    def lod_cells(self, cells: int) -> None:
+        """Change the cell count above which actors get a decimated proxy."""
+
+        if cells == self._lod_cells:
+            return
+        self._lod_cells = cells
+        self._lods.clear()
+
+    @property
+    def interactive(self) -> bool:
+        return self._interactive
+
+    @_pipeline_work
+    def set_interactive(self, interactive: bool) -> None:
+        """Draw large actors as decimated proxies (camera moving) or in full."""
+
+        if interactive == self._interactive:
+            return
+        self._interactive = interactive
+        if interactive:
+            for actor in list(self.iter_pickable_actors()):
+                self._show_lod(actor)
+            return
+        for actor, mapper in self._lod_swapped.items():
+            actor.SetMapper(mapper)
+        self._lod_swapped.clear()
+
+    @_pipeline_work
+    def prepare_lod(self) -> None:
+        """Start building the proxies of visible actors that will need one."""
+
+        for actor in self.iter_pickable_actors():
+            source = self._full_mapper(actor).GetInput()
+            if source is not None and source.GetNumberOfCells() > self._lod_cells:
+                self._lod_for(actor, source)
+
+    @property
+    def feature_angle(self) -> float:
+        return self._feature_angle
+
+    @feature_angle.setter
+    @_pipeline_work
+    def feature_angle(self, degrees: float) -> None:
+        """Change the angle (degrees) used by :attr:`RenderStyle.FEATURE_EDGES`."""
+
+        degrees = float(degrees)
+        if degrees == self._feature_angle:
+            return
+        self._feature_angle = degrees
+        if self._style is RenderStyle.FEATURE_EDGES:
+            self._refresh_inputs()
+
+    @property
+    def batched(self) -> bool:
+        return self._batched
+
+    @batched.setter
+    def batched(self, value: bool) -> None:
+        """Switch batching on or off for zones added from now on."""
+
+        self._batched = value
+
     def visible_bounds(self) -> tuple[float, float, float, float, float, float] | None:
-        bounds: list[float] | None = None
-        for actor in self._actors.values():
-            if actor.GetVisibility() != 1:
-                continue
-            actor_bounds = actor.GetBounds()
-            if actor_bounds is None or actor_bounds[0] > actor_bounds[1]:
-                continue
-            if bounds is None:
-                bounds = list(actor_bounds)
-            else:
-                bounds[0] = min(bounds[0], actor_bounds[0])
-                bounds[1] = max(bounds[1], actor_bounds[1])
-                bounds[2] = min(bounds[2], actor_bounds[2])
-                bounds[3] = max(bounds[3], actor_bounds[3])
-                bounds[4] = min(bounds[4], actor_bounds[4])
-                bounds[5] = max(bounds[5], actor_bounds[5])
-        return tuple(bounds) if bounds is not None else None
+        """Bounds of the visible sections, maintained as visibility changes."""
+
+        if not self._visible_envelope_valid:
+            self._visible_envelope = _envelope(self._bounds_table[self._visible_rows])
+            self._visible_envelope_valid = True
+        return self._visible_envelope
 
     def scene_bounds(self) -> tuple[float, float, float, float, float, float] | None:
-        bounds: list[float] | None = None
-        for actor in self._actors.values():
-            actor_bounds = actor.GetBounds()
-            if actor_bounds is None or actor_bounds[0] > actor_bounds[1]:
-                continue
-            if bounds is None:
-                bounds = list(actor_bounds)
-            else:
-                bounds[0] = min(bounds[0], actor_bounds[0])
-                bounds[1] = max(bounds[1], actor_bounds[1])
-                bounds[2] = min(bounds[2], actor_bounds[2])
-                bounds[3] = max(bounds[3], actor_bounds[3])
-                bounds[4] = min(bounds[4], actor_bounds[4])
-                bounds[5] = max(bounds[5], actor_bounds[5])
-        return tuple(bounds) if bounds is not None else None
+        """Bounds of every section, shown or not."""
+
+        if not self._scene_envelope_valid:
+            self._scene_envelope = _envelope(self._bounds_table)
+            self._scene_envelope_valid = True
+        return self._scene_envelope
 
     def bounds_for_section(
         self,
         key: tuple[str, int],
     ) -> tuple[float, float, float, float, float, float] | None:
-        actor = self._actors.get(key)
-        if actor is None or actor.GetVisibility() != 1:
+        if key not in self._section_visibility or not self.is_section_visible(key):
             return None
-        bounds = actor.GetBounds()
+        bounds = self._bounds_of(key)
         if bounds is None or bounds[0] > bounds[1]:
             return None
         return bounds
 
+    @_pipeline_work
     def load_model(self, model: CgnsModel) -> None:
+        self.begin_model(model)
+        for zone in model.zones:
+            self.add_zone(zone)
+        if self._section_visibility:
+            self._renderer.ResetCamera()
+
+    def begin_model(self, model: CgnsModel) -> None:
+        """Clear the scene for ``model``; its zones are then shown with :meth:`add_zone`."""
+
         self.clear()
-        
-        # 构建 Family 到颜色的映射
-        family_colors: dict[str, tuple[float, float, float]] = {}
+        self._model = model
+        self.add_families(model.families)
+
+    def add_families(self, families: Iterable[str]) -> None:
+        """Assign colors to families not seen yet (in name order)."""
+
         palette = self._color_palette
-        for family_idx, family_name in enumerate(sorted(model.families.keys())):
+        for family_name in sorted(set(families) - self._family_colors.keys()):
             # 为每个 Family 分配一个唯一颜色，直接使用 palette 索引
-            color_idx = family_idx % len(palette)
-            family_colors[family_name] = palette[color_idx]
-        
-        for zone_idx, zone in enumerate(model.zones):
-            for section_idx, section in enumerate(zone.sections):
-                actor = self._create_actor(section)
-                
-                # 根据 Family 或 Zone 分配颜色
-                if section.boundary and section.boundary.family:
-                    # 有 Family 的边界条件：使用 Family 颜色
-                    fallback_color = self._pick_color(zone_idx, section_idx)
-                    color = family_colors.get(
-                        section.boundary.family, fallback_color
-                    )
-                else:
-                    # 体单元或无 Family 的边界条件：使用 Zone/Section 颜色
-                    color = self._pick_color(zone_idx, section_idx)
-                
-                actor.GetProperty().SetColor(*color)
-                actor.GetProperty().SetEdgeColor(0.15, 0.15, 0.15)
-                self._apply_style(actor)
-                self._renderer.AddActor(actor)
-                key = (zone.name, section.id)
-                transparency = self._default_transparency(section.element_type)
-                visible = self._default_visibility(section.element_type)
-                self._actors[key] = actor
-                self._actor_lookup[actor] = key
-                self._base_colors[key] = color
-                self._section_transparency[key] = transparency
-                self._section_visibility[key] = visible
-                actor.SetVisibility(1 if visible else 0)
-                actor.SetPickable(1 if visible else 0)
-                self._apply_base_style(key, actor, color)
-        if self._actors:
-            self._renderer.ResetCamera()
+            color_idx = len(self._family_colors) % len(palette)
+            self._family_colors[family_name] = palette[color_idx]
+
+    @_pipeline_work
+    def add_zone(self, zone: Zone) -> list[tuple[str, int]]:
+        """Add the sections of ``zone`` to the scene; return their keys.
+
+        Used by streaming loads to show zones as they arrive.  Families the
+        zone refers to should be registered with :meth:`add_families` first;
+        the camera is left untouched.  ``zone`` is added to the scene's model
+        unless it is already there.
+        """
+
+        self._model.add_zone(zone)
+        zone_idx = self._zone_count
+        self._zone_count += 1
+        keys: list[tuple[str, int]] = []
+        batch_keys: list[tuple[str, int]] = []
+        per_section_bytes = 0
+        for section_idx, section in enumerate(zone.sections):
+            # 根据 Family 或 Zone 分配颜色
+            if section.boundary and section.boundary.family:
+                # 有 Family 的边界条件：使用 Family 颜色
+                fallback_color = self._pick_color(zone_idx, section_idx)
+                color = self._family_colors.get(section.boundary.family, fallback_color)
+            else:
+                # 体单元或无 Family 的边界条件：使用 Zone/Section 颜色
+                color = self._pick_color(zone_idx, section_idx)
+
+            key = (zone.name, section.id)
+            visible = self._default_visibility(section.element_type)
+            self._base_colors[key] = color
+            self._section_transparency[key] = self._default_transparency(section.element_type)
+            self._section_visibility[key] = visible
+            per_section_bytes += section.mesh.points.nbytes
+            # 已加载的网格在加入时即计算包围盒，之后的聚焦与视野计算不再遍历 actor
+            if section.mesh.is_loaded:
+                self._section_bounds[key] = section.mesh.bounds()
+            # 隐藏的 sections（默认是体单元）推迟到首次显示时再构建 actor
+            if visible and self._batched:
+                batch_keys.append(key)
+            elif visible:
+                self._ensure_actor(key)
+            keys.append(key)
+        if batch_keys:
+            self._add_batch(batch_keys)
+        self._append_bounds_rows(keys)
+        self._points_memory = replace(
+            self._points_memory,
+            per_section_bytes=self._points_memory.per_section_bytes + per_section_bytes,
+        )
+        return keys
+
+    def points_memory_report(self) -> PointsMemoryReport:
+        """Return coordinate memory statistics for the last loaded model."""
+
+        return self._points_memory
+
+    def draw_stats(self) -> DrawStats:
+        """Count the visible actors and the cells their mappers draw.
+
+        The count is kept until the next pipeline work (visibility, inputs,
+        proxies), so calling this every frame only walks the actors after
+        the scene changed.
+        """
+
+        if self._draw_stats is None:
+            actors = cells = 0
+            for actor in self.iter_pickable_actors():
+                data = actor.GetMapper().GetInput()
+                actors += 1
+                cells += 0 if data is None else data.GetNumberOfCells()
+            self._draw_stats = DrawStats(actors=actors, cells=cells)
+        return self._draw_stats
+
+    def take_pipeline_seconds(self) -> float:
+        """Return the time spent building or swapping VTK data since the last call.
+
+        Covers loading zones, building deferred actors, visibility and style
+        changes, attaching finished surfaces and switching level of detail.
+        """
+
+        seconds = self._pipeline_seconds
+        self._pipeline_seconds = 0.0
+        return seconds
 
     def iter_section_keys(self) -> Iterable[tuple[str, int]]:
-        return self._actors.keys()
+        return self._section_visibility.keys()
 
     def iter_actors(self) -> Iterable[vtkActor]:
         return self._actors.values()
@@ -169,45 +1077,344 @@ class SceneManager:
     def iter_actor_items(self) -> Iterable[tuple[tuple[str, int], vtkActor]]:
         return self._actors.items()
 
+    def iter_pickable_actors(self) -> Iterable[vtkActor]:
+        """Actors showing at least one visible section (batch actors included)."""
+
+        for key, actor in self._actors.items():
+            if self.is_section_visible(key):
+                yield actor
+        for batch in self._batches:
+            if batch.actor.GetVisibility() == 1:
+                yield batch.actor
+
     def get_actor(self, key: tuple[str, int]) -> vtkActor | None:
-        return self._actors.get(key)
+        """Return the actor drawing ``key``, building it first if it was deferred.
+
+        Batched sections share the actor of their batch.
+        """
+
+        return self._ensure_actor(key)
+
+    def has_actor(self, key: tuple[str, int]) -> bool:
+        """Whether the actor for ``key`` has already been built."""
+
+        return key in self._actors or key in self._batch_of
+
+    def is_batched(self, key: tuple[str, int]) -> bool:
+        return key in self._batch_of
+
+    def get_key_for_actor(
+        self,
+        actor: vtkActor | None,
+        cell_id: int | None = None,
+    ) -> tuple[str, int] | None:
+        """Section drawn by ``actor``; batch actors also need the picked ``cell_id``."""
 
-    def get_key_for_actor(self, actor: vtkActor | None) -> tuple[str, int] | None:
         if actor is None:
             return None
-        return self._actor_lookup.get(actor)
+        key = self._actor_lookup.get(actor)
+        if key is not None:
+            return key
+        batch = self._batch_lookup.get(actor)
+        if batch is None or cell_id is None:
+            return None
+        return batch.key_for_cell(cell_id)
+
+    def _add_batch(self, keys: list[tuple[str, int]]) -> None:
+        meshes = [self._model.section(key).mesh for key in keys]
+        # 共享同一坐标数组时直接复用 vtkPoints，否则拼接并偏移节点编号
+        arrays: dict[int, np.ndarray | LazyArray] = {}
+        for mesh in meshes:
+            arrays.setdefault(id(mesh.points), mesh.points)
+        if len(arrays) == 1:
+            points = self._points_for(meshes[0].points)
+            offsets = [0] * len(meshes)
+        else:
+            starts: dict[int, int] = {}
+            total = 0
+            for array_id, array in arrays.items():
+                starts[array_id] = total
+                total += len(array)
+            points = _build_points(
+                np.concatenate([np.asarray(array) for array in arrays.values()])
+            )[0]
+            offsets = [starts[id(mesh.points)] for mesh in meshes]
+        batch = _SectionBatch(keys, meshes, points, offsets)
+        if self._style is not RenderStyle.SURFACE:
+            batch.set_edges(self._batch_edges(batch))
+        self._apply_style(batch.actor)
+        for index, key in enumerate(keys):
+            self._batch_of[key] = (batch, index)
+            self._style_batched(key, highlighted=key in self._highlighted_keys)
+        self._batches.append(batch)
+        self._batch_lookup[batch.actor] = batch
+        self._renderer.AddActor(batch.actor)
+
+    def _style_batched(
+        self,
+        key: tuple[str, int],
+        *,
+        highlighted: bool,
+        hovered: bool = False,
+    ) -> None:
+        batch, index = self._batch_of[key]
+        color = self._base_colors[key]
+        if highlighted:
+            color = _highlight_color(color)
+        elif hovered:
+            color = _hover_color(color)
+        batch.set_color(index, color, self._opacity_for_key(key))
+
+    @_pipeline_work
+    def _ensure_actor(self, key: tuple[str, int]) -> vtkActor | None:
+        actor = self._actors.get(key)
+        if actor is not None:
+            return actor
+        batched = self._batch_of.get(key)
+        if batched is not None:
+            return batched[0].actor
+        section = self._model.section(key) if key in self._section_visibility else None
+        if section is None:
+            return None
+
+        volume = self._is_volume(key)
+        if volume:
+            actor = self._create_surface_actor()
+        else:
+            actor = self._create_actor(section, self._points_for(section.mesh.points))
+        visible = self._section_visibility.get(key, True)
+        self._renderer.AddActor(actor)
+        self._actors[key] = actor
+        self._actor_lookup[actor] = key
+        actor.SetVisibility(1 if visible else 0)
+        actor.SetPickable(1 if visible else 0)
+        self._refresh_input(key)
+        self._restyle(key)
+        return actor
+
+    def _is_volume(self, key: tuple[str, int]) -> bool:
+        return self._model.section(key).mesh.cell_type in VOLUME_ELEMENT_TYPES
+
+    def _create_surface_actor(self) -> vtkActor:
+        mapper = vtkPolyDataMapper()
+        mapper.SetInputData(self._empty_input)
+        actor = vtkActor()
+        actor.SetMapper(mapper)
+        actor.pipeline = (mapper,)
+        return actor
+
+    def _refresh_input(self, key: tuple[str, int]) -> None:
+        """Point the actor of ``key`` at the data the current style draws."""
+
+        visible = self.is_section_visible(key)
+        # 隐藏的体单元不再持有表面，缓存淘汰后内存即可释放；其他 section 保留原输入
+        if not visible and not self._is_volume(key):
+            return
+        data = self._display_input(key) if visible else None
+        self._actors[key].pipeline[0].SetInputData(self._empty_input if data is None else data)
+
+    def _display_input(self, key: tuple[str, int]) -> vtkUnstructuredGrid | vtkPolyData | None:
+        surface = None
+        if self._is_volume(key):
+            surface = self._surfaces.request(key, self._model.section(key).mesh)
+            if surface is None:
+                return None
+        if self._style is RenderStyle.SURFACE:
+            return surface if surface is not None else self._actors[key].pipeline[1]
+        edges = self._edges.get(key)
+        if edges is None:
+            mesh = self._model.section(key).mesh
+            pairs = section_edges(
+                mesh,
+                feature_angle=self._edge_feature_angle(),
+                faces=None if surface is None else surface.faces,
+            )
+            edges = _build_lines(mesh.points, pairs)
+            self._edges[key] = edges
+        return edges
+
+    def _edge_feature_angle(self) -> float | None:
+        return self._feature_angle if self._style is RenderStyle.FEATURE_EDGES else None
+
+    def _batch_edges(self, batch: _SectionBatch) -> list[np.ndarray]:
+        angle = self._edge_feature_angle()
+        return [
+            section_edges(self._model.section(key).mesh, feature_angle=angle)
+            for key in batch.keys
+        ]
+
+    def _refresh_inputs(self) -> None:
+        self._edges.clear()
+        for key in self._actors:
+            self._refresh_input(key)
+        for batch in self._batches:
+            edges = None if self._style is RenderStyle.SURFACE else self._batch_edges(batch)
+            batch.set_edges(edges)
+
+    @_pipeline_work
+    def apply_ready_surfaces(self) -> list[tuple[str, int]]:
+        """Show the surfaces finished by the workers; return the updated keys.
+
+        Proxies finished meanwhile replace the bounding boxes drawn in their
+        place.  Builds that failed are kept for :meth:`take_failures`.
+        """
+
+        attached: list[tuple[str, int]] = []
+        for key in self._surfaces.take_ready():
+            if key not in self._actors or not self.is_section_visible(key):
+                continue
+            self._refresh_input(key)
+            # 连接关系已随提取读入，包围盒可精确计算并缓存
+            self._bounds_of(key)
+            attached.append(key)
+        for actor in self._lods.take_ready():
+            if actor in self._lod_swapped:
+                self._show_lod(actor)
+        self._locators.take_ready()
+        self._collect_failures()
+        return attached
+
+    def take_failures(self) -> list[tuple[tuple[str, int] | None, Exception]]:
+        """Surface, proxy and locator builds that raised since the last call.
+
+        Each comes with the section it was for, or ``None`` for the proxy of
+        a batched actor.  A failed surface is retried when its section is
+        shown again; a section whose locator failed is no longer picked.
+        """
+
+        self._collect_failures()
+        failures, self._failures = self._failures, []
+        return failures
+
+    def _collect_failures(self) -> None:
+        self._failures += self._surfaces.take_failures()
+        self._failures += [
+            (self._actor_lookup.get(actor), error) for actor, error in self._lods.take_failures()
+        ]
+        for key, error in self._locators.take_failures():
+            self._unpickable.add(key)
+            self._failures.append((key, error))
+
+    def _full_mapper(self, actor: vtkActor) -> vtkMapper:
+        mapper = self._lod_swapped.get(actor)
+        return actor.GetMapper() if mapper is None else mapper
+
+    def _show_lod(self, actor: vtkActor) -> None:
+        mapper = self._full_mapper(actor)
+        source = mapper.GetInput()
+        if source is None or source.GetNumberOfCells() <= self._lod_cells:
+            return
+        lod = self._lod_for(actor, source)
+        lod_mapper = getattr(actor, "lod_mapper", None)
+        if lod_mapper is None:
+            # 复制查找表与标量设置，合批 actor 的代理仍按 section 着色
+            lod_mapper = vtkPolyDataMapper()
+            lod_mapper.ShallowCopy(mapper)
+            actor.lod_mapper = lod_mapper
+        lod_mapper.SetInputData(_outline(source.GetBounds()) if lod is None else lod)
+        self._lod_swapped[actor] = mapper
+        actor.SetMapper(lod_mapper)
+
+    def _lod_for(self, actor: vtkActor, source: vtkDataSet) -> vtkPolyData | None:
+        """Return the proxy of ``actor`` if it matches ``source``, else start building it."""
+
+        lod = self._lods.get(actor)
+        if lod is not None and lod.source_stamp == _data_stamp(source):
+            return lod
+        if self._lods.is_pending(actor):
+            return None
+        self._lods.discard(actor)
+        # 工作线程只读取在此线程做的浅拷贝：合批 actor 的网格会被原地重建(SetCells)，
+        # 拷贝仍引用旧的单元数组。包围盒也在此预先计算并缓存
+        snapshot = type(source)()
+        snapshot.ShallowCopy(source)
+        snapshot.GetBounds()
+        snapshot.source_stamp = _data_stamp(source)
+        return self._lods.request(actor, snapshot)
+
+    def _build_lod(self, snapshot: vtkDataSet) -> vtkPolyData:
+        lod = _decimate(snapshot, self._lod_cells)
+        # 网格在构建期间被修改时，戳记不再匹配，代理会重新构建
+        lod.source_stamp = snapshot.source_stamp
+        return lod
+
+    def _points_for(self, points: np.ndarray | LazyArray) -> vtkPoints:
+        # 同一 Zone 的 sections 共享坐标数组，只构建一次 vtkPoints
+        vtk_points = self._vtk_points.get(id(points))
+        if vtk_points is None:
+            vtk_points, copied = _build_points(points)
+            self._vtk_points[id(points)] = vtk_points
+            self._points_memory = replace(
+                self._points_memory,
+                shared_bytes=self._points_memory.shared_bytes + points.nbytes,
+                copied_bytes=self._points_memory.copied_bytes + copied,
+            )
+        return vtk_points
+
+    def _bounds_of(self, key: tuple[str, int]) -> Bounds | None:
+        if key in self._section_bounds:
+            return self._section_bounds[key]
+        mesh = self._model.section(key).mesh
+        bounds = mesh.bounds()
+        # 连接关系未加载时得到的是整个 Zone 的包围盒，不缓存，等加载后再精确计算
+        if mesh.is_loaded:
+            self._section_bounds[key] = bounds
+            row = self._bounds_row.get(key)
+            if row is not None:
+                self._bounds_table[row] = _EMPTY_BOUNDS_ROW if bounds is None else bounds
+                self._scene_envelope_valid = False
+                self._visible_envelope_valid = False
+        return bounds
+
+    def _append_bounds_rows(self, keys: list[tuple[str, int]]) -> None:
+        rows = []
+        for key in keys:
+            bounds = self._bounds_of(key)
+            rows.append(_EMPTY_BOUNDS_ROW if bounds is None else bounds)
+            self._bounds_row[key] = len(self._bounds_row)
+            self._bounds_keys.append(key)
+        table = np.asarray(rows, dtype=float).reshape(-1, 6)
+        visible = np.array([self.is_section_visible(key) for key in keys], dtype=bool)
+        self._bounds_table = np.concatenate([self._bounds_table, table])
+        self._visible_rows = np.concatenate([self._visible_rows, visible])
+        # 新增的 sections 只会扩大包围盒，直接合并即可
+        if self._scene_envelope_valid:
+            self._scene_envelope = _union_bounds([self._scene_envelope, _envelope(table)])
+        if self._visible_envelope_valid:
+            self._visible_envelope = _union_bounds(
+                [self._visible_envelope, _envelope(table[visible])]
+            )
 
-    def _create_actor(self, section: Section) -> vtkActor:
+    def _create_actor(self, section: Section, points: vtkPoints | None = None) -> vtkActor:
         mesh = section.mesh
-        dataset = self._build_unstructured_grid(mesh)
+        dataset = self._build_unstructured_grid(mesh, points)
 
         mapper = vtkDataSetMapper()
         mapper.SetInputData(dataset)
 
         actor = vtkActor()
         actor.SetMapper(mapper)
-        actor.GetProperty().SetLineWidth(1.0)
+        # Keep the pipeline's wrappers alive with the actor (see _wrap_ids)
+        actor.pipeline = (mapper, dataset, dataset.cell_array)
         return actor
 
-    def _build_unstructured_grid(self, mesh: MeshData) -> vtkUnstructuredGrid:
-        vtk_points = vtkPoints()
-        vtk_points.SetData(numpy_to_vtk(mesh.points, deep=True))
+    def _build_unstructured_grid(
+        self,
+        mesh: MeshData,
+        points: vtkPoints | None = None,
+    ) -> vtkUnstructuredGrid:
+        vtk_points = points if points is not None else _build_points(mesh.points)[0]
 
-        cell_array = vtkCellArray()
         vtk_type = _ELEMENT_TYPE_TO_VTK.get(mesh.cell_type)
         if vtk_type is None:
             msg = f"Unsupported cell type: {mesh.cell_type}"
             raise ValueError(msg)
-
-        for cell in mesh.connectivity:
-            ids = vtkIdList()
-            for idx in cell:
-                ids.InsertNextId(int(idx))
-            cell_array.InsertNextCell(ids)
+        cell_array = _build_cell_array(mesh.connectivity)
 
         grid = vtkUnstructuredGrid()
         grid.SetPoints(vtk_points)
         grid.SetCells(vtk_type, cell_array)
+        grid.cell_array = cell_array
         return grid
 
     def _pick_color(self, zone_idx: int, section_idx: int) -> tuple[float, float, float]:
@@ -215,20 +1422,25 @@ class SceneManager:
         base_index = (zone_idx * len(palette) + section_idx) % len(palette)
         return palette[base_index]
 
+    @_pipeline_work
     def set_render_style(self, style: RenderStyle) -> None:
         if style == self._style:
             return
 
         self._style = style
-        for actor in self._actors.values():
-            self._apply_style(actor)
+        for (_, _, highlighted), prop in self._properties.items():
+            self._style_property(prop, highlighted)
+        for batch in self._batches:
+            self._apply_style(batch.actor)
+        # 线框模式绘制每条边一次的线数据，而不是让每个单元各自光栅化其边
+        self._refresh_inputs()
 
     def get_render_style(self) -> RenderStyle:
         return self._style
 
     def highlight(self, key: tuple[str, int] | None) -> None:
         """高亮单个 section"""
-        if key is not None and key not in self._actors:
+        if key is not None and key not in self._section_visibility:
             key = None
 
         if key is not None and not self.is_section_visible(key):
@@ -238,110 +1450,414 @@ class SceneManager:
             return
 
         self._highlighted = key
-        for section_key, actor in self._actors.items():
-            base_color = self._base_colors.get(section_key)
-            if section_key == key:
-                self._apply_highlight(section_key, actor, base_color)
-            else:
-                self._apply_base_style(section_key, actor, base_color)
-    
+        self._set_highlighted(set() if key is None else {key})
+
+    def mark_cell(self, key: tuple[str, int] | None, cell: int | None = None) -> Bounds | None:
+        """Outline cell ``cell`` (a connectivity row) of section ``key``; return its bounds.
+
+        ``key=None`` removes the outline.  The outline is drawn with thick
+        lines in a fixed colour and is not pickable.
+        """
+
+        if self._cell_marker is not None:
+            self._renderer.RemoveActor(self._cell_marker)
+            self._cell_marker = None
+        section = self._model.section(key) if key in self._section_visibility else None
+        if section is None or cell is None or not 0 <= cell < section.mesh.connectivity.shape[0]:
+            return None
+        mesh = section.mesh
+        # 只读取这一个单元的连接关系和节点坐标，未加载的 section 保持未加载
+        nodes, local = np.unique(take_rows(mesh.connectivity, [cell])[0], return_inverse=True)
+        cell_mesh = MeshData(
+            points=np.asarray(take_rows(mesh.points, nodes), dtype=float),
+            connectivity=local.reshape(1, -1),
+            cell_type=mesh.cell_type,
+        )
+        mapper = vtkPolyDataMapper()
+        mapper.SetInputData(_build_lines(cell_mesh.points, section_edges(cell_mesh)))
+        actor = vtkActor()
+        actor.SetMapper(mapper)
+        actor.PickableOff()
+        prop = actor.GetProperty()
+        prop.SetColor(*_CELL_MARKER_COLOR)
+        prop.SetLineWidth(4.0)
+        prop.LightingOff()
+        self._renderer.AddActor(actor)
+        self._cell_marker = actor
+        return cell_mesh.bounds()
+
+    @property
+    def locators_pending(self) -> bool:
+        """Whether cell locators for :meth:`pick_cell` are still being built."""
+
+        return self._locators.pending > 0
+
+    def pick_cell(
+        self,
+        start: tuple[float, float, float],
+        end: tuple[float, float, float],
+        *,
+        tolerance: float = 0.0,
+    ) -> CellPick | None:
+        """Nearest cell of a visible section on the segment from ``start`` to ``end``.
+
+        Sections are tested nearest bounding box first, each against its
+        cached static cell locator, and the search stops at the first box
+        beyond the best hit; the cost depends on the sections along the ray,
+        not on the cell count of the scene.  Missing locators are built on
+        this thread up to :data:`LOCATOR_SYNC_CELLS` cells in total; the
+        others, and those of every section the ray crosses after that, are
+        built by the surface workers, if any.  ``tolerance`` is a distance in
+        world units.  Returns ``None`` when nothing is hit, and also when a
+        locator the ray needs is still being built (see
+        :attr:`locators_pending`).
+        """
+
+        self._locators.take_ready()
+        self._collect_failures()
+        candidates = self._ray_candidates(start, end, tolerance)
+        budget = LOCATOR_SYNC_CELLS
+
+        def geometry(key: tuple[str, int]) -> vtkPolyData | None:
+            # 本次点击内构建的单元数有上限，超出的 section 交给后台线程
+            nonlocal budget
+            cells = self._model.section(key).mesh.connectivity.shape[0]
+            build = key not in self._locators and not self._locators.is_pending(key)
+            if build and cells <= budget:
+                budget -= cells
+                return self._pick_geometry(key, background=False)
+            return self._pick_geometry(key, background=True)
+
+        hit = _first_hit(start, end, tolerance, candidates, geometry)
+        self._collect_failures()
+        if hit is None:
+            if self._locators.background:
+                # 等待中的定位器使搜索提前结束：其余 section 也在后台开始构建
+                for _, key in candidates:
+                    if key not in self._locators and key not in self._unpickable:
+                        self._pick_geometry(key, background=True)
+            return None
+        key, row, point = hit
+        return self.describe_cell(key, row, position=point)
+
+    def ray_crosses_unpickable(
+        self,
+        start: tuple[float, float, float],
+        end: tuple[float, float, float],
+        *,
+        tolerance: float = 0.0,
+    ) -> bool:
+        """Whether the segment crosses the box of a visible section whose locator failed.
+
+        :meth:`pick_cell` skips such sections, so a hit it returns may lie
+        behind one of them.
+        """
+
+        self._collect_failures()
+        if not self._unpickable:
+            return False
+        entries = _segment_entries(
+            self._bounds_table,
+            np.asarray(start, dtype=float),
+            np.asarray(end, dtype=float),
+            tolerance,
+        )
+        rows = np.flatnonzero(np.isfinite(entries) & self._visible_rows)
+        return any(self._bounds_keys[i] in self._unpickable for i in rows)
+
+    def ray_query(
+        self,
+        start: tuple[float, float, float],
+        end: tuple[float, float, float],
+        *,
+        tolerance: float = 0.0,
+    ) -> RayQuery | None:
+        """The visible sections the segment may hit, with their pick geometry.
+
+        The returned :class:`RayQuery` can run on another thread.  Unlike
+        :meth:`pick_cell`, missing locators are always left to the surface
+        workers, if any; ``None`` means some of them are still being built.
+        """
+
+        self._locators.take_ready()
+        self._collect_failures()
+        candidates = self._ray_candidates(start, end, tolerance)
+        geometry = {}
+        for _, key in candidates:
+            polydata = self._pick_geometry(key, background=True)
+            if polydata is not None:
+                geometry[key] = polydata
+        if len(geometry) < len(candidates):
+            return None
+        return RayQuery(
+            start=start,
+            end=end,
+            tolerance=tolerance,
+            candidates=tuple(candidates),
+            geometry=geometry,
+        )
+
+    def _ray_candidates(
+        self,
+        start: tuple[float, float, float],
+        end: tuple[float, float, float],
+        tolerance: float,
+    ) -> list[tuple[float, tuple[str, int]]]:
+        """Visible sections whose box the segment crosses, nearest entry parameter first."""
+
+        entries = _segment_entries(
+            self._bounds_table,
+            np.asarray(start, dtype=float),
+            np.asarray(end, dtype=float),
+            tolerance,
+        )
+        rows = np.flatnonzero(np.isfinite(entries) & self._visible_rows)
+        entries = entries[rows]
+        order = np.argsort(entries, kind="stable")
+        keys = self._bounds_keys
+        return [
+            (float(entries[i]), keys[rows[i]])
+            for i in order
+            if keys[rows[i]] not in self._unpickable
+        ]
+
+    def _pick_geometry(self, key: tuple[str, int], *, background: bool) -> vtkPolyData | None:
+        return self._locators.request(key, self._model.section(key).mesh, background=background)
+
+    def describe_cell(
+        self,
+        key: tuple[str, int],
+        cell: int,
+        *,
+        position: tuple[float, float, float] | None = None,
+    ) -> CellPick | None:
+        """Element id, node ids and coordinates of cell ``cell`` (a connectivity row) of ``key``."""
+
+        section = self._model.section(key) if key in self._section_visibility else None
+        if section is None or not 0 <= cell < section.mesh.connectivity.shape[0]:
+            return None
+        mesh = section.mesh
+        nodes = take_rows(mesh.connectivity, [cell])[0]
+        coordinates = np.asarray(take_rows(mesh.points, nodes), dtype=float)
+        return CellPick(
+            key=key,
+            cell=cell,
+            element_id=section.range[0] + cell,
+            node_ids=tuple(int(node) + 1 for node in mesh.to_global(nodes)),
+            coordinates=tuple(
+                (float(x), float(y), float(z)) for x, y, z in coordinates
+            ),
+            position=position,
+        )
+
+    @property
+    def hovered(self) -> tuple[str, int] | None:
+        return self._hovered
+
+    def hover(self, key: tuple[str, int] | None) -> bool:
+        """Pre-highlight section ``key`` with a lighter tint than a selection.
+
+        ``None``, hidden and unknown sections clear it.  Returns whether the
+        hovered section changed, i.e. whether a render is needed.
+        """
+
+        if key is not None and not self._section_visibility.get(key, False):
+            key = None
+        previous = self._hovered
+        if key == previous:
+            return False
+        self._hovered = key
+        for changed in (previous, key):
+            if changed is not None:
+                self._restyle(changed)
+        return True
+
     def highlight_multiple(self, keys: list[tuple[str, int]]) -> None:
         """高亮多个 sections（用于 Family 选择）"""
         # 过滤出存在且可见的 keys
         valid_keys = set()
         for key in keys:
-            if key in self._actors and self.is_section_visible(key):
+            if self.has_actor(key) and self.is_section_visible(key):
                 valid_keys.add(key)
-        
+
         # 清除单个高亮状态
         self._highlighted = None
-        
-        # 应用高亮样式
-        for section_key, actor in self._actors.items():
-            base_color = self._base_colors.get(section_key)
-            if section_key in valid_keys:
-                self._apply_highlight(section_key, actor, base_color)
-            else:
-                self._apply_base_style(section_key, actor, base_color)
+        self._set_highlighted(valid_keys)
+
+    def _set_highlighted(self, keys: set[tuple[str, int]]) -> None:
+        # 只重设高亮状态发生变化的 sections
+        changed = self._highlighted_keys ^ keys
+        self._highlighted_keys = keys
+        for key in changed:
+            self._restyle(key)
+
+    def _restyle(self, key: tuple[str, int]) -> None:
+        highlighted = key in self._highlighted_keys
+        hovered = key == self._hovered
+        if key in self._batch_of:
+            self._style_batched(key, highlighted=highlighted, hovered=hovered)
+            return
+        actor = self._actors.get(key)
+        if actor is None:
+            return
+        base_color = self._base_colors.get(key)
+        if highlighted:
+            self._apply_highlight(key, actor, base_color)
+        else:
+            self._apply_base_style(key, actor, base_color, hovered=hovered)
 
     def _apply_style(self, actor: vtkActor) -> None:
         prop = actor.GetProperty()
-        if self._style is RenderStyle.WIREFRAME:
+        if self._style is not RenderStyle.SURFACE:
             prop.SetRepresentationToWireframe()
             prop.EdgeVisibilityOff()
         else:
             prop.SetRepresentationToSurface()
             prop.EdgeVisibilityOff()
 
+    def _style_property(self, prop: vtkProperty, highlighted: bool) -> None:
+        if self._style is not RenderStyle.SURFACE:
+            prop.SetRepresentationToWireframe()
+            prop.EdgeVisibilityOff()
+        else:
+            prop.SetRepresentationToSurface()
+            # Show edges on highlighted sections in surface mode
+            prop.SetEdgeVisibility(highlighted)
+        prop.SetLineWidth(2.0 if highlighted else 1.0)
+
+    def _shared_property(
+        self,
+        color: tuple[float, float, float],
+        opacity: float,
+        highlighted: bool,
+    ) -> vtkProperty:
+        cache_key = (color, opacity, highlighted)
+        prop = self._properties.get(cache_key)
+        if prop is None:
+            prop = vtkProperty()
+            prop.SetColor(*(_highlight_color(color) if highlighted else color))
+            prop.SetOpacity(opacity)
+            prop.SetEdgeColor(0.15, 0.15, 0.15)
+            self._style_property(prop, highlighted)
+            self._properties[cache_key] = prop
+        return prop
+
     def _apply_highlight(
         self,
         key: tuple[str, int],
         actor: vtkActor,
         base_color: tuple[float, float, float] | None,
     ) -> None:
-        prop = actor.GetProperty()
-        color = base_color or prop.GetColor()
-        highlight = tuple(min(component + 0.25, 1.0) for component in color)
-        prop.SetColor(*highlight)
-        prop.SetLineWidth(2.0)
-        # Show edges in wireframe mode or when highlighted
-        if self._style is RenderStyle.WIREFRAME:
-            prop.EdgeVisibilityOff()
-        else:
-            prop.EdgeVisibilityOn()
-        prop.SetOpacity(self._opacity_for_key(key))
+        color = base_color or actor.GetProperty().GetColor()
+        actor.SetProperty(self._shared_property(color, self._opacity_for_key(key), True))
 
     def _apply_base_style(
         self,
         key: tuple[str, int],
         actor: vtkActor,
         base_color: tuple[float, float, float] | None,
+        *,
+        hovered: bool = False,
     ) -> None:
-        prop = actor.GetProperty()
-        if base_color is not None:
-            prop.SetColor(*base_color)
-        prop.SetLineWidth(1.0)
-        # Hide edges in surface mode, show in wireframe mode
-        if self._style is RenderStyle.WIREFRAME:
-            prop.EdgeVisibilityOff()
-        else:
-            prop.EdgeVisibilityOff()
-        prop.SetOpacity(self._opacity_for_key(key))
+        color = base_color or actor.GetProperty().GetColor()
+        if hovered:
+            color = _hover_color(color)
+        actor.SetProperty(self._shared_property(color, self._opacity_for_key(key), False))
 
     def set_section_transparency(self, key: tuple[str, int], value: float) -> None:
-        if key not in self._actors:
-            return
+        self.set_sections_transparency([key], value)
+
+    def set_sections_transparency(self, keys: Iterable[tuple[str, int]], value: float) -> None:
+        """Apply one transparency to all ``keys`` in a single pass."""
+
         clamped = float(max(0.0, min(1.0, value)))
-        self._section_transparency[key] = clamped
-        base_color = self._base_colors.get(key)
-        actor = self._actors[key]
-        if self._highlighted == key:
-            self._apply_highlight(key, actor, base_color)
-        else:
-            self._apply_base_style(key, actor, base_color)
+        for key in keys:
+            if key not in self._section_visibility:
+                continue
+            self._section_transparency[key] = clamped
+            self._restyle(key)
 
     def get_section_transparency(self, key: tuple[str, int]) -> float | None:
         return self._section_transparency.get(key)
 
+    def set_sections_color(
+        self,
+        keys: Iterable[tuple[str, int]],
+        color: tuple[float, float, float],
+    ) -> None:
+        """Replace the base colour of all ``keys`` (highlighted ones stay brightened)."""
+
+        color = tuple(float(component) for component in color)
+        for key in keys:
+            if key not in self._section_visibility:
+                continue
+            self._base_colors[key] = color
+            self._restyle(key)
+
+    def get_section_color(self, key: tuple[str, int]) -> tuple[float, float, float] | None:
+        return self._base_colors.get(key)
+
     def set_section_visible(self, key: tuple[str, int], visible: bool) -> bool:
-        if key not in self._actors:
-            return False
-        actor = self._actors[key]
-        current = self._section_visibility.get(key, True)
-        if current == visible:
-            return False
-        self._section_visibility[key] = visible
-        actor.SetVisibility(1 if visible else 0)
-        actor.SetPickable(1 if visible else 0)
-        base_color = self._base_colors.get(key)
-        if not visible and self._highlighted == key:
-            self._highlighted = None
-        if visible:
-            if self._highlighted == key:
-                self._apply_highlight(key, actor, base_color)
+        return bool(self.set_sections_visible([key], visible))
+
+    @_pipeline_work
+    def set_sections_visible(
+        self,
+        keys: Iterable[tuple[str, int]],
+        visible: bool,
+    ) -> list[tuple[str, int]]:
+        """Show or hide all ``keys`` at once; return the keys whose state changed.
+
+        Batched sections are regrouped so that every batch rebuilds its cells
+        only once, and hidden sections leave the highlight in one diff.
+        """
+
+        changed = [
+            key
+            for key in dict.fromkeys(keys)
+            if key in self._section_visibility and self._section_visibility[key] != visible
+        ]
+        if not changed:
+            return changed
+        batches: dict[int, tuple[_SectionBatch, list[int]]] = {}
+        for key in changed:
+            self._section_visibility[key] = visible
+            batched = self._batch_of.get(key)
+            if batched is not None:
+                batch, index = batched
+                batches.setdefault(id(batch), (batch, []))[1].append(index)
+                continue
+            actor = self._actors.get(key)
+            if actor is None:
+                if not visible:
+                    continue
+                actor = self._ensure_actor(key)
             else:
-                self._apply_base_style(key, actor, base_color)
-        return True
+                self._refresh_input(key)
+            actor.SetVisibility(1 if visible else 0)
+            actor.SetPickable(1 if visible else 0)
+        for batch, indices in batches.values():
+            batch.set_visible(indices, visible)
+        self._update_visible_envelope(changed, visible)
+        if not visible:
+            if self._hovered in changed:
+                self.hover(None)
+            hidden = self._highlighted_keys.intersection(changed)
+            if self._highlighted in hidden:
+                self._highlighted = None
+            if hidden:
+                self._set_highlighted(self._highlighted_keys - hidden)
+        return changed
+
+    def _update_visible_envelope(self, keys: list[tuple[str, int]], visible: bool) -> None:
+        rows = [self._bounds_row[key] for key in keys]
+        self._visible_rows[rows] = visible
+        if not visible:
+            # 隐藏可能缩小包围盒，下次使用时再做一次向量化归约
+            self._visible_envelope_valid = False
+        elif self._visible_envelope_valid:
+            bounds = [self._bounds_of(key) for key in keys]
+            self._visible_envelope = _union_bounds([self._visible_envelope, *bounds])
 
     def is_section_visible(self, key: tuple[str, int]) -> bool:
         return self._section_visibility.get(key, True)
@@ -2,54 +2,188 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import QObject, Signal
-from PySide6.QtWidgets import QTreeWidget
+import math
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtWidgets import QTreeView
 from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
-from vtkmodules.vtkRenderingCore import vtkActor, vtkCellPicker
+from vtkmodules.vtkRenderingCore import vtkActor, vtkCellPicker, vtkRenderer
+
+from .rendering import RenderScheduler
+from .scene import CellPick, RayQuery, SceneManager
+
+# Pick tolerance as a fraction of the window diagonal, as for vtkCellPicker
+PICK_TOLERANCE = 0.0005
+
+# Hover picks per second while the mouse moves over the view
+DEFAULT_HOVER_RATE = 30.0
+
+# vtkInteractorStyle state while no camera interaction is in progress
+_STYLE_IDLE = 0
+
+Point = tuple[float, float, float]
+
+
+def _display_to_world(renderer: vtkRenderer, x: float, y: float, z: float) -> Point:
+    renderer.SetDisplayPoint(x, y, z)
+    renderer.DisplayToWorld()
+    wx, wy, wz, w = renderer.GetWorldPoint()
+    return (wx / w, wy / w, wz / w)
+
 
-from .scene import SceneManager
+def pick_ray(renderer: vtkRenderer, x: float, y: float) -> tuple[Point, Point, float]:
+    """World segment under display position ``(x, y)`` and a pick tolerance.
+
+    The segment runs from the near to the far clipping plane; the tolerance
+    is :data:`PICK_TOLERANCE` of the window diagonal, measured in world units
+    at the depth of the focal point.
+    """
+
+    camera = renderer.GetActiveCamera()
+    renderer.SetWorldPoint(*camera.GetFocalPoint(), 1.0)
+    renderer.WorldToDisplay()
+    depth = renderer.GetDisplayPoint()[2]
+    width, height = renderer.GetSize()
+    diagonal = math.dist(
+        _display_to_world(renderer, 0.0, 0.0, depth),
+        _display_to_world(renderer, float(width), float(height), depth),
+    )
+    start = _display_to_world(renderer, x, y, 0.0)
+    end = _display_to_world(renderer, x, y, 1.0)
+    return start, end, PICK_TOLERANCE * diagonal
 
 
 class SelectionController(QObject):
-    """Coordinate section selection between the tree view and VTK actors."""
+    """Coordinate section selection between the tree view and VTK actors.
+
+    A click is resolved to a single cell with :meth:`SceneManager.pick_cell`;
+    ``cellPicked`` follows ``sectionChanged`` with the :class:`CellPick`, or
+    ``None`` when the click hit nothing.  While the scene is still building
+    the cell locators a click needs, the click falls back to a
+    ``vtkCellPicker`` pass that only resolves the section.
+
+    With :meth:`set_hover_enabled` the section under the mouse is
+    pre-highlighted (:meth:`SceneManager.hover`).  Mouse moves only record
+    the position; at most ``hover_rate`` times per second a timer turns it
+    into a :class:`RayQuery`, which runs on a worker thread against the
+    scene's cell locators.  A newer position cancels the query in flight and
+    results of superseded queries are dropped.
+    """
 
     sectionChanged = Signal(object)
+    cellPicked = Signal(object)
+    # (generation, key) of a finished hover query, emitted from the worker
+    hoverFinished = Signal(object)
 
     def __init__(
         self,
         scene: SceneManager,
-        tree: QTreeWidget,
+        tree: QTreeView,
         interactor: QVTKRenderWindowInteractor,
         parent: QObject | None = None,
+        *,
+        render_scheduler: RenderScheduler | None = None,
+        hover_rate: float = DEFAULT_HOVER_RATE,
     ) -> None:
         super().__init__(parent)
         self._scene = scene
+        self._render_scheduler = render_scheduler
         self._tree = tree
         self._interactor = interactor
         self._updating = False
+        self._last_pick_seconds: float | None = None
+        self._last_pick: CellPick | None = None
 
         self._picker = vtkCellPicker()
         self._picker.SetTolerance(0.0005)
         self._picker.PickFromListOn()
 
+        self._hover_enabled = False
+        self._hover_interval = 1.0 / hover_rate
+        self._hover_position: tuple[int, int] | None = None
+        # Bumped whenever the query in flight is superseded
+        self._hover_generation = 0
+        self._hover_future: Future | None = None
+        self._hover_executor: ThreadPoolExecutor | None = None
+        self._last_hover_started = float("-inf")
+        self._last_hover_seconds: float | None = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.timeout.connect(self._start_hover_query)
+        self.hoverFinished.connect(self._on_hover_finished)
+
         self._tree.itemSelectionChanged.connect(self._on_tree_selection)
         self._interactor.AddObserver(
             "LeftButtonPressEvent",
             self._on_left_button_press,
             1.0,
         )
+        self._interactor.AddObserver("MouseMoveEvent", self._on_mouse_move, 1.0)
+        self._interactor.AddObserver("LeaveEvent", self._on_mouse_leave, 1.0)
+
+    @property
+    def last_pick_seconds(self) -> float | None:
+        """Time the last click took to resolve a section, ``None`` before any pick."""
+
+        return self._last_pick_seconds
+
+    @property
+    def last_pick(self) -> CellPick | None:
+        """Cell hit by the last click, ``None`` if it hit none or only resolved a section."""
+
+        return self._last_pick
+
+    @property
+    def last_hover_seconds(self) -> float | None:
+        """GUI-thread time of the last hover query, ``None`` before any."""
+
+        return self._last_hover_seconds
+
+    @property
+    def hover_enabled(self) -> bool:
+        return self._hover_enabled
+
+    def set_hover_enabled(self, enabled: bool) -> None:
+        """Turn pre-highlighting of the section under the mouse on or off."""
+
+        if enabled == self._hover_enabled:
+            return
+        self._hover_enabled = enabled
+        if not enabled:
+            self._clear_hover()
+
+    @property
+    def hover_rate(self) -> float:
+        return 1.0 / self._hover_interval
+
+    @hover_rate.setter
+    def hover_rate(self, rate: float) -> None:
+        """Change the maximum number of hover queries per second."""
+
+        self._hover_interval = 1.0 / rate
+
+    def close(self) -> None:
+        """Stop the hover worker; call before the scene is closed."""
+
+        self._hover_timer.stop()
+        self._cancel_hover()
+        if self._hover_executor is not None:
+            self._hover_executor.shutdown(wait=False, cancel_futures=True)
+            self._hover_executor = None
 
     def sync_scene(self) -> None:
         """Refresh pick list after actors change."""
 
         self._picker.InitializePickList()
-        for key, actor in self._scene.iter_actor_items():
-            if self._scene.is_section_visible(key):
-                self._picker.AddPickList(actor)
+        for actor in self._scene.iter_pickable_actors():
+            self._picker.AddPickList(actor)
 
     def clear(self) -> None:
         """Clear current selection state."""
 
+        self._cancel_hover()
         self._updating = True
         try:
             self._scene.highlight(None)
@@ -59,6 +193,25 @@ class SelectionController(QObject):
         finally:
             self._updating = False
 
+    def select(self, key: tuple[str, int] | None, *, hidden: bool = False) -> None:
+        """Select section ``key`` in the scene and the tree, as a click on it does.
+
+        Hidden or unknown sections clear the selection; with ``hidden=True`` a
+        hidden section is still selected in the tree, with nothing highlighted.
+        """
+
+        if key is not None and not self._scene.is_section_visible(key) and not hidden:
+            key = None
+
+        self._updating = True
+        try:
+            self._scene.highlight(key)
+            if hasattr(self._tree, "select_section"):
+                self._tree.select_section(key)  # type: ignore[attr-defined]
+            self.sectionChanged.emit(key)
+        finally:
+            self._updating = False
+
     def _on_tree_selection(self) -> None:
         if self._updating:
             return
@@ -66,15 +219,19 @@ class SelectionController(QObject):
         key = None
         family_keys = None
         
-        current_item = self._tree.currentItem()
+        current_index = self._tree.currentIndex()
         
+        # 多选时高亮所有选中的 sections，与 Family 节点的处理相同
+        selected_rows = self._tree.selectionModel().selectedRows(0)
+        if len(selected_rows) > 1 and hasattr(self._tree, "selected_section_keys"):
+            family_keys = self._tree.selected_section_keys()  # type: ignore[attr-defined]
         # 检查是否是 Family 节点
-        if hasattr(self._tree, "get_family_sections"):
-            family_keys = self._tree.get_family_sections(current_item)  # type: ignore[attr-defined]
+        elif hasattr(self._tree, "get_family_sections"):
+            family_keys = self._tree.get_family_sections(current_index)  # type: ignore[attr-defined]
         
         # 如果不是 Family，获取单个 section key
         if family_keys is None and hasattr(self._tree, "section_key"):
-            key = self._tree.section_key(current_item)  # type: ignore[attr-defined]
+            key = self._tree.section_key(current_index)  # type: ignore[attr-defined]
 
         self._updating = True
         try:
@@ -82,50 +239,134 @@ class SelectionController(QObject):
                 # Family 节点：高亮所有相关 sections
                 visible_keys = [k for k in family_keys if self._scene.is_section_visible(k)]
                 self._scene.highlight_multiple(visible_keys)
-                # 立即刷新渲染
-                self._interactor.GetRenderWindow().Render()
+                self._request_render()
                 # 发送第一个 key 用于详情显示，或者 None
                 self.sectionChanged.emit(visible_keys[0] if visible_keys else None)
             elif key is None:
                 # 无选择
                 self._scene.highlight(None)
-                self._interactor.GetRenderWindow().Render()
+                self._request_render()
                 self.sectionChanged.emit(None)
             elif self._scene.is_section_visible(key):
                 # 单个 section 节点
                 self._scene.highlight(key)
-                self._interactor.GetRenderWindow().Render()
+                self._request_render()
                 self.sectionChanged.emit(key)
             else:
                 # Section 不可见
                 self._scene.highlight(None)
-                self._interactor.GetRenderWindow().Render()
+                self._request_render()
                 self.sectionChanged.emit(None)
         finally:
             self._updating = False
 
+    def _request_render(self) -> None:
+        if self._render_scheduler is not None:
+            self._render_scheduler.request()
+        else:
+            self._interactor.GetRenderWindow().Render()
+
+    def pick(self, x: float, y: float) -> CellPick | None:
+        """Select what is under display position ``(x, y)``, as a left click does."""
+
+        start = time.perf_counter()
+        ray_start, ray_end, tolerance = pick_ray(self._scene.renderer, x, y)
+        pick = self._scene.pick_cell(ray_start, ray_end, tolerance=tolerance)
+        key = None if pick is None else pick.key
+        # 定位器构建失败的 section 不参与 pick_cell：射线穿过它们时改用 vtkCellPicker
+        crosses_unpickable = self._scene.ray_crosses_unpickable(
+            ray_start, ray_end, tolerance=tolerance
+        )
+        if (pick is None and self._scene.locators_pending) or crosses_unpickable:
+            self._picker.Pick(x, y, 0, self._scene.renderer)
+            actor: vtkActor | None = self._picker.GetActor()
+            # 合批的 actor 需要拾取到的单元编号才能确定 section
+            picked = self._scene.get_key_for_actor(actor, self._picker.GetCellId())
+            if pick is None or (picked is not None and picked != pick.key):
+                # 更近的是无法精确拾取的 section：只选中 section，不给出单元
+                pick = None
+                key = picked
+        self._last_pick_seconds = time.perf_counter() - start
+        self._last_pick = pick
+        self.select(key)
+        if pick is not None:
+            self._scene.mark_cell(pick.key, pick.cell)
+        self.cellPicked.emit(pick)
+        return pick
+
     def _on_left_button_press(self, obj, event) -> None:  # noqa: ANN001, D401
         click_pos = self._interactor.GetEventPosition()
-        self._picker.Pick(click_pos[0], click_pos[1], 0, self._scene.renderer)
-        actor: vtkActor | None = self._picker.GetActor()
-        key = self._scene.get_key_for_actor(actor)
-        if key is not None and not self._scene.is_section_visible(key):
-            key = None
-
-        self._updating = True
-        try:
-            if key is not None:
-                self._scene.highlight(key)
-                if hasattr(self._tree, "select_section"):
-                    self._tree.select_section(key)  # type: ignore[attr-defined]
-            else:
-                self._scene.highlight(None)
-                if hasattr(self._tree, "select_section"):
-                    self._tree.select_section(None)  # type: ignore[attr-defined]
-            self.sectionChanged.emit(key)
-        finally:
-            self._updating = False
+        self.pick(click_pos[0], click_pos[1])
 
         style = self._interactor.GetInteractorStyle()
         if style is not None:
-            style.OnLeftButtonDown()
\ No newline at end of file
+            style.OnLeftButtonDown()
+
+    def _on_mouse_move(self, obj, event) -> None:  # noqa: ANN001
+        if not self._hover_enabled:
+            return
+        # 相机交互过程中不做悬停拾取
+        style = self._interactor.GetInteractorStyle()
+        if style is not None and style.GetState() != _STYLE_IDLE:
+            return
+        # 只记录位置；查询按 hover_rate 节流，由计时器发起
+        self._hover_position = self._interactor.GetEventPosition()
+        if not self._hover_timer.isActive():
+            delay = self._hover_interval - (time.perf_counter() - self._last_hover_started)
+            self._hover_timer.start(round(max(delay, 0.0) * 1000))
+
+    def _on_mouse_leave(self, obj, event) -> None:  # noqa: ANN001
+        if self._hover_enabled:
+            self._clear_hover()
+
+    def _start_hover_query(self) -> None:
+        position = self._hover_position
+        if not self._hover_enabled or position is None:
+            return
+        started = time.perf_counter()
+        self._last_hover_started = started
+        self._cancel_hover()
+        ray_start, ray_end, tolerance = pick_ray(self._scene.renderer, *position)
+        query = self._scene.ray_query(ray_start, ray_end, tolerance=tolerance)
+        if query is None:
+            # 定位器仍在后台构建：按节流间隔重试同一位置
+            self._hover_timer.start(round(self._hover_interval * 1000))
+        else:
+            if self._hover_executor is None:
+                self._hover_executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="cgns-hover",
+                )
+            self._hover_future = self._hover_executor.submit(
+                self._run_hover_query,
+                query,
+                self._hover_generation,
+            )
+        self._last_hover_seconds = time.perf_counter() - started
+
+    def _run_hover_query(self, query: RayQuery, generation: int) -> None:
+        # 工作线程：新的查询发起后当前查询即被放弃
+        hit = query.run(lambda: generation != self._hover_generation)
+        if generation == self._hover_generation:
+            self.hoverFinished.emit((generation, None if hit is None else hit[0]))
+
+    def _on_hover_finished(self, payload: tuple[int, tuple[str, int] | None]) -> None:
+        generation, key = payload
+        if generation != self._hover_generation or not self._hover_enabled:
+            return
+        self._hover_future = None
+        if self._scene.hover(key):
+            self._request_render()
+
+    def _cancel_hover(self) -> None:
+        self._hover_generation += 1
+        if self._hover_future is not None:
+            self._hover_future.cancel()
+            self._hover_future = None
+
+    def _clear_hover(self) -> None:
+        self._hover_timer.stop()
+        self._hover_position = None
+        self._cancel_hover()
+        if self._scene.hover(None):
+            self._request_render()
@@ -0,0 +1,200 @@
+"""Boundary surfaces of volume sections, extracted once and cached.
+
+Drawing a volume section through ``vtkDataSetMapper`` makes the mapper run
+its internal surface filter over every cell, which is slow for large
+sections.  :class:`SurfaceCache` holds the exterior faces of each shown
+volume section (see :func:`~cgns_gui.model.external_faces`) as
+``vtkPolyData``, so the scene can draw them with a ``vtkPolyDataMapper``.
+Extraction can run on worker threads, and the cache is size-capped with the
+least recently used surfaces evicted first.  The scene keeps its decimated
+level-of-detail proxies and its pick locators in caches of the same kind.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+
+DEFAULT_MAX_BYTES = 512 << 20
+
+# Cell-data array mapping every surface face to its cell in the section
+ORIGINAL_CELL_IDS = "vtkOriginalCellIds"
+
+
+def surface_bytes(surface: vtkPolyData) -> int:
+    """Memory held by ``surface``, in bytes."""
+
+    return surface.GetActualMemorySize() * 1024
+
+
+class SurfaceCache:
+    """Size-capped LRU cache of section surfaces.
+
+    ``extract`` turns the source passed to :meth:`request` (for surfaces, a
+    section's :class:`~cgns_gui.model.MeshData`) into polydata.  With
+    ``workers=0`` :meth:`request` extracts synchronously; otherwise
+    extraction runs on a thread pool.  Finished surfaces are only
+    added to the cache by :meth:`take_ready`, on the thread that owns the
+    scene.  ``on_ready`` is called from the worker thread after each
+    extraction finishes.  Failed extractions are not cached; they are kept
+    for :meth:`take_failures`, and requesting the key again retries it.
+    ``size`` gives the bytes an entry is charged against ``max_bytes``; by
+    default the polydata's own memory (see :func:`surface_bytes`).
+    """
+
+    def __init__(
+        self,
+        extract: Callable[[Any], vtkPolyData],
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        workers: int = 0,
+        on_ready: Callable[[], None] | None = None,
+        size: Callable[[vtkPolyData], int] | None = None,
+    ) -> None:
+        self._extract = extract
+        self._size = surface_bytes if size is None else size
+        self._max_bytes = max_bytes
+        self._on_ready = on_ready
+        self._entries: OrderedDict[Hashable, tuple[vtkPolyData, int]] = OrderedDict()
+        self._total_bytes = 0
+        self._pending: dict[Hashable, Future] = {}
+        self._failures: list[tuple[Hashable, Exception]] = []
+        self._closed = False
+        self._executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cgns-surface")
+            if workers > 0
+            else None
+        )
+
+    @property
+    def background(self) -> bool:
+        return self._executor is not None
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> vtkPolyData | None:
+        """Return the cached surface of ``key`` and mark it recently used."""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def request(
+        self,
+        key: Hashable,
+        source: Any,
+        *,
+        background: bool = True,
+    ) -> vtkPolyData | None:
+        """Return the surface of ``key``, or ``None`` while it is being extracted.
+
+        ``background=False`` extracts on the calling thread even when there
+        are workers.  A failed synchronous extraction also returns ``None``.
+        """
+
+        surface = self.get(key)
+        if surface is not None or key in self._pending:
+            return surface
+        if self._executor is None or not background:
+            try:
+                surface = self._extract(source)
+            except Exception as error:  # noqa: BLE001
+                self._failures.append((key, error))
+                return None
+            self._store(key, surface)
+            return surface
+        future = self._executor.submit(self._extract, source)
+        self._pending[key] = future
+        future.add_done_callback(self._notify)
+        return None
+
+    @property
+    def pending(self) -> int:
+        """Number of extractions not yet taken by :meth:`take_ready`."""
+
+        return len(self._pending)
+
+    def is_pending(self, key: Hashable) -> bool:
+        return key in self._pending
+
+    def take_ready(self) -> list[Hashable]:
+        """Cache the surfaces finished by the workers; return their keys.
+
+        Extractions that raised are left for :meth:`take_failures`.
+        """
+
+        ready: list[Hashable] = []
+        for key, future in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[key]
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                self._failures.append((key, error))
+                continue
+            self._store(key, future.result())
+            ready.append(key)
+        return ready
+
+    def take_failures(self) -> list[tuple[Hashable, Exception]]:
+        """Keys whose extraction raised since the last call, with the exception."""
+
+        failures, self._failures = self._failures, []
+        return failures
+
+    def discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+    def clear(self) -> None:
+        """Drop every surface; pending extractions are cancelled or ignored."""
+
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._failures.clear()
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def close(self) -> None:
+        """Clear the cache and stop the workers without waiting for them."""
+
+        self._closed = True
+        self.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _notify(self, future: Future) -> None:
+        if self._on_ready is not None and not self._closed and not future.cancelled():
+            self._on_ready()
+
+    def _store(self, key: Hashable, surface: vtkPolyData) -> None:
+        self.discard(key)
+        size = self._size(surface)
+        self._entries[key] = (surface, size)
+        self._total_bytes += size
+        # The newest surface always stays, even when it alone exceeds the cap
+        while self._total_bytes > self._max_bytes and len(self._entries) > 1:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._total_bytes -= evicted
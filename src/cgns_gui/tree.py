@@ -0,0 +1,413 @@
+"""Lazily populated item model of a CGNS model for the sidebar tree.
+
+:class:`CgnsTreeModel` lists the families, zones and sections of a
+:class:`~cgns_gui.model.CgnsModel` without creating a row for each of them up
+front.  Every node keeps the zones or sections it has not shown yet and turns
+them into rows in batches of :data:`FETCH_BATCH` when a view asks for them
+through :meth:`~CgnsTreeModel.fetchMore`, that is when the node is expanded
+or scrolled to its end.  Lookups by section key work whether or not the row
+exists yet.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, QPersistentModelIndex, Qt
+
+from .model import CgnsModel, FamilyInfo, Section, SectionKey, Zone
+
+ModelIndex = QModelIndex | QPersistentModelIndex
+
+# Rows a node creates per fetchMore
+FETCH_BATCH = 256
+
+COLUMN_COUNT = 3
+
+_FAMILIES = ("families",)
+_BOUNDARIES = ("boundaries",)
+
+
+@dataclass(frozen=True, slots=True)
+class _SectionRow:
+    zone: Zone
+    section: Section
+    boundary: bool
+
+    @property
+    def ident(self) -> SectionKey:
+        return (self.zone.name, self.section.id)
+
+
+@dataclass(frozen=True, slots=True)
+class _BoundaryGroup:
+    """The "Boundary Conditions" row of a zone, for BCs without a shown family."""
+
+    zone: Zone
+    sections: tuple[Section, ...]
+
+    @property
+    def ident(self) -> tuple[str]:
+        return _BOUNDARIES
+
+
+class _Node:
+    __slots__ = (
+        "ident",
+        "parent",
+        "row",
+        "texts",
+        "data",
+        "selectable",
+        "children",
+        "rows",
+        "pending",
+    )
+
+    def __init__(
+        self,
+        ident: Any,
+        texts: list[str],
+        *,
+        data: Any = None,
+        selectable: bool = True,
+        pending: Iterable[Zone | _SectionRow | _BoundaryGroup] = (),
+    ) -> None:
+        self.ident = ident
+        self.parent: _Node | None = None
+        self.row = 0
+        self.texts = texts
+        self.data = data
+        self.selectable = selectable
+        self.children: list[_Node] = []
+        # ident of a child -> its row
+        self.rows: dict[Any, int] = {}
+        # Children not turned into rows yet, in display order after ``children``
+        self.pending: list[Zone | _SectionRow | _BoundaryGroup] = list(pending)
+
+
+class CgnsTreeModel(QAbstractItemModel):
+    """Families, zones and sections of a :class:`CgnsModel`, fetched on demand.
+
+    The Families group comes first, with each family listing the BC sections
+    of its zones.  A zone lists its body sections followed by a "Boundary
+    Conditions" group for the BCs whose family was not known when the zone
+    was added.  Section rows carry their ``(zone_name, section_id)`` key and
+    family rows ``("family", name)`` under ``Qt.UserRole``.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._root = _Node(None, [])
+        self._families_group: _Node | None = None
+        self._family_nodes: dict[str, _Node] = {}
+        self._family_cells: dict[str, int] = {}
+        # Sections listed under a family rather than under their zone: the
+        # model's family index also holds BCs of zones added before their
+        # family was known, which stay under their zone
+        self._section_family: dict[SectionKey, str] = {}
+        self._model = CgnsModel()
+
+    # --- Building -----------------------------------------------------------
+
+    def begin_model(self, model: CgnsModel) -> None:
+        """Clear the tree for ``model``; zones are then added with :meth:`add_zone`."""
+
+        self.beginResetModel()
+        self._root = _Node(None, [])
+        self._families_group = None
+        self._family_nodes.clear()
+        self._family_cells.clear()
+        self._section_family.clear()
+        self._model = model
+        self.endResetModel()
+        self.add_families(model.families)
+
+    def add_families(self, families: dict[str, FamilyInfo]) -> None:
+        """Add the families not shown yet, sorted by name."""
+
+        new_names = sorted(set(families) - self._family_nodes.keys())
+        if not new_names:
+            return
+        if self._families_group is None:
+            self._families_group = _Node(_FAMILIES, [self.tr("Families"), "", ""], selectable=False)
+            self._insert(self._root, 0, [self._families_group])
+        group = self._families_group
+        for family_name in new_names:
+            type_str = families[family_name].bc_type or "Family"
+            node = _Node(
+                ("family", family_name),
+                [family_name, type_str, ""],
+                data=("family", family_name),
+            )
+            position = sum(1 for name in self._family_nodes if name < family_name)
+            self._insert(group, position, [node])
+            self._family_nodes[family_name] = node
+
+    def add_zone(self, zone: Zone) -> None:
+        """Append ``zone``: its BC sections go under their family, the rest under the zone.
+
+        ``zone`` is added to the model first unless it is already there.
+        """
+
+        self._model.add_zone(zone)
+        touched: set[str] = set()
+        for section in zone.sections:
+            key = (zone.name, section.id)
+            family_name = section.boundary.family if section.boundary else None
+            family_node = self._family_nodes.get(family_name) if family_name else None
+            if family_node is None:
+                continue
+            self._section_family[key] = family_name
+            self._family_cells[family_name] = (
+                self._family_cells.get(family_name, 0) + section.mesh.connectivity.shape[0]
+            )
+            touched.add(family_name)
+            self._append(family_node, [_SectionRow(zone, section, boundary=True)])
+
+        if touched:
+            nodes = [self._family_nodes[family_name] for family_name in touched]
+            for node in nodes:
+                node.texts[2] = str(self._family_cells[node.data[1]])
+            # One notification for the rows of every family that gained sections
+            first = min(nodes, key=lambda node: node.row)
+            last = max(nodes, key=lambda node: node.row)
+            self.dataChanged.emit(self._index(first, 0), self._index(last, COLUMN_COUNT - 1))
+
+        self._append(self._root, [zone])
+
+    def _zone_node(self, zone: Zone) -> _Node:
+        pending: list[_SectionRow | _BoundaryGroup] = [
+            _SectionRow(zone, section, boundary=False) for section in zone.iter_body_sections()
+        ]
+        orphans = tuple(
+            section
+            for section in zone.iter_boundary_sections()
+            if (zone.name, section.id) not in self._section_family
+        )
+        if orphans:
+            pending.append(_BoundaryGroup(zone, orphans))
+        return _Node(
+            ("zone", zone.name),
+            [zone.name, self.tr("Zone"), str(zone.total_cells)],
+            pending=pending,
+        )
+
+    def _section_node(self, row: _SectionRow) -> _Node:
+        section = row.section
+        display_name = section.name
+        type_label = section.element_type
+        if row.boundary and section.boundary is not None:
+            display_name = section.boundary.name or section.name
+            location = section.boundary.grid_location
+            if location:
+                type_label = self.tr("Boundary ({element}, {location})").format(
+                    element=section.element_type,
+                    location=location,
+                )
+            else:
+                type_label = self.tr("Boundary ({element})").format(
+                    element=section.element_type,
+                )
+        cells = str(section.mesh.connectivity.shape[0])
+        return _Node(row.ident, [display_name, type_label, cells], data=row.ident)
+
+    def _make_node(self, source: Zone | _SectionRow | _BoundaryGroup) -> _Node:
+        if isinstance(source, Zone):
+            return self._zone_node(source)
+        if isinstance(source, _SectionRow):
+            return self._section_node(source)
+        return _Node(
+            _BOUNDARIES,
+            [self.tr("Boundary Conditions"), "", ""],
+            selectable=False,
+            pending=[
+                _SectionRow(source.zone, section, boundary=True) for section in source.sections
+            ],
+        )
+
+    def _append(self, node: _Node, sources: list[Zone | _SectionRow | _BoundaryGroup]) -> None:
+        node.pending.extend(sources)
+        # The root and nodes a view already opened show new rows up to a batch
+        # right away; the rest wait for the view to fetch them.
+        if node is self._root or node.children:
+            self._fetch(node, FETCH_BATCH - len(node.children))
+
+    def _fetch(self, node: _Node, count: int) -> None:
+        count = min(count, len(node.pending))
+        if count <= 0:
+            return
+        sources = node.pending[:count]
+        del node.pending[:count]
+        self._insert(node, len(node.children), [self._make_node(source) for source in sources])
+
+    def _insert(self, node: _Node, position: int, children: list[_Node]) -> None:
+        self.beginInsertRows(self._index(node), position, position + len(children) - 1)
+        node.children[position:position] = children
+        for row in range(position, len(node.children)):
+            child = node.children[row]
+            child.parent = node
+            child.row = row
+            node.rows[child.ident] = row
+        self.endInsertRows()
+
+    # --- QAbstractItemModel -------------------------------------------------
+
+    def _node(self, index: ModelIndex) -> _Node:
+        if not index.isValid():
+            return self._root
+        return index.internalPointer()
+
+    def _index(self, node: _Node, column: int = 0) -> QModelIndex:
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, column, node)
+
+    def index(self, row: int, column: int, parent: ModelIndex = QModelIndex()) -> QModelIndex:
+        node = self._node(parent)
+        if not (0 <= row < len(node.children) and 0 <= column < COLUMN_COUNT):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index: ModelIndex | None = None) -> Any:  # type: ignore[override]
+        if index is None:
+            # QObject.parent()
+            return QObject.parent(self)
+        if not index.isValid():
+            return QModelIndex()
+        return self._index(self._node(index).parent)
+
+    def rowCount(self, parent: ModelIndex = QModelIndex()) -> int:  # noqa: N802
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent: ModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return COLUMN_COUNT
+
+    def hasChildren(self, parent: ModelIndex = QModelIndex()) -> bool:  # noqa: N802
+        node = self._node(parent)
+        return bool(node.children or node.pending)
+
+    def canFetchMore(self, parent: ModelIndex) -> bool:  # noqa: N802
+        return bool(self._node(parent).pending)
+
+    def fetchMore(self, parent: ModelIndex) -> None:  # noqa: N802
+        self._fetch(self._node(parent), FETCH_BATCH)
+
+    def data(self, index: ModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node = self._node(index)
+        if role == Qt.DisplayRole:
+            return node.texts[index.column()]
+        if role == Qt.UserRole and index.column() == 0:
+            return node.data
+        return None
+
+    def flags(self, index: ModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if self._node(index).selectable:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled
+
+    def headerData(  # noqa: N802
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.DisplayRole,
+    ) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section < COLUMN_COUNT:
+            return (self.tr("Name"), self.tr("Type"), self.tr("Cells"))[section]
+        return None
+
+    # --- Lookups ------------------------------------------------------------
+
+    def families_index(self) -> QModelIndex:
+        if self._families_group is None:
+            return QModelIndex()
+        return self._index(self._families_group)
+
+    def section_key(self, index: ModelIndex | None) -> SectionKey | None:
+        """Section key of ``index``; ``None`` for family, zone and group rows."""
+
+        if index is None or not index.isValid():
+            return None
+        data = self._node(index).data
+        if isinstance(data, tuple) and len(data) == 2 and data[0] != "family":
+            return data  # type: ignore[return-value]
+        return None
+
+    def get_family_sections(self, index: ModelIndex | None) -> list[SectionKey] | None:
+        """Section keys of a family row, ``None`` for any other row."""
+
+        if index is None or not index.isValid():
+            return None
+        data = self._node(index).data
+        if isinstance(data, tuple) and len(data) == 2 and data[0] == "family":
+            return self._family_section_keys(data[1])
+        return None
+
+    def _family_section_keys(self, family_name: str) -> list[SectionKey]:
+        return [
+            key
+            for key in self._model.family_section_keys(family_name)
+            if self._section_family.get(key) == family_name
+        ]
+
+    def item_section_keys(self, index: ModelIndex | None) -> list[SectionKey]:
+        """Section keys under ``index``: itself, its family's BCs, or all of a zone/group.
+
+        Rows that were not fetched yet are included.
+        """
+
+        if index is None or not index.isValid():
+            return []
+        return self._node_section_keys(self._node(index))
+
+    def _node_section_keys(self, node: _Node) -> list[SectionKey]:
+        if isinstance(node.data, tuple) and node.data[0] == "family":
+            return self._family_section_keys(node.data[1])
+        if node.data is not None:
+            return [node.data]
+        keys: list[SectionKey] = []
+        for child in node.children:
+            keys.extend(self._node_section_keys(child))
+        for source in node.pending:
+            if isinstance(source, _SectionRow):
+                keys.append(source.ident)
+            elif isinstance(source, _BoundaryGroup):
+                keys.extend((source.zone.name, section.id) for section in source.sections)
+            else:
+                keys.extend(self._node_section_keys(self._make_node(source)))
+        return keys
+
+    def index_for_key(self, key: SectionKey | None) -> QModelIndex:
+        """Index of the row of section ``key``, fetching the rows leading to it."""
+
+        info = self.section_info(key)
+        if info is None:
+            return QModelIndex()
+        zone, section = info
+        family_name = self._section_family.get(key)
+        if family_name is not None:
+            path: list[Any] = [_FAMILIES, ("family", family_name), key]
+        elif section.boundary is not None:
+            path = [("zone", zone.name), _BOUNDARIES, key]
+        else:
+            path = [("zone", zone.name), key]
+        node = self._root
+        for ident in path:
+            while ident not in node.rows and node.pending:
+                self._fetch(node, FETCH_BATCH)
+            row = node.rows.get(ident)
+            if row is None:
+                return QModelIndex()
+            node = node.children[row]
+        return self._index(node)
+
+    def section_info(self, key: SectionKey | None) -> tuple[Zone, Section] | None:
+        return self._model.section_info(key)
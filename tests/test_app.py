@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 
+import h5py
 import numpy as np
 import pytest
 
@@ -12,9 +13,11 @@ os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PySide6")
 pytest.importorskip("vtkmodules.qt.QVTKRenderWindowInteractor")
 
+from PySide6.QtCore import QItemSelectionModel
 from PySide6.QtWidgets import QDialog, QMainWindow, QToolBar
 
 from cgns_gui.app import (
+    CgnsLoaderThread,
     MainWindow,
     SectionDetailsWidget,
     _missing_xcb_libs,
@@ -22,8 +25,18 @@ from cgns_gui.app import (
     _prepare_environment,
     _should_force_offscreen,
 )
-from cgns_gui.model import BoundaryInfo, CgnsModel, MeshData, Section, Zone
-from cgns_gui.scene import RenderStyle
+from cgns_gui.model import (
+    BoundaryInfo,
+    CgnsModel,
+    FamilyInfo,
+    LazyArray,
+    MeshData,
+    Section,
+    Zone,
+    is_deferred,
+)
+from cgns_gui import scene as scene_module
+from cgns_gui.scene import CellPick, RenderStyle
 
 
 def _is_headless() -> bool:
@@ -95,6 +108,12 @@ def test_main_window_initializes(qtbot):
     assert window.renderer.GetActors().GetNumberOfItems() == 0
 
 
+def _expand(tree: _ModelTreeWidget, index) -> None:  # noqa: ANN001
+    tree.expand(index)
+    # The view fetches the rows of expanded nodes when it lays itself out
+    tree.doItemsLayout()
+
+
 def test_model_tree_populates_sections(qtbot):
     tree = _ModelTreeWidget()
     qtbot.addWidget(tree)
@@ -109,14 +128,18 @@ def test_model_tree_populates_sections(qtbot):
 
     tree.populate(model)
 
-    assert tree.topLevelItemCount() == 1
-    zone_item = tree.topLevelItem(0)
-    assert zone_item.text(0) == "Zone#1"
-    assert zone_item.childCount() == 1
-    section_item = zone_item.child(0)
-    assert section_item.text(0) == "Section#1"
-
-    key = tree.section_key(section_item)
+    tree_model = tree.model()
+    assert tree_model.rowCount() == 1
+    zone_index = tree_model.index(0, 0)
+    assert zone_index.data() == "Zone#1"
+    # Section rows are created when the zone is expanded
+    assert tree_model.rowCount(zone_index) == 0
+    _expand(tree, zone_index)
+    assert tree_model.rowCount(zone_index) == 1
+    section_index = tree_model.index(0, 0, zone_index)
+    assert section_index.data() == "Section#1"
+
+    key = tree.section_key(section_index)
     assert key == ("Zone#1", 1)
     info = tree.section_info(key)
     assert info is not None
@@ -152,21 +175,123 @@ def test_model_tree_groups_boundary_sections(qtbot):
 
     tree.populate(CgnsModel(zones=[zone]))
 
-    zone_item = tree.topLevelItem(0)
-    assert zone_item.childCount() == 2
-    volume_item = zone_item.child(0)
-    assert volume_item.text(0) == "Volume"
-    boundary_group = zone_item.child(1)
-    assert boundary_group.text(0) == "Boundary Conditions"
-    assert boundary_group.childCount() == 1
-    boundary_item = boundary_group.child(0)
-    assert boundary_item.text(0) == "Inlet"
-    assert "Boundary" in boundary_item.text(1)
-
-    key = tree.section_key(boundary_item)
+    tree_model = tree.model()
+    zone_index = tree_model.index(0, 0)
+    _expand(tree, zone_index)
+    assert tree_model.rowCount(zone_index) == 2
+    assert tree_model.index(0, 0, zone_index).data() == "Volume"
+    boundary_group = tree_model.index(1, 0, zone_index)
+    assert boundary_group.data() == "Boundary Conditions"
+    _expand(tree, boundary_group)
+    assert tree_model.rowCount(boundary_group) == 1
+    boundary_index = tree_model.index(0, 0, boundary_group)
+    assert boundary_index.data() == "Inlet"
+    assert "Boundary" in boundary_index.siblingAtColumn(1).data()
+
+    key = tree.section_key(boundary_index)
     assert key == ("Zone#1", 2)
 
 
+def test_model_tree_adds_zones_incrementally(qtbot):
+    tree = _ModelTreeWidget()
+    qtbot.addWidget(tree)
+
+    def zone(name: str) -> Zone:
+        mesh = MeshData(
+            points=np.zeros((3, 3)),
+            connectivity=np.array([[0, 1, 2]]),
+            cell_type="TRI_3",
+        )
+        wall = Section(
+            id=1,
+            name="Wall",
+            element_type="TRI_3",
+            range=(1, 1),
+            mesh=mesh,
+            boundary=BoundaryInfo(name="Wall", family="Wall"),
+        )
+        return Zone(name=name, sections=[wall])
+
+    tree.begin_model(CgnsModel())
+    tree.add_zone(zone("Zone#1"))
+    tree_model = tree.model()
+    assert tree_model.rowCount() == 1
+
+    tree.add_families({"Wall": FamilyInfo(name="Wall", bc_type="BCWall")})
+    tree.add_zone(zone("Zone#2"))
+
+    assert [tree_model.index(i, 0).data() for i in range(3)] == ["Families", "Zone#1", "Zone#2"]
+    family_index = tree_model.index(0, 0, tree_model.index(0, 0))
+    assert family_index.siblingAtColumn(2).data() == "1"
+    assert tree.get_family_sections(family_index) == [("Zone#2", 1)]
+    # The zone added before its family was known lists the BC on its own
+    zone_index = tree_model.index(1, 0)
+    _expand(tree, zone_index)
+    assert tree_model.index(0, 0, zone_index).data() == "Boundary Conditions"
+
+
+def test_loader_thread_hands_each_zone_to_the_scene_before_reading_the_next(tmp_path):
+    file_path = tmp_path / "zones.cgns"
+    with h5py.File(file_path, "w") as handle:
+        base = handle.create_group("Base")
+        base.attrs["label"] = b"CGNSBase_t"
+        for name in ("Zone1", "Zone2"):
+            zone = base.create_group(name)
+            zone.attrs["label"] = b"Zone_t"
+            coords = zone.create_group("GridCoordinates")
+            coords.attrs["label"] = b"GridCoordinates_t"
+            for axis in "XYZ":
+                coords.create_dataset(f"Coordinate{axis}", data=[0.0, 1.0, 0.0])
+            section = zone.create_group("Skin")
+            section.attrs["label"] = b"Elements_t"
+            section.create_dataset("ElementType", data=np.array("TRI_3", dtype="S8"))
+            section.create_dataset("ElementConnectivity", data=[1, 2, 3])
+
+    thread = CgnsLoaderThread(str(file_path))
+    events: list[tuple[str, str]] = []
+    thread.zoneLoaded.connect(lambda progress: events.append(("loaded", progress.zone.name)))
+    thread.zoneReady.connect(lambda progress: events.append(("ready", progress.zone.name)))
+    thread.run()
+
+    assert events == [
+        ("loaded", "Zone1"),
+        ("ready", "Zone1"),
+        ("loaded", "Zone2"),
+        ("ready", "Zone2"),
+    ]
+
+
+def test_model_tree_selects_sections_that_were_not_fetched(qtbot):
+    tree = _ModelTreeWidget()
+    qtbot.addWidget(tree)
+
+    mesh = MeshData(
+        points=np.zeros((3, 3)),
+        connectivity=np.array([[0, 1, 2]]),
+        cell_type="TRI_3",
+    )
+    inlet = Section(
+        id=2,
+        name="Inlet",
+        element_type="TRI_3",
+        range=(2, 2),
+        mesh=mesh,
+        boundary=BoundaryInfo(name="Inlet"),
+    )
+    body = Section(id=1, name="Body", element_type="TRI_3", range=(1, 1), mesh=mesh)
+    tree.populate(CgnsModel(zones=[Zone(name="Zone", sections=[body, inlet])]))
+
+    with qtbot.assertNotEmitted(tree.itemSelectionChanged):
+        tree.select_section(("Zone", 2))
+    current = tree.currentIndex()
+    assert tree.section_key(current) == ("Zone", 2)
+    assert tree.isExpanded(current.parent())
+    assert tree.selected_section_keys() == [("Zone", 2)]
+
+    tree.select_section(None)
+    assert tree.selected_section_keys() == []
+
+
 def test_section_details_widget_updates(qtbot):
     details = SectionDetailsWidget()
     qtbot.addWidget(details)
@@ -221,6 +346,34 @@ def test_section_details_widget_shows_boundary_info(qtbot):
     assert "FaceCenter" in snapshot["type"]
 
 
+def test_section_details_widget_shows_picked_cell(qtbot):
+    details = SectionDetailsWidget()
+    qtbot.addWidget(details)
+
+    mesh = MeshData(
+        points=np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.5, 0.0]]),
+        connectivity=np.array([[0, 1, 2]]),
+        cell_type="TRI_3",
+    )
+    section = Section(id=5, name="Wing Surface", element_type="TRI_3", range=(7, 7), mesh=mesh)
+    details.update_section(Zone(name="Wing", sections=[section]), section)
+    details.show_cell(
+        CellPick(
+            key=("Wing", 5),
+            cell=0,
+            element_id=7,
+            node_ids=(1, 2, 3),
+            coordinates=((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.5, 0.0)),
+        )
+    )
+    snapshot = details.snapshot()
+    assert snapshot["element"] == "7 (cell 1)"
+    assert snapshot["nodes"].splitlines() == ["1: (0, 0, 0)", "2: (1, 0, 0)", "3: (0, 1.5, 0)"]
+
+    details.update_section(Zone(name="Wing", sections=[section]), section)
+    assert details.snapshot()["element"] == "-"
+
+
 def test_section_details_widget_emits_transparency_signal(qtbot):
     details = SectionDetailsWidget()
     qtbot.addWidget(details)
@@ -264,6 +417,179 @@ def test_main_window_toolbar_camera_actions(qtbot):
     actions["Show Axes"].trigger()
 
 
+@pytest.mark.qt_no_exception_capture
+def test_go_to_element_selects_and_frames_the_cell(qtbot):
+    if _is_headless():
+        pytest.skip("Headless environment cannot validate VTK widget")
+
+    window = MainWindow()
+    qtbot.addWidget(window)
+    points = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0]])
+    mesh = MeshData(points=points, connectivity=np.array([[0, 1, 2], [1, 3, 2]]), cell_type="TRI_3")
+    section = Section(id=1, name="Skin", element_type="TRI_3", range=(11, 12), mesh=mesh)
+    window.load_model(CgnsModel(zones=[Zone(name="Zone", sections=[section])]))
+
+    assert window.go_to_element("Zone", 12)
+    assert window.tree.section_key(window.tree.currentIndex()) == ("Zone", 1)
+    assert window.scene._cell_marker is not None
+    assert not window.go_to_element("Zone", 13)
+
+
+@pytest.mark.qt_no_exception_capture
+def test_go_to_element_reads_only_the_cell_of_a_deferred_section(qtbot):
+    if _is_headless():
+        pytest.skip("Headless environment cannot validate VTK widget")
+
+    window = MainWindow()
+    qtbot.addWidget(window)
+    points = np.array([[x, y, z] for z in (0.0, 1.0) for y in (0.0, 1.0) for x in (0.0, 1.0)])
+    hexes = np.array([[0, 1, 3, 2, 4, 5, 7, 6]])
+    connectivity = LazyArray(hexes.shape, np.int64, lambda: hexes, lambda a, b: hexes[a:b])
+    mesh = MeshData(points=points, connectivity=connectivity, cell_type="HEXA_8")
+    section = Section(id=1, name="Fluid", element_type="HEXA_8", range=(1, 1), mesh=mesh)
+    window.load_model(CgnsModel(zones=[Zone(name="Zone", sections=[section])]))
+
+    assert window.go_to_element("Zone", 1)
+    assert window.tree.section_key(window.tree.currentIndex()) == ("Zone", 1)
+    assert window.scene._cell_marker is not None
+    assert is_deferred(connectivity)
+    assert not window.scene.is_section_visible(("Zone", 1))
+
+
+@pytest.mark.qt_no_exception_capture
+def test_click_picks_a_single_cell(qtbot):
+    if _is_headless():
+        pytest.skip("Headless environment cannot validate VTK widget")
+
+    window = MainWindow()
+    qtbot.addWidget(window)
+    window.resize(400, 400)
+    points = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0]])
+    mesh = MeshData(points=points, connectivity=np.array([[0, 1, 2], [1, 3, 2]]), cell_type="TRI_3")
+    section = Section(id=1, name="Skin", element_type="TRI_3", range=(11, 12), mesh=mesh)
+    window.load_model(CgnsModel(zones=[Zone(name="Zone", sections=[section])]))
+    window.vtk_widget.GetRenderWindow().Render()
+
+    renderer = window.renderer
+    renderer.SetWorldPoint(0.75, 0.75, 0.0, 1.0)
+    renderer.WorldToDisplay()
+    x, y, _ = renderer.GetDisplayPoint()
+    pick = window._selection_controller.pick(x, y)
+    assert pick is not None and pick.element_id == 12
+    assert window.details.snapshot()["element"] == "12 (cell 2)"
+    assert window.scene._cell_marker is not None
+
+
+@pytest.mark.qt_no_exception_capture
+def test_click_selects_a_section_whose_locator_failed(qtbot, monkeypatch):
+    if _is_headless():
+        pytest.skip("Headless environment cannot validate VTK widget")
+
+    def fail(mesh):  # noqa: ANN001, ANN202
+        raise ValueError("bad locator")
+
+    monkeypatch.setattr(scene_module, "_build_locator", fail)
+    window = MainWindow()
+    qtbot.addWidget(window)
+    window.resize(400, 400)
+    points = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0]])
+    mesh = MeshData(points=points, connectivity=np.array([[0, 1, 2], [1, 3, 2]]), cell_type="TRI_3")
+    section = Section(id=1, name="Skin", element_type="TRI_3", range=(11, 12), mesh=mesh)
+    window.load_model(CgnsModel(zones=[Zone(name="Zone", sections=[section])]))
+    window.vtk_widget.GetRenderWindow().Render()
+
+    renderer = window.renderer
+    renderer.SetWorldPoint(0.75, 0.75, 0.0, 1.0)
+    renderer.WorldToDisplay()
+    x, y, _ = renderer.GetDisplayPoint()
+    for _ in range(2):
+        window._selection_controller.select(None)
+        assert window._selection_controller.pick(x, y) is None
+        assert window.tree.section_key(window.tree.currentIndex()) == ("Zone", 1)
+
+
+@pytest.mark.qt_no_exception_capture
+def test_hover_pre_highlights_the_section_under_the_mouse(qtbot):
+    if _is_headless():
+        pytest.skip("Headless environment cannot validate VTK widget")
+
+    window = MainWindow()
+    qtbot.addWidget(window)
+    window.resize(400, 400)
+    points = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0]])
+    mesh = MeshData(points=points, connectivity=np.array([[0, 1, 2], [1, 3, 2]]), cell_type="TRI_3")
+    section = Section(id=1, name="Skin", element_type="TRI_3", range=(1, 2), mesh=mesh)
+    window.load_model(CgnsModel(zones=[Zone(name="Zone", sections=[section])]))
+    window.vtk_widget.GetRenderWindow().Render()
+
+    renderer = window.renderer
+    renderer.SetWorldPoint(0.5, 0.5, 0.0, 1.0)
+    renderer.WorldToDisplay()
+    x, y, _ = renderer.GetDisplayPoint()
+    controller = window._selection_controller
+    controller.set_hover_enabled(True)
+    interactor = window.vtk_widget
+    interactor.SetEventPosition(round(x), round(y))
+    interactor.InvokeEvent("MouseMoveEvent")
+    qtbot.waitUntil(lambda: window.scene.hovered == ("Zone", 1), timeout=2000)
+    assert controller.last_hover_seconds is not None
+
+    controller.set_hover_enabled(False)
+    assert window.scene.hovered is None
+
+
+@pytest.mark.qt_no_exception_capture
+def test_replacing_a_load_ends_and_releases_the_cancelled_one(qtbot, tmp_path):
+    if _is_headless():
+        pytest.skip("Headless environment cannot validate VTK widget")
+
+    file_path = tmp_path / "case.cgns"
+    with h5py.File(file_path, "w") as handle:
+        base = handle.create_group("Base")
+        base.attrs["label"] = b"CGNSBase_t"
+        zone = base.create_group("Zone")
+        zone.attrs["label"] = b"Zone_t"
+        coords = zone.create_group("GridCoordinates")
+        coords.attrs["label"] = b"GridCoordinates_t"
+        for axis in "XYZ":
+            coords.create_dataset(f"Coordinate{axis}", data=[0.0, 1.0, 0.0])
+        section = zone.create_group("Skin")
+        section.attrs["label"] = b"Elements_t"
+        section.create_dataset("ElementType", data=np.array("TRI_3", dtype="S8"))
+        section.create_dataset("ElementConnectivity", data=[1, 2, 3])
+
+    window = MainWindow()
+    qtbot.addWidget(window)
+    window.load_file(str(file_path))
+    window.load_file(str(file_path))
+
+    first, second = window.performance.records()
+    assert first["cancelled"] is True and first["wall_seconds"] is not None
+    qtbot.waitUntil(lambda: window.performance.last_load.wall_seconds is not None, timeout=5000)
+    assert second["cancelled"] is False
+    qtbot.waitUntil(lambda: not window._retired_threads, timeout=5000)
+
+
+@pytest.mark.qt_no_exception_capture
+def test_performance_hud_records_frames(qtbot, tmp_path):
+    if _is_headless():
+        pytest.skip("Headless environment cannot validate VTK widget")
+
+    window = MainWindow()
+    qtbot.addWidget(window)
+
+    window._toggle_performance_hud(True)
+    window.vtk_widget.GetRenderWindow().Render()
+    frame = window.performance.last_frame
+    assert frame is not None and frame.frame_seconds > 0.0
+    assert window._hud_actor is not None
+    assert "Frame" in window._hud_actor.GetInput()
+
+    assert window.performance.export_jsonl(tmp_path / "timings.jsonl") >= 1
+    window._toggle_performance_hud(False)
+    assert window._hud_actor is None
+
+
 @pytest.mark.qt_no_exception_capture
 def test_open_settings_updates_preferences(qtbot, monkeypatch):
     if _is_headless():
@@ -279,6 +605,10 @@ def test_open_settings_updates_preferences(qtbot, monkeypatch):
         dialog.background_combo.setCurrentIndex(bg_index)
     index = dialog.render_combo.findText("Wireframe")
     dialog.render_combo.setCurrentIndex(index)
+    dialog.workers_spin.setValue(3)
+    dialog.batched_check.setChecked(True)
+    dialog.feature_angle_spin.setValue(45.0)
+    dialog.target_fps_spin.setValue(0)
 
     monkeypatch.setattr(window, "_create_settings_dialog", lambda: dialog)
     monkeypatch.setattr(dialog, "exec", lambda: QDialog.Accepted)
@@ -288,6 +618,10 @@ def test_open_settings_updates_preferences(qtbot, monkeypatch):
     assert window._background_name == "Light Gray"
     assert window.scene.get_render_style() is RenderStyle.WIREFRAME
     assert window._wireframe_action is not None and window._wireframe_action.isChecked()
+    assert window._viewer_settings.load_workers == 3
+    assert window.scene.batched is True
+    assert window.scene.feature_angle == pytest.approx(45.0)
+    assert window._viewer_settings.target_fps == 0
 
 
 @pytest.mark.qt_no_exception_capture
@@ -339,3 +673,47 @@ def test_prepare_environment_headless_default():
     else:
         # On Linux without DISPLAY, should default to offscreen
         assert fake_env.get("QT_QPA_PLATFORM") == "offscreen"
+
+
+def test_model_tree_collects_keys_for_multi_selection(qtbot):
+    tree = _ModelTreeWidget()
+    qtbot.addWidget(tree)
+
+    def section(section_id: int, family: str | None) -> Section:
+        mesh = MeshData(
+            points=np.zeros((3, 3)),
+            connectivity=np.array([[0, 1, 2]]),
+            cell_type="TRI_3",
+        )
+        return Section(
+            id=section_id,
+            name=f"BC{section_id}",
+            element_type="TRI_3",
+            range=(section_id, section_id),
+            mesh=mesh,
+            boundary=BoundaryInfo(name=f"BC{section_id}", family=family),
+        )
+
+    zone = Zone(name="Zone", sections=[section(1, "Wall"), section(2, "Wall"), section(3, None)])
+    tree.populate(
+        CgnsModel(zones=[zone], families={"Wall": FamilyInfo(name="Wall", bc_type="BCWall")})
+    )
+
+    tree_model = tree.model()
+    family_index = tree_model.index(0, 0, tree_model.index(0, 0))
+    zone_index = tree_model.index(1, 0)
+    assert tree.item_section_keys(family_index) == [("Zone", 1), ("Zone", 2)]
+    # Keys of rows that were not created yet are included
+    assert tree.item_section_keys(zone_index) == [("Zone", 3)]
+
+    selection = tree.selectionModel()
+    rows = QItemSelectionModel.Select | QItemSelectionModel.Rows
+    selection.select(family_index, rows)
+    _expand(tree, zone_index)
+    boundary_group = tree_model.index(0, 0, zone_index)
+    _expand(tree, boundary_group)
+    selection.select(tree_model.index(0, 0, boundary_group), rows)
+    # The section row duplicates a key already selected through its family
+    _expand(tree, family_index)
+    selection.select(tree_model.index(0, 0, family_index), rows)
+    assert sorted(tree.selected_section_keys()) == [("Zone", 1), ("Zone", 2), ("Zone", 3)]
@@ -0,0 +1,115 @@
+"""Tests for the persistent model cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+from cgns_gui.cache import ModelCache
+from cgns_gui.model import (
+    BoundaryInfo,
+    CgnsModel,
+    FamilyInfo,
+    MeshData,
+    Section,
+    Zone,
+    compact_mesh,
+)
+
+
+def _model() -> CgnsModel:
+    points = np.arange(30, dtype=float).reshape(10, 3)
+    volume = MeshData(points=points, connectivity=np.array([[0, 1, 2, 3]]), cell_type="TETRA_4")
+    wall = compact_mesh(
+        MeshData(points=points, connectivity=np.array([[7, 2, 9]]), cell_type="TRI_3")
+    )
+    sections = [
+        Section(id=1, name="Fluid", element_type="TETRA_4", range=(1, 1), mesh=volume),
+        Section(
+            id=2,
+            name="Wall",
+            element_type="TRI_3",
+            range=(2, 2),
+            mesh=wall,
+            boundary=BoundaryInfo(name="Wall", grid_location="FaceCenter", family="Wall"),
+        ),
+    ]
+    return CgnsModel(
+        zones=[Zone(name="Zone", sections=sections, vertex_count=10)],
+        families={"Wall": FamilyInfo(name="Wall", bc_type="BCWall")},
+    )
+
+
+def _source(tmp_path: Path, name: str = "case.cgns", payload: bytes = b"cgns") -> Path:
+    path = tmp_path / name
+    path.write_bytes(payload)
+    return path
+
+
+def test_cache_round_trips_model_with_memory_mapped_arrays(tmp_path: Path) -> None:
+    cache = ModelCache(tmp_path / "cache")
+    source = _source(tmp_path)
+    model = _model()
+
+    assert cache.get(source) is None
+    cache.put(source, model)
+    cached = cache.get(source)
+
+    assert cached is not None
+    assert cached.families == model.families
+    zone = cached.zones[0]
+    assert zone.vertex_count == 10
+    volume, wall = zone.sections
+    assert wall.boundary == model.zones[0].sections[1].boundary
+    assert wall.range == (2, 2)
+    assert isinstance(volume.mesh.points, np.memmap)
+    np.testing.assert_array_equal(volume.mesh.connectivity, [[0, 1, 2, 3]])
+    np.testing.assert_array_equal(wall.mesh.node_ids, [2, 7, 9])
+    np.testing.assert_array_equal(wall.mesh.points, model.zones[0].sections[1].mesh.points)
+    assert cache.get(source, variant="compact=1") is None
+
+
+def test_cache_misses_after_file_changes(tmp_path: Path) -> None:
+    cache = ModelCache(tmp_path / "cache")
+    source = _source(tmp_path)
+    cache.put(source, _model())
+
+    source.write_bytes(b"changed")
+
+    assert cache.get(source) is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = ModelCache(tmp_path / "cache")
+    first = _source(tmp_path, "first.cgns", b"first")
+    second = _source(tmp_path, "second.cgns", b"second")
+    cache.put(first, _model())
+    cache.put(second, _model())
+    entry_size = cache.entries()[0].size_bytes
+
+    # Make the first entry the most recently used one
+    old = cache.directory / cache.fingerprint(second) / "manifest.json"
+    os.utime(old, (1.0, 1.0))
+    assert cache.get(first) is not None
+
+    removed = cache.evict(max_bytes=entry_size)
+
+    assert removed == [cache.fingerprint(second)]
+    assert [entry.source for entry in cache.entries()] == [str(first.resolve())]
+    cache.clear()
+    assert cache.entries() == []
+    assert cache.total_size() == 0
+
+
+def test_cache_from_env(tmp_path: Path) -> None:
+    assert ModelCache.from_env({}) is None
+
+    cache = ModelCache.from_env(
+        {"CGNS_GUI_CACHE_DIR": str(tmp_path), "CGNS_GUI_CACHE_MAX_MB": "2"}
+    )
+
+    assert cache is not None
+    assert cache.directory == tmp_path
+    assert cache.max_bytes == 2 << 20
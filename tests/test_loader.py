@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 
 import h5py
 import numpy as np
 import pytest
 
-from cgns_gui.loader import CgnsLoader
+from cgns_gui import backends
+from cgns_gui.backends import H5pyBackend, read_into
+from cgns_gui.cache import ModelCache
+from cgns_gui.loader import CancelToken, CgnsLoader, LoadCancelled
+from cgns_gui.model import LazyArray, is_deferred
+from cgns_gui.profiling import PHASE_BC_MATCH, PHASE_PARSE, PHASE_RESHAPE, PhaseTimer
 
 
 @pytest.fixture()
@@ -233,4 +240,288 @@ def test_loader_prefers_section_name_when_type_code_incorrect(tmp_path: Path) ->
 
     section = model.zones[0].sections[0]
     assert section.element_type == "PENTA_6"
-    assert section.mesh.connectivity.shape == (2, 6)
\ No newline at end of file
+    assert section.mesh.connectivity.shape == (2, 6)
+
+_FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_h5py_backend_matches_pycgns_backend() -> None:
+    pytest.importorskip("CGNS.MAP")
+    path = _FIXTURES / "test_with_solution.cgns"
+
+    expected = CgnsLoader(backend="pycgns").load(path)
+    model = CgnsLoader(backend="h5py").load(path)
+
+    assert model.families == expected.families
+    assert [zone.name for zone in model.zones] == [zone.name for zone in expected.zones]
+    for zone, expected_zone in zip(model.zones, expected.zones, strict=True):
+        assert zone.total_points == expected_zone.total_points
+        for section, expected_section in zip(
+            zone.sections, expected_zone.sections, strict=True
+        ):
+            assert section.name == expected_section.name
+            assert section.element_type == expected_section.element_type
+            assert tuple(section.range) == tuple(expected_section.range)
+            assert section.boundary == expected_section.boundary
+            np.testing.assert_array_equal(section.mesh.points, expected_section.mesh.points)
+            np.testing.assert_array_equal(
+                section.mesh.connectivity, expected_section.mesh.connectivity
+            )
+
+
+def test_h5py_backend_skips_flow_solution() -> None:
+    backend = H5pyBackend()
+
+    with backend.open(_FIXTURES / "test_with_solution.cgns") as tree:
+        labels: set[str] = set()
+        pending = [tree]
+        while pending:
+            node = pending.pop()
+            labels.add(node[3])
+            pending.extend(node[2])
+
+    assert "Zone_t" in labels
+    assert "GridCoordinates_t" in labels
+    assert "FlowSolution_t" not in labels
+
+
+def test_read_into_uses_hyperslabs(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(backends, "READ_CHUNK_SIZE", 3)
+    file_path = tmp_path / "arrays.h5"
+    with h5py.File(file_path, "w") as handle:
+        handle.create_dataset("ids", data=np.arange(1, 11, dtype=np.int32))
+        handle.create_dataset("x", data=np.linspace(0.0, 1.0, 10))
+
+    with h5py.File(file_path, "r") as handle:
+        ids = np.empty(10, dtype=np.int64)
+        read_into(handle["ids"], ids)
+        points = np.zeros((10, 3))
+        read_into(handle["x"], points, 1)
+
+    np.testing.assert_array_equal(ids, np.arange(1, 11))
+    np.testing.assert_allclose(points[:, 1], np.linspace(0.0, 1.0, 10))
+    assert not points[:, [0, 2]].any()
+
+
+def test_read_into_checks_before_every_hyperslab(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(backends, "READ_CHUNK_SIZE", 4)
+    file_path = tmp_path / "arrays.h5"
+    with h5py.File(file_path, "w") as handle:
+        handle.create_dataset("ids", data=np.arange(10, dtype=np.int64))
+    token = CancelToken()
+    chunks: list[int] = []
+
+    def check() -> None:
+        chunks.append(1)
+        if len(chunks) == 2:
+            token.cancel()
+        token.raise_if_cancelled()
+
+    with h5py.File(file_path, "r") as handle, pytest.raises(LoadCancelled):
+        read_into(handle["ids"], np.empty(10, dtype=np.int64), check=check)
+
+    assert len(chunks) == 2
+
+
+def test_loader_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        CgnsLoader(backend="adf")
+
+
+@pytest.fixture()
+def block_cgns_file(tmp_path: Path) -> Path:
+    return _write_block_file(tmp_path / "block.cgns")
+
+
+def _write_block_file(file_path: Path, zones: int = 1) -> Path:
+    """Zones of a 5x5x5 HEXA_8 block with a 5x5 QUAD_4 wall boundary, in CGNS/HDF5 layout."""
+
+    n = 5
+    axis = np.linspace(0.0, 1.0, n + 1)
+    x, y, z = np.meshgrid(axis, axis, axis, indexing="ij")
+    ids = np.arange((n + 1) ** 3).reshape(n + 1, n + 1, n + 1) + 1
+    corners = [
+        (0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+        (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1),
+    ]
+    hexa = np.stack(
+        [ids[i : i + n, j : j + n, k : k + n] for i, j, k in corners], axis=-1
+    ).reshape(-1)
+    wall = np.stack(
+        [ids[:-1, :-1, 0], ids[:-1, 1:, 0], ids[1:, 1:, 0], ids[1:, :-1, 0]], axis=-1
+    ).reshape(-1)
+
+    with h5py.File(file_path, "w") as handle:
+        base = handle.create_group("Base")
+        base.attrs["label"] = b"CGNSBase_t"
+        for index in range(zones):
+            zone = base.create_group(f"Zone{index + 1:03d}")
+            zone.attrs["label"] = b"Zone_t"
+            coords = zone.create_group("GridCoordinates")
+            coords.attrs["label"] = b"GridCoordinates_t"
+            for axis, values in zip("XYZ", (x + index, y, z), strict=True):
+                coords.create_dataset(f"Coordinate{axis}", data=values.ravel())
+            for name, code, connectivity in (("Hexa", 17, hexa), ("Wall", 7, wall)):
+                section = zone.create_group(name)
+                section.attrs["label"] = b"Elements_t"
+                section.create_dataset(" data", data=np.array([code, 0], dtype=np.int32))
+                section.create_dataset("ElementConnectivity", data=connectivity.astype(np.int32))
+            zone_bc = zone.create_group("ZoneBC")
+            zone_bc.attrs["label"] = b"ZoneBC_t"
+            zone_bc.create_group("Wall").attrs["label"] = b"BC_t"
+    return file_path
+
+
+def test_lazy_load_defers_large_arrays(block_cgns_file: Path) -> None:
+    model = CgnsLoader(backend="h5py", lazy=True).load(block_cgns_file)
+
+    zone = model.zones[0]
+    hexa, wall = zone.sections
+    assert zone.total_points == 216
+    assert zone.total_cells == 125 + 25
+    assert wall.boundary is not None
+    assert isinstance(hexa.mesh.connectivity, LazyArray)
+    assert not hexa.mesh.is_loaded
+    assert hexa.mesh.connectivity.shape == (125, 8)
+    # One points placeholder is shared by every section of the zone
+    assert isinstance(hexa.mesh.points, LazyArray)
+    assert hexa.mesh.points is wall.mesh.points
+
+    eager_hexa, eager_wall = CgnsLoader(backend="h5py").load(block_cgns_file).zones[0].sections
+    np.testing.assert_array_equal(hexa.mesh.connectivity, eager_hexa.mesh.connectivity)
+    np.testing.assert_array_equal(wall.mesh.points, eager_wall.mesh.points)
+    assert hexa.mesh.is_loaded
+
+
+def test_lazy_load_skips_compaction_of_deferred_sections(block_cgns_file: Path) -> None:
+    loader = CgnsLoader(backend="h5py", lazy=True, compact_boundaries=True)
+    model = loader.load(block_cgns_file)
+
+    wall = model.zones[0].sections[1]
+    assert wall.boundary is not None
+    assert wall.mesh.node_ids is None
+    assert not wall.mesh.is_loaded
+
+
+def test_loader_serves_unchanged_file_from_cache(block_cgns_file: Path, tmp_path: Path) -> None:
+    cache = ModelCache(tmp_path / "cache")
+
+    parsed = CgnsLoader(backend="h5py", cache=cache).load(block_cgns_file)
+    cached = CgnsLoader(backend="h5py", cache=cache).load(block_cgns_file)
+
+    assert len(cache.entries()) == 1
+    hexa, wall = cached.zones[0].sections
+    assert isinstance(hexa.mesh.connectivity, np.memmap)
+    assert hexa.mesh.points is wall.mesh.points
+    assert wall.boundary == parsed.zones[0].sections[1].boundary
+    parsed_hexa = parsed.zones[0].sections[0]
+    np.testing.assert_array_equal(hexa.mesh.connectivity, parsed_hexa.mesh.connectivity)
+
+
+def test_lazy_load_populates_cache_without_reading_deferred_arrays(
+    block_cgns_file: Path, tmp_path: Path
+) -> None:
+    cache = ModelCache(tmp_path / "cache")
+
+    parsed = CgnsLoader(backend="h5py", lazy=True, cache=cache).load(block_cgns_file)
+
+    hexa, wall = parsed.zones[0].sections
+    assert is_deferred(hexa.mesh.connectivity)
+    assert is_deferred(hexa.mesh.points)
+    cached = CgnsLoader(backend="h5py", lazy=True, cache=cache).load(block_cgns_file)
+    cached_hexa, cached_wall = cached.zones[0].sections
+    np.testing.assert_array_equal(cached_hexa.mesh.connectivity, hexa.mesh.connectivity)
+    np.testing.assert_array_equal(cached_wall.mesh.points, wall.mesh.points)
+
+
+def test_lazy_array_reads_rows_without_loading(block_cgns_file: Path) -> None:
+    hexa, _ = CgnsLoader(backend="h5py", lazy=True).load(block_cgns_file).zones[0].sections
+    eager, _ = CgnsLoader(backend="h5py").load(block_cgns_file).zones[0].sections
+
+    np.testing.assert_array_equal(
+        hexa.mesh.connectivity.read_rows(7, 9), eager.mesh.connectivity[7:9]
+    )
+    np.testing.assert_array_equal(hexa.mesh.points.read_rows(200, 300), eager.mesh.points[200:])
+    assert is_deferred(hexa.mesh.connectivity)
+    assert is_deferred(hexa.mesh.points)
+
+
+def test_parallel_zone_loading_keeps_file_order(tmp_path: Path) -> None:
+    path = _write_block_file(tmp_path / "zones.cgns", zones=9)
+
+    serial = CgnsLoader(backend="h5py").load(path)
+    parallel = CgnsLoader(backend="h5py", workers=4).load(path)
+
+    assert [zone.name for zone in parallel.zones] == [zone.name for zone in serial.zones]
+    assert len(parallel.zones) == 9
+    for zone, expected in zip(parallel.zones, serial.zones, strict=True):
+        assert [section.boundary for section in zone.sections] == [
+            section.boundary for section in expected.sections
+        ]
+        np.testing.assert_array_equal(
+            zone.sections[0].mesh.points, expected.sections[0].mesh.points
+        )
+
+
+def test_iter_zones_reports_progress_in_file_order(tmp_path: Path) -> None:
+    path = _write_block_file(tmp_path / "zones.cgns", zones=3)
+    families: dict = {}
+
+    progress = list(CgnsLoader(backend="h5py", workers=2).iter_zones(path, families))
+
+    assert [item.index for item in progress] == [0, 1, 2]
+    assert {item.total for item in progress} == {3}
+    assert [item.zone.name for item in progress] == ["Zone001", "Zone002", "Zone003"]
+    zone_bytes = progress[0].zone.loaded_bytes
+    assert zone_bytes > 0
+    assert [item.bytes_read for item in progress] == [zone_bytes, 2 * zone_bytes, 3 * zone_bytes]
+    assert families == {}
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_replaced_load_stops_within_latency_bound(
+    tmp_path: Path, monkeypatch, workers: int
+) -> None:
+    monkeypatch.setattr(backends, "READ_CHUNK_SIZE", 64)
+    path = _write_block_file(tmp_path / "zones.cgns", zones=40)
+    token = CancelToken()
+    loader = CgnsLoader(backend="h5py", workers=workers, cancel_token=token)
+    started = threading.Event()
+    outcome: dict[str, object] = {}
+
+    def run() -> None:
+        zones = 0
+        try:
+            for _ in loader.iter_zones(path):
+                zones += 1
+                started.set()
+                # Stand-in for the UI handling each zone
+                time.sleep(0.005)
+        except LoadCancelled:
+            outcome["cancelled"] = True
+        outcome["zones"] = zones
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    assert started.wait(5.0)
+    begin = time.perf_counter()
+    token.cancel()
+    worker.join(5.0)
+    latency = time.perf_counter() - begin
+
+    assert not worker.is_alive()
+    assert outcome.get("cancelled") is True
+    assert outcome["zones"] < 40
+    assert latency < 0.1
+
+
+def test_loader_reports_phase_times(block_cgns_file: Path) -> None:
+    timer = PhaseTimer()
+    model = CgnsLoader(backend="h5py", lazy=True, phase_timer=timer).load(block_cgns_file)
+    before = timer.totals()
+
+    assert before[PHASE_PARSE] > 0.0
+    assert before[PHASE_BC_MATCH] > 0.0
+    # Deferred arrays add their reshaping time whenever they are read
+    model.zones[0].sections[0].mesh.load()
+    assert timer.totals()[PHASE_RESHAPE] > before[PHASE_RESHAPE]
@@ -0,0 +1,329 @@
+"""Tests for the CGNS data model helpers."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cgns_gui import model
+from cgns_gui.model import (
+    BoundaryInfo,
+    CgnsModel,
+    ElementRangeIndex,
+    LazyArray,
+    MeshData,
+    Section,
+    Zone,
+    compact_mesh,
+    external_faces,
+    section_edges,
+    take_rows,
+)
+
+
+def _zone_points() -> np.ndarray:
+    return np.arange(30, dtype=float).reshape(10, 3)
+
+
+def test_compact_mesh_keeps_only_referenced_points():
+    points = _zone_points()
+    mesh = MeshData(
+        points=points,
+        connectivity=np.array([[7, 2, 9], [9, 2, 4]]),
+        cell_type="TRI_3",
+    )
+
+    compact = compact_mesh(mesh)
+
+    assert compact.is_compact
+    assert compact.points.shape == (4, 3)
+    np.testing.assert_array_equal(compact.node_ids, [2, 4, 7, 9])
+    np.testing.assert_array_equal(compact.connectivity, [[2, 0, 3], [3, 0, 1]])
+    np.testing.assert_array_equal(
+        compact.points[compact.connectivity],
+        points[mesh.connectivity],
+    )
+    assert compact.bounds() == mesh.bounds()
+
+
+def test_compact_mesh_maps_between_local_and_zone_ids():
+    mesh = compact_mesh(
+        MeshData(
+            points=_zone_points(),
+            connectivity=np.array([[7, 2, 9]]),
+            cell_type="TRI_3",
+        )
+    )
+
+    np.testing.assert_array_equal(mesh.to_global(mesh.connectivity[0]), [7, 2, 9])
+    np.testing.assert_array_equal(mesh.to_local([2, 3, 9, 12]), [0, -1, 2, -1])
+
+
+def test_zone_total_points_prefers_vertex_count():
+    mesh = compact_mesh(
+        MeshData(
+            points=_zone_points(),
+            connectivity=np.array([[0, 1, 2]]),
+            cell_type="TRI_3",
+        )
+    )
+    section = Section(id=1, name="Wall", element_type="TRI_3", range=(1, 1), mesh=mesh)
+
+    assert Zone(name="Zone", sections=[section]).total_points == 3
+    assert Zone(name="Zone", sections=[section], vertex_count=10).total_points == 10
+
+
+def _indexed_zone(name: str) -> Zone:
+    mesh = MeshData(
+        points=_zone_points(),
+        connectivity=np.array([[0, 1, 2]]),
+        cell_type="TRI_3",
+    )
+    return Zone(
+        name=name,
+        sections=[
+            Section(id=1, name="Body", element_type="TRI_3", range=(1, 1), mesh=mesh),
+            Section(
+                id=2,
+                name="Wall",
+                element_type="BAR_2",
+                range=(2, 2),
+                mesh=MeshData(
+                    points=mesh.points, connectivity=np.array([[0, 1]]), cell_type="BAR_2"
+                ),
+                boundary=BoundaryInfo(name="Wall", family="Walls"),
+            ),
+        ],
+    )
+
+
+def test_model_indexes_sections_as_zones_are_added():
+    first = _indexed_zone("A")
+    cgns = CgnsModel(zones=[first])
+    second = _indexed_zone("B")
+    cgns.add_zone(second)
+    # Adding a zone the model already holds changes nothing
+    cgns.add_zone(second)
+
+    assert cgns.zones == [first, second]
+    assert cgns.zone("B") is second
+    assert cgns.section(("B", 2)) is second.sections[1]
+    assert cgns.find_section("A", 1) is first.sections[0]
+    assert cgns.section_info(("A", 2)) == (first, first.sections[1])
+    assert cgns.section_info(("A", 3)) is None
+    assert cgns.family_section_keys("Walls") == [("A", 2), ("B", 2)]
+    assert cgns.element_type_section_keys("TRI_3") == [("A", 1), ("B", 1)]
+    memory = cgns.index_memory()
+    assert memory.sections > 0 and memory.families > 0 and memory.zones > 0
+    assert memory.total_bytes == (
+        memory.sections
+        + memory.families
+        + memory.element_types
+        + memory.zones
+        + memory.element_ids
+    )
+
+
+def test_model_index_follows_direct_changes_to_zones():
+    cgns = CgnsModel(zones=[_indexed_zone("A")])
+    cgns.zones.append(_indexed_zone("B"))
+    assert cgns.family_section_keys("Walls") == [("A", 2), ("B", 2)]
+
+    cgns.zones = [_indexed_zone("C")]
+    assert cgns.zone("A") is None
+    assert cgns.family_section_keys("Walls") == [("C", 2)]
+
+
+def test_element_ranges_locate_global_element_ids():
+    zone = _indexed_zone("A")
+    # Sections listed out of order; the BAR_2 range is wider than its single cell
+    zone.sections[0].range = (11, 11)
+    zone.sections[1].range = (1, 5)
+    cgns = CgnsModel(zones=[zone])
+
+    assert cgns.locate_element("A", 11) == (("A", 1), 0)
+    assert cgns.locate_element("A", 1) == (("A", 2), 0)
+    for missing in (0, 2, 10, 12):
+        assert cgns.locate_element("A", missing) is None
+    assert cgns.locate_element("B", 1) is None
+
+    section_ids, cells = cgns.locate_elements("A", [11, 1, 2, 0, 12])
+    np.testing.assert_array_equal(section_ids, [1, 2, -1, -1, -1])
+    np.testing.assert_array_equal(cells, [0, 0, -1, -1, -1])
+    section_ids, cells = cgns.locate_elements("B", np.array([1, 2]))
+    np.testing.assert_array_equal(section_ids, [-1, -1])
+    assert cgns.index_memory().element_ids > 0
+
+
+def test_element_ranges_match_bisect_on_many_sections():
+    rng = np.random.default_rng(0)
+    counts = rng.integers(1, 50, size=200)
+    starts = np.concatenate([[1], 1 + np.cumsum(counts[:-1])])
+    ranges = ElementRangeIndex(
+        Section(
+            id=int(i) + 1,
+            name=f"S{i}",
+            element_type="TRI_3",
+            range=(int(start), int(start + count - 1)),
+            mesh=MeshData(
+                points=np.zeros((3, 3)),
+                connectivity=np.zeros((int(count), 3), dtype=np.int64),
+                cell_type="TRI_3",
+            ),
+        )
+        for i, (start, count) in enumerate(zip(starts, counts, strict=True))
+    )
+    ids = rng.integers(0, int(counts.sum()) + 10, size=1000)
+    section_ids, cells = ranges.locate_many(ids)
+    for element_id, section_id, cell in zip(ids, section_ids, cells, strict=True):
+        expected = ranges.locate(int(element_id))
+        assert (section_id, cell) == (expected if expected is not None else (-1, -1))
+
+
+def test_lazy_array_loads_once_on_first_use():
+    calls = []
+
+    def load() -> np.ndarray:
+        calls.append(1)
+        return _zone_points()
+
+    lazy = LazyArray((10, 3), np.float64, load)
+
+    assert lazy.shape == (10, 3)
+    assert lazy.nbytes == 240
+    assert not calls
+    np.testing.assert_array_equal(np.asarray(lazy), _zone_points())
+    np.testing.assert_array_equal(lazy[2], [6.0, 7.0, 8.0])
+    assert lazy.is_loaded
+    assert len(calls) == 1
+
+
+def test_lazy_array_takes_rows_run_by_run():
+    points = _zone_points()
+    reads = []
+
+    def rows(start: int, stop: int) -> np.ndarray:
+        reads.append((start, stop))
+        return points[start:stop]
+
+    lazy = LazyArray((10, 3), np.float64, lambda: points, rows)
+
+    np.testing.assert_array_equal(take_rows(lazy, [7, 2, 3, 7]), points[[7, 2, 3, 7]])
+    assert reads == [(2, 4), (7, 8)]
+    assert not lazy.is_loaded
+    np.testing.assert_array_equal(take_rows(points, [1]), points[[1]])
+
+
+def test_mesh_bounds_do_not_load_deferred_connectivity():
+    connectivity = LazyArray((1, 3), np.int64, lambda: np.array([[0, 1, 2]]))
+    mesh = MeshData(points=_zone_points(), connectivity=connectivity, cell_type="TRI_3")
+
+    assert mesh.bounds() == (0.0, 27.0, 1.0, 28.0, 2.0, 29.0)
+    assert not mesh.is_loaded
+
+    mesh.load()
+    assert mesh.bounds() == (0.0, 6.0, 1.0, 7.0, 2.0, 8.0)
+
+
+_REFERENCE_CELLS = {
+    "TETRA_4": [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]],
+    "PYRA_5": [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0.5, 0.5, 1]],
+    "PENTA_6": [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [0, 1, 1]],
+    "HEXA_8": [
+        [0, 0, 0],
+        [1, 0, 0],
+        [1, 1, 0],
+        [0, 1, 0],
+        [0, 0, 1],
+        [1, 0, 1],
+        [1, 1, 1],
+        [0, 1, 1],
+    ],
+}
+
+
+def _stacked(cell_type: str) -> MeshData:
+    """Two reference cells on top of each other, sharing the top/bottom face."""
+
+    bottom = np.array(_REFERENCE_CELLS[cell_type], dtype=float)
+    half = len(bottom) // 2
+    points = np.vstack([bottom, bottom[half:] + [0.0, 0.0, 1.0]])
+    first = np.arange(len(bottom))
+    second = np.concatenate([first[half:], np.arange(len(bottom), len(points))])
+    return MeshData(points=points, connectivity=np.stack([first, second]), cell_type=cell_type)
+
+
+@pytest.mark.parametrize(
+    ("cell_type", "triangles", "quads"),
+    [("TETRA_4", 4, 0), ("PYRA_5", 4, 1), ("PENTA_6", 2, 3), ("HEXA_8", 0, 6)],
+)
+def test_external_faces_of_single_cell_point_outwards(cell_type, triangles, quads):
+    points = np.array(_REFERENCE_CELLS[cell_type], dtype=float)
+    mesh = MeshData(
+        points=points,
+        connectivity=np.arange(len(points)).reshape(1, -1),
+        cell_type=cell_type,
+    )
+
+    faces = external_faces(mesh)
+
+    assert faces.triangles.shape == (triangles, 3)
+    assert faces.quads.shape == (quads, 4)
+    centre = points.mean(axis=0)
+    for face in [*faces.triangles, *faces.quads]:
+        corners = points[face]
+        # Newell normal, valid for triangles and planar quads
+        normal = np.cross(corners, np.roll(corners, -1, axis=0)).sum(axis=0)
+        assert np.dot(normal, corners.mean(axis=0) - centre) > 0
+
+
+@pytest.mark.parametrize(
+    ("cell_type", "triangles", "quads"),
+    [("PENTA_6", 2, 6), ("HEXA_8", 0, 10)],
+)
+def test_external_faces_drop_shared_faces(cell_type, triangles, quads):
+    faces = external_faces(_stacked(cell_type))
+
+    assert faces.face_count == triangles + quads
+    assert faces.quads.shape[0] == quads
+    cells = np.concatenate([faces.triangle_cells, faces.quad_cells])
+    assert np.bincount(cells).tolist() == [faces.face_count // 2] * 2
+    assert np.all(np.diff(faces.quad_cells) >= 0)
+
+
+def test_external_faces_resolve_hash_collisions(monkeypatch):
+    mesh = _stacked("HEXA_8")
+    expected = external_faces(mesh)
+
+    # Faces then hash to their two largest node ids, so distinct faces collide
+    monkeypatch.setattr(model, "_FACE_HASH_MULTIPLIER", np.uint64(0))
+    faces = external_faces(mesh)
+
+    np.testing.assert_array_equal(faces.quads, expected.quads)
+    np.testing.assert_array_equal(faces.quad_cells, expected.quad_cells)
+
+
+def test_section_edges_list_each_edge_once():
+    mesh = _stacked("HEXA_8")
+
+    edges = section_edges(mesh)
+
+    # The 10 exterior quads of the 1x1x2 box share each of their 40 edges
+    assert edges.shape == (20, 2)
+    assert np.all(edges[:, 0] < edges[:, 1])
+    assert len({tuple(edge) for edge in edges.tolist()}) == 20
+    # The 4 edges around the middle of the box lie between coplanar faces
+    assert section_edges(mesh, feature_angle=30.0).shape == (16, 2)
+    assert section_edges(mesh, feature_angle=30.0, faces=external_faces(mesh)).shape == (16, 2)
+
+
+def test_section_edges_of_surface_keep_boundary_as_features():
+    points = np.array([[x, y, 0.0] for y in range(3) for x in range(3)], dtype=float)
+    quads = np.array([[0, 1, 4, 3], [1, 2, 5, 4], [3, 4, 7, 6], [4, 5, 8, 7]])
+    mesh = MeshData(points=points, connectivity=quads, cell_type="QUAD_4")
+
+    assert section_edges(mesh).shape == (12, 2)
+    assert section_edges(mesh, feature_angle=30.0).shape == (8, 2)
+
+    bars = MeshData(points=points, connectivity=np.array([[1, 0], [0, 1]]), cell_type="BAR_2")
+    assert section_edges(bars).tolist() == [[0, 1]]
@@ -0,0 +1,74 @@
+"""Tests for the timing instrumentation."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from cgns_gui.profiling import (
+    LOAD_PHASES,
+    PHASE_PARSE,
+    FrameSample,
+    PerformanceMonitor,
+    PhaseTimer,
+)
+
+
+def test_phase_timer_adds_up_phases_across_threads():
+    timer = PhaseTimer()
+
+    def work() -> None:
+        for _ in range(100):
+            timer.add(PHASE_PARSE, 0.001)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with timer.phase("custom"):
+        pass
+
+    totals = timer.totals()
+    assert list(totals)[: len(LOAD_PHASES)] == list(LOAD_PHASES)
+    assert totals[PHASE_PARSE] == pytest.approx(0.4)
+    assert totals["custom"] >= 0.0
+
+
+def test_performance_monitor_exports_json_lines(tmp_path: Path):
+    monitor = PerformanceMonitor(history=2)
+    timer = monitor.begin_load(tmp_path / "model.cgns")
+    timer.add(PHASE_PARSE, 0.25)
+    monitor.end_load(timer, index_bytes=3 << 20)
+    for frame in range(3):
+        monitor.record_frame(
+            FrameSample(frame_seconds=0.01 * (frame + 1), actors=2, cells=100, pipeline_seconds=0.0)
+        )
+
+    path = tmp_path / "timings.jsonl"
+    assert monitor.export_jsonl(path) == 3
+
+    load, *frames = [json.loads(line) for line in path.read_text().splitlines()]
+    assert load["type"] == "load" and load["phases"][PHASE_PARSE] == 0.25
+    assert load["wall_seconds"] >= 0.0
+    assert load["index_bytes"] == 3 << 20
+    assert [frame["frame_seconds"] for frame in frames] == [0.02, 0.03]
+    assert frames[0]["pick_seconds"] is None
+    summary = monitor.summary()
+    assert "Frame 30.0 ms" in summary
+    assert "model.cgns" in summary and "parse 0.25 s" in summary
+    assert "indexes 3.0 MiB" in summary
+
+
+def test_performance_monitor_ends_cancelled_loads(tmp_path: Path):
+    monitor = PerformanceMonitor()
+    timer = monitor.begin_load(tmp_path / "replaced.cgns")
+    monitor.end_load(timer, cancelled=True)
+
+    (load,) = monitor.records()
+    assert load["cancelled"] is True
+    assert load["wall_seconds"] >= 0.0
+    assert "(cancelled)" in monitor.summary()
@@ -0,0 +1,57 @@
+"""Tests for the RenderScheduler."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from cgns_gui.rendering import RenderScheduler, RenderStats
+
+
+class _FakeRenderWindow:
+    def __init__(self) -> None:
+        self.renders = 0
+
+    def Render(self) -> None:  # noqa: N802 - VTK API
+        self.renders += 1
+
+
+def test_render_scheduler_coalesces_requests(qtbot):
+    window = _FakeRenderWindow()
+    scheduler = RenderScheduler(window, frame_interval_ms=0)
+
+    for _ in range(25):
+        scheduler.request()
+
+    assert window.renders == 0
+    assert scheduler.pending
+    with qtbot.waitSignal(scheduler.rendered, timeout=1000):
+        pass
+    assert window.renders == 1
+    assert not scheduler.pending
+    assert scheduler.stats == RenderStats(requested=25, rendered=1, coalesced=24)
+
+    scheduler.request()
+    scheduler.flush()
+    scheduler.flush()
+    assert window.renders == 2
+    assert scheduler.stats.coalesced == 24
+
+    scheduler.reset_stats()
+    assert scheduler.stats == RenderStats()
+
+
+def test_render_scheduler_spaces_frames(qtbot):
+    window = _FakeRenderWindow()
+    scheduler = RenderScheduler(window, frame_interval_ms=200)
+
+    scheduler.request()
+    with qtbot.waitSignal(scheduler.rendered, timeout=1000):
+        pass
+    scheduler.request()
+    qtbot.wait(50)
+    assert window.renders == 1
+    with qtbot.waitSignal(scheduler.rendered, timeout=1000):
+        pass
+    assert window.renders == 2
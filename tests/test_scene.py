@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+from dataclasses import replace
+
 import numpy as np
 import pytest
 
@@ -9,8 +12,10 @@ pytest.importorskip("vtkmodules.vtkRenderingCore")
 
 from vtkmodules.vtkRenderingCore import vtkRenderer
 
-from cgns_gui.model import CgnsModel, MeshData, Section, Zone
-from cgns_gui.scene import RenderStyle, SceneManager
+from cgns_gui import scene as scene_module
+from cgns_gui.model import CgnsModel, LazyArray, MeshData, Section, Zone, is_deferred
+from cgns_gui.scene import _ELEMENT_TYPE_TO_VTK, VTK_LINE, RenderStyle, SceneManager
+from cgns_gui.surfaces import surface_bytes
 
 
 def _sample_model() -> CgnsModel:
@@ -42,8 +47,34 @@ def test_scene_manager_creates_actor():
     scene = SceneManager(renderer)
 
     scene.load_model(_sample_model())
+    scene.set_section_visible(("Zone", 1), True)
+
+    assert renderer.GetActors().GetNumberOfItems() == 1
+
+
+def test_scene_manager_defers_hidden_volume_actors():
+    renderer = vtkRenderer()
+    scene = SceneManager(renderer)
+
+    scene.load_model(_sample_model())
+    key = ("Zone", 1)
+
+    assert renderer.GetActors().GetNumberOfItems() == 0
+    assert scene.has_actor(key) is False
+    assert list(scene.iter_section_keys()) == [key]
+    assert scene.scene_bounds() == pytest.approx((0.0, 1.0, 0.0, 1.0, 0.0, 1.0))
+    assert scene.visible_bounds() is None
+
+    scene.set_section_transparency(key, 0.5)
+    assert scene.has_actor(key) is False
 
+    assert scene.set_section_visible(key, True) is True
+    assert scene.has_actor(key) is True
+    actor = scene.get_actor(key)
     assert renderer.GetActors().GetNumberOfItems() == 1
+    assert actor.GetVisibility() == 1
+    assert actor.GetProperty().GetOpacity() == pytest.approx(0.5)
+    assert scene.get_key_for_actor(actor) == key
 
 
 def test_scene_manager_default_visibility():
@@ -103,6 +134,7 @@ def test_scene_manager_switches_render_style():
     scene = SceneManager(renderer)
 
     scene.load_model(_sample_model())
+    scene.set_section_visible(("Zone", 1), True)
     scene.set_render_style(RenderStyle.WIREFRAME)
 
     actors = renderer.GetActors()
@@ -240,3 +272,722 @@ def test_scene_manager_bounds_respect_visibility():
     scene.set_section_visible(key, False)
     assert scene.visible_bounds() is None
     assert scene.scene_bounds() == scene_bounds
+
+
+@pytest.mark.parametrize(
+    ("element_type", "nodes"),
+    [
+        ("BAR_2", 2),
+        ("TRI_3", 3),
+        ("QUAD_4", 4),
+        ("TETRA_4", 4),
+        ("PYRA_5", 5),
+        ("PENTA_6", 6),
+        ("HEXA_8", 8),
+    ],
+)
+def test_scene_manager_bulk_cell_array_matches_connectivity(element_type, nodes):
+    scene = SceneManager(vtkRenderer())
+    connectivity = np.arange(3 * nodes, dtype=np.int32).reshape(3, nodes)
+    mesh = MeshData(
+        points=np.zeros((3 * nodes, 3)),
+        connectivity=connectivity,
+        cell_type=element_type,
+    )
+
+    grid = scene._build_unstructured_grid(mesh)
+
+    assert grid.GetNumberOfCells() == 3
+    for cell_id in range(3):
+        cell = grid.GetCell(cell_id)
+        assert cell.GetCellType() == _ELEMENT_TYPE_TO_VTK[element_type]
+        ids = [cell.GetPointId(i) for i in range(cell.GetNumberOfPoints())]
+        assert ids == connectivity[cell_id].tolist()
+
+
+def test_scene_manager_shares_points_within_zone():
+    scene = SceneManager(vtkRenderer())
+    points = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.0, 0.0, 1.0],
+        ]
+    )
+    sections = [
+        Section(
+            id=index,
+            name=f"Surface{index}",
+            element_type="TRI_3",
+            range=(index, index),
+            mesh=MeshData(
+                points=points,
+                connectivity=np.array([[0, 1, index + 1]]),
+                cell_type="TRI_3",
+            ),
+        )
+        for index in (1, 2)
+    ]
+
+    scene.load_model(CgnsModel(zones=[Zone(name="Zone", sections=sections)]))
+
+    first = scene.get_actor(("Zone", 1)).GetMapper().GetInput().GetPoints()
+    second = scene.get_actor(("Zone", 2)).GetMapper().GetInput().GetPoints()
+    assert first is second
+
+    report = scene.points_memory_report()
+    assert report.shared_bytes == points.nbytes
+    assert report.copied_bytes == 0
+    assert report.saved_bytes == 2 * points.nbytes
+
+
+def test_scene_manager_adds_zones_incrementally():
+    model = _sample_model()
+    second = Zone(name="Zone2", sections=[replace(model.zones[0].sections[0])])
+    model.zones.append(second)
+
+    streamed = SceneManager(vtkRenderer())
+    streamed.add_families(model.families)
+    keys = [key for zone in model.zones for key in streamed.add_zone(zone)]
+    loaded = SceneManager(vtkRenderer())
+    loaded.load_model(model)
+
+    assert keys == [("Zone", 1), ("Zone2", 1)]
+    assert list(streamed.iter_section_keys()) == list(loaded.iter_section_keys())
+    for key in keys:
+        color = streamed.get_actor(key).GetProperty().GetColor()
+        assert color == loaded.get_actor(key).GetProperty().GetColor()
+
+
+def test_scene_manager_marks_a_single_cell():
+    renderer = vtkRenderer()
+    scene = SceneManager(renderer)
+    scene.load_model(_sample_model())
+    actors = renderer.GetActors().GetNumberOfItems()
+
+    bounds = scene.mark_cell(("Zone", 1), 0)
+    assert bounds is not None
+    assert renderer.GetActors().GetNumberOfItems() == actors + 1
+    # The marker is not a section actor
+    assert len(list(scene.iter_pickable_actors())) == actors
+    assert scene.mark_cell(("Zone", 1), 5) is None
+    assert renderer.GetActors().GetNumberOfItems() == actors
+
+
+def test_scene_manager_marks_cells_of_deferred_sections_without_loading_them():
+    model = _block_model()
+    block = model.zones[0].sections[0]
+    hexes = np.asarray(block.mesh.connectivity)
+    connectivity = LazyArray(hexes.shape, np.int64, lambda: hexes, lambda a, b: hexes[a:b])
+    block.mesh = replace(block.mesh, connectivity=connectivity)
+    scene = SceneManager(vtkRenderer())
+    scene.load_model(model)
+
+    assert scene.mark_cell(("Zone", 1), 1) == (1.0, 2.0, 0.0, 1.0, 0.0, 1.0)
+    pick = scene.describe_cell(("Zone", 1), 1)
+    assert pick is not None and pick.node_ids == (2, 3, 6, 5, 8, 9, 12, 11)
+    assert is_deferred(connectivity)
+
+
+def _block_model() -> CgnsModel:
+    """Two HEXA_8 cells side by side along x with a QUAD_4 wall below them."""
+
+    points = np.array(
+        [[x, y, z] for z in (0.0, 1.0) for y in (0.0, 1.0) for x in (0.0, 1.0, 2.0)]
+    )
+    hexes = np.array([[0, 1, 4, 3, 6, 7, 10, 9], [1, 2, 5, 4, 7, 8, 11, 10]])
+    volume = Section(
+        id=1,
+        name="Block",
+        element_type="HEXA_8",
+        range=(1, 2),
+        mesh=MeshData(points=points, connectivity=hexes, cell_type="HEXA_8"),
+    )
+    wall = Section(
+        id=2,
+        name="Wall",
+        element_type="QUAD_4",
+        range=(3, 4),
+        mesh=MeshData(
+            points=points,
+            connectivity=np.array([[0, 1, 4, 3], [1, 2, 5, 4]]),
+            cell_type="QUAD_4",
+        ),
+    )
+    return CgnsModel(zones=[Zone(name="Zone", sections=[volume, wall])])
+
+
+def test_scene_manager_picks_cells_through_locators():
+    scene = SceneManager(vtkRenderer())
+    scene.load_model(_block_model())
+
+    # Only the wall is shown at first; the ray from below hits it at z = 0
+    pick = scene.pick_cell((1.5, 0.5, -5.0), (1.5, 0.5, 5.0))
+    assert pick is not None
+    assert (pick.key, pick.cell, pick.element_id) == (("Zone", 2), 1, 4)
+    assert pick.node_ids == (2, 3, 6, 5)
+    assert pick.coordinates[1] == (2.0, 0.0, 0.0)
+    assert pick.position == pytest.approx((1.5, 0.5, 0.0))
+
+    # From above, the exterior faces of the shown block map back to its cells
+    scene.set_section_visible(("Zone", 1), True)
+    pick = scene.pick_cell((1.5, 0.5, 5.0), (1.5, 0.5, -5.0))
+    assert (pick.key, pick.cell, pick.element_id) == (("Zone", 1), 1, 2)
+    assert len(pick.node_ids) == 8
+    assert pick.position == pytest.approx((1.5, 0.5, 1.0))
+
+    assert scene.pick_cell((5.0, 5.0, 5.0), (6.0, 6.0, 6.0)) is None
+    assert not scene.locators_pending
+    assert scene.describe_cell(("Zone", 1), 2) is None
+
+
+def test_scene_manager_builds_large_pick_locators_in_the_background(monkeypatch):
+    monkeypatch.setattr(scene_module, "LOCATOR_SYNC_CELLS", 0)
+    ready = threading.Event()
+    scene = SceneManager(vtkRenderer(), surface_workers=1, on_surface_ready=ready.set)
+    try:
+        scene.load_model(_block_model())
+        # Nothing is picked while the wall's locator is being built
+        assert scene.pick_cell((0.5, 0.5, -5.0), (0.5, 0.5, 5.0)) is None
+        assert scene.locators_pending
+        assert ready.wait(5.0)
+        scene.apply_ready_surfaces()
+        assert not scene.locators_pending
+        pick = scene.pick_cell((0.5, 0.5, -5.0), (0.5, 0.5, 5.0))
+        assert pick is not None and pick.element_id == 3
+    finally:
+        scene.close()
+
+
+def test_scene_manager_caps_the_locator_cells_one_pick_builds(monkeypatch):
+    monkeypatch.setattr(scene_module, "LOCATOR_SYNC_CELLS", 2)
+    ready = threading.Event()
+    scene = SceneManager(vtkRenderer(), surface_workers=1, on_surface_ready=ready.set)
+    try:
+        scene.load_model(_block_model())
+        scene.set_section_visible(("Zone", 1), True)
+        assert ready.wait(5.0)
+        ready.clear()
+        scene.apply_ready_surfaces()
+
+        # Both sections start at z = 0: the block's two cells use up the
+        # budget and the wall's locator is left to the worker
+        assert scene.pick_cell((0.5, 0.5, -5.0), (0.5, 0.5, 5.0)) is None
+        assert ("Zone", 1) in scene._locators
+        assert scene.locators_pending
+        assert ready.wait(5.0)
+        scene.apply_ready_surfaces()
+        pick = scene.pick_cell((0.5, 0.5, -5.0), (0.5, 0.5, 5.0))
+        assert pick is not None and pick.element_id == 1
+    finally:
+        scene.close()
+
+
+def test_scene_manager_attaches_surfaces_that_did_not_fail(monkeypatch):
+    block, wall = _block_model().zones[0].sections
+    broken = replace(block, id=3, name="Broken", range=(5, 6), mesh=replace(block.mesh))
+    model = CgnsModel(zones=[Zone(name="Zone", sections=[block, wall, broken])])
+    build_surface = scene_module._build_surface
+
+    def extract(mesh: MeshData):  # noqa: ANN202
+        if mesh is broken.mesh:
+            raise ValueError("bad connectivity")
+        return build_surface(mesh)
+
+    monkeypatch.setattr(scene_module, "_build_surface", extract)
+    done = threading.Semaphore(0)
+    scene = SceneManager(vtkRenderer(), surface_workers=1, on_surface_ready=done.release)
+    try:
+        scene.load_model(model)
+        scene.set_sections_visible([("Zone", 1), ("Zone", 3)], True)
+        assert done.acquire(timeout=5.0) and done.acquire(timeout=5.0)
+
+        assert scene.apply_ready_surfaces() == [("Zone", 1)]
+        assert scene.get_actor(("Zone", 1)).GetMapper().GetInput().GetNumberOfCells() == 10
+        ((key, error),) = scene.take_failures()
+        assert key == ("Zone", 3) and str(error) == "bad connectivity"
+        assert scene.take_failures() == []
+    finally:
+        scene.close()
+
+
+def test_scene_manager_stops_picking_sections_whose_locator_failed(monkeypatch):
+    build_locator = scene_module._build_locator
+
+    def extract(mesh: MeshData):  # noqa: ANN202
+        if mesh.cell_type == "QUAD_4":
+            raise ValueError("bad wall")
+        return build_locator(mesh)
+
+    monkeypatch.setattr(scene_module, "_build_locator", extract)
+    scene = SceneManager(vtkRenderer())
+    scene.load_model(_block_model())
+    scene.set_section_visible(("Zone", 1), True)
+
+    assert not scene.ray_crosses_unpickable((0.5, 0.5, -5.0), (0.5, 0.5, 5.0))
+    assert scene.pick_cell((0.5, 0.5, -5.0), (0.5, 0.5, 5.0)) is None
+    assert [key for key, _ in scene.take_failures()] == [("Zone", 2)]
+    pick = scene.pick_cell((0.5, 0.5, -5.0), (0.5, 0.5, 5.0))
+    assert pick is not None and pick.key == ("Zone", 1)
+    # The failed wall still lies on the ray, for the caller to pick it another way
+    assert scene.ray_crosses_unpickable((0.5, 0.5, -5.0), (0.5, 0.5, 5.0))
+    assert not scene.ray_crosses_unpickable((5.0, 5.0, -5.0), (5.0, 5.0, 5.0))
+    scene.set_section_visible(("Zone", 2), False)
+    assert not scene.ray_crosses_unpickable((0.5, 0.5, -5.0), (0.5, 0.5, 5.0))
+
+
+def test_scene_manager_caps_pick_geometry_by_locator_memory(monkeypatch):
+    model = _block_model()
+    meshes = [section.mesh for section in model.zones[0].sections]
+    geometry = [scene_module._build_locator(mesh) for mesh in meshes]
+    cap = sum(scene_module._locator_bytes(polydata) for polydata in geometry) - 1
+    # The polydata alone would fit: only the locators push the cache over its cap
+    assert sum(surface_bytes(polydata) for polydata in geometry) <= cap
+    monkeypatch.setattr(scene_module, "DEFAULT_LOCATOR_BYTES", cap)
+    scene = SceneManager(vtkRenderer())
+    scene.load_model(model)
+    scene.set_section_visible(("Zone", 1), True)
+
+    assert scene.pick_cell((1.5, 0.5, 5.0), (1.5, 0.5, -5.0)).key == ("Zone", 1)
+    scene.set_section_visible(("Zone", 1), False)
+    assert scene.pick_cell((0.5, 0.5, -5.0), (0.5, 0.5, 5.0)).key == ("Zone", 2)
+    assert ("Zone", 2) in scene._locators
+    assert ("Zone", 1) not in scene._locators
+    assert scene._locators.total_bytes <= cap
+
+
+def test_scene_manager_runs_ray_queries_off_the_scene():
+    scene = SceneManager(vtkRenderer())
+    scene.load_model(_block_model())
+    scene.set_section_visible(("Zone", 1), True)
+
+    query = scene.ray_query((1.5, 0.5, 5.0), (1.5, 0.5, -5.0))
+    assert [key for _, key in query.candidates] == [("Zone", 1), ("Zone", 2)]
+    key, cell, position = query.run()
+    assert (key, cell) == (("Zone", 1), 1)
+    assert position == pytest.approx((1.5, 0.5, 1.0))
+    # A cancelled query gives up before testing any section
+    assert query.run(lambda: True) is None
+    assert scene.ray_query((5.0, 5.0, 5.0), (6.0, 6.0, 6.0)).run() is None
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_scene_manager_tints_the_hovered_section(batched):
+    scene = SceneManager(vtkRenderer(), batched=batched)
+    scene.load_model(CgnsModel(zones=[_boundary_zone()]))
+    left, right = ("Zone", 2), ("Zone", 3)
+
+    def color(key):
+        if batched:
+            batch, index = scene._batch_of[key]
+            return batch.color(index)[0]
+        return scene.get_actor(key).GetProperty().GetColor()
+
+    base = color(left)
+    assert scene.hover(left) is True
+    assert scene.hover(left) is False
+    assert scene.hovered == left
+    hovered = color(left)
+    assert hovered != pytest.approx(base, abs=1 / 255)
+    # The selection highlight wins over the hover tint
+    scene.highlight(left)
+    assert color(left) != pytest.approx(hovered, abs=1 / 255)
+    scene.highlight(None)
+    assert color(left) == pytest.approx(hovered, abs=1 / 255)
+
+    assert scene.hover(right) is True
+    assert color(left) == pytest.approx(base, abs=1 / 255)
+    scene.set_section_visible(right, False)
+    assert scene.hovered is None
+    # Hidden and volume sections that are not shown are not hovered
+    assert scene.hover(right) is False
+    assert scene.hover(("Zone", 1)) is False
+
+
+def test_scene_manager_shares_the_model_it_shows():
+    model = CgnsModel(families=_sample_model().families)
+    zone = _sample_model().zones[0]
+    scene = SceneManager(vtkRenderer())
+    scene.begin_model(model)
+    scene.add_zone(zone)
+
+    # The scene adds streamed zones to the model and looks sections up through it
+    assert model.zones == [zone]
+    assert list(scene.iter_section_keys()) == [("Zone", 1)]
+    model.add_zone(Zone(name="Later", sections=[replace(zone.sections[0])]))
+    # A zone of the model is only shown once it is added to the scene
+    assert list(scene.iter_section_keys()) == [("Zone", 1)]
+    assert scene.get_actor(("Later", 1)) is None
+
+
+def _boundary_zone() -> Zone:
+    points = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [1.0, 1.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [2.0, 0.0, 0.0],
+            [2.0, 1.0, 0.0],
+        ]
+    )
+    volume = MeshData(points=points, connectivity=np.array([[0, 1, 3, 4]]), cell_type="TETRA_4")
+    tris = MeshData(points=points, connectivity=np.array([[0, 1, 2], [0, 2, 3]]), cell_type="TRI_3")
+    quad = MeshData(points=points, connectivity=np.array([[1, 4, 5, 2]]), cell_type="QUAD_4")
+    return Zone(
+        name="Zone",
+        sections=[
+            Section(id=1, name="Fluid", element_type="TETRA_4", range=(1, 1), mesh=volume),
+            Section(id=2, name="Left", element_type="TRI_3", range=(2, 3), mesh=tris),
+            Section(id=3, name="Right", element_type="QUAD_4", range=(4, 4), mesh=quad),
+        ],
+    )
+
+
+def test_batched_scene_merges_boundary_sections():
+    renderer = vtkRenderer()
+    scene = SceneManager(renderer, batched=True)
+    scene.load_model(CgnsModel(zones=[_boundary_zone()]))
+
+    left, right = ("Zone", 2), ("Zone", 3)
+    actor = scene.get_actor(left)
+    assert actor is scene.get_actor(right)
+    assert renderer.GetActors().GetNumberOfItems() == 1
+    assert scene.is_batched(left) and not scene.has_actor(("Zone", 1))
+    assert actor.GetMapper().GetInput().GetNumberOfCells() == 3
+    assert scene.get_key_for_actor(actor, 1) == left
+    assert scene.get_key_for_actor(actor, 2) == right
+    assert scene.get_key_for_actor(actor) is None
+    assert scene.visible_bounds() == pytest.approx((0.0, 2.0, 0.0, 1.0, 0.0, 0.0))
+
+
+def test_batched_scene_styles_sections_through_lookup_table():
+    scene = SceneManager(vtkRenderer(), batched=True)
+    scene.load_model(CgnsModel(zones=[_boundary_zone()]))
+    left, right = ("Zone", 2), ("Zone", 3)
+    batch, index = scene._batch_of[right]
+    base_color, opacity = batch.color(index)
+
+    scene.highlight(right)
+    color, _ = batch.color(index)
+    assert color == pytest.approx(tuple(min(c + 0.25, 1.0) for c in base_color), abs=1 / 255)
+    assert batch.color(scene._batch_of[left][1])[0] != color
+
+    scene.highlight_multiple([left])
+    assert batch.color(index)[0] == pytest.approx(base_color, abs=1 / 255)
+
+    scene.set_section_transparency(right, 0.5)
+    assert batch.color(index)[1] == pytest.approx(0.5, abs=1 / 255)
+    assert opacity == pytest.approx(1.0)
+
+
+def test_batched_scene_visibility_rebuilds_cells():
+    scene = SceneManager(vtkRenderer(), batched=True)
+    scene.load_model(CgnsModel(zones=[_boundary_zone()]))
+    left, right = ("Zone", 2), ("Zone", 3)
+    actor = scene.get_actor(left)
+
+    scene.highlight(left)
+    assert scene.set_section_visible(left, False) is True
+    assert actor.GetMapper().GetInput().GetNumberOfCells() == 1
+    assert scene.get_key_for_actor(actor, 0) == right
+    assert scene.bounds_for_section(left) is None
+    assert scene.visible_bounds() == pytest.approx((1.0, 2.0, 0.0, 1.0, 0.0, 0.0))
+
+    scene.set_section_visible(right, False)
+    assert actor.GetVisibility() == 0
+    assert list(scene.iter_pickable_actors()) == []
+
+    scene.set_section_visible(left, True)
+    assert actor.GetVisibility() == 1
+    assert scene.get_key_for_actor(actor, 1) == left
+
+
+def test_scene_manager_highlight_restyles_only_changed_sections():
+    points = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    sections = [
+        Section(
+            id=index,
+            name=f"Wall{index}",
+            element_type="TRI_3",
+            range=(index, index),
+            mesh=MeshData(points=points, connectivity=np.array([[0, 1, 2]]), cell_type="TRI_3"),
+        )
+        for index in range(1, 25)
+    ]
+    scene = SceneManager(vtkRenderer())
+    scene.load_model(CgnsModel(zones=[Zone(name="Zone", sections=sections)]))
+    keys = list(scene.iter_section_keys())
+    actors = {key: scene.get_actor(key) for key in keys}
+    # Sections with the same colour share one vtkProperty
+    assert actors[keys[0]].GetProperty() is actors[keys[12]].GetProperty()
+
+    scene.highlight(keys[0])
+    stamps = {key: actor.GetMTime() for key, actor in actors.items()}
+    scene.highlight(keys[1])
+
+    touched = {key for key, actor in actors.items() if actor.GetMTime() != stamps[key]}
+    assert touched == {keys[0], keys[1]}
+    assert actors[keys[1]].GetProperty().GetLineWidth() == pytest.approx(2.0)
+    assert actors[keys[0]].GetProperty() is actors[keys[12]].GetProperty()
+
+    scene.highlight_multiple(keys[:3])
+    stamps = {key: actor.GetMTime() for key, actor in actors.items()}
+    scene.highlight_multiple(keys[2:4])
+    touched = {key for key, actor in actors.items() if actor.GetMTime() != stamps[key]}
+    assert touched == {keys[0], keys[1], keys[3]}
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_scene_manager_bulk_updates(batched):
+    scene = SceneManager(vtkRenderer(), batched=batched)
+    scene.load_model(CgnsModel(zones=[_boundary_zone()]))
+    volume, left, right = ("Zone", 1), ("Zone", 2), ("Zone", 3)
+    scene.highlight_multiple([left, right])
+
+    changed = scene.set_sections_visible([volume, left, right, left, ("Missing", 1)], False)
+
+    assert changed == [left, right]
+    assert not any(scene.is_section_visible(key) for key in (volume, left, right))
+    assert list(scene.iter_pickable_actors()) == []
+    assert scene.set_sections_visible([left], False) == []
+    assert scene.set_sections_visible([volume, right], True) == [volume, right]
+    assert scene.bounds_for_section(right) is not None
+
+    scene.set_sections_transparency([volume, right], 0.4)
+    scene.set_sections_color([right], (1.0, 0.0, 0.0))
+    assert scene.get_section_transparency(volume) == pytest.approx(0.4)
+    assert scene.get_section_transparency(left) == pytest.approx(0.0)
+    assert scene.get_section_color(right) == (1.0, 0.0, 0.0)
+    if batched:
+        batch, index = scene._batch_of[right]
+        color, opacity = batch.color(index)
+    else:
+        prop = scene.get_actor(right).GetProperty()
+        color, opacity = prop.GetColor(), prop.GetOpacity()
+    assert color == pytest.approx((1.0, 0.0, 0.0))
+    assert opacity == pytest.approx(0.6, abs=1 / 255)
+
+
+def test_scene_manager_maintains_visible_bounds_incrementally():
+    points = np.array([[float(x), float(y), 0.0] for x in range(4) for y in range(2)])
+    sections = [
+        Section(
+            id=index + 1,
+            name=f"Strip{index}",
+            element_type="QUAD_4",
+            range=(index + 1, index + 1),
+            mesh=MeshData(
+                points=points,
+                connectivity=np.array([[2 * index, 2 * index + 2, 2 * index + 3, 2 * index + 1]]),
+                cell_type="QUAD_4",
+            ),
+        )
+        for index in range(3)
+    ]
+    scene = SceneManager(vtkRenderer())
+    scene.load_model(CgnsModel(zones=[Zone(name="Zone", sections=sections)]))
+    left, middle, right = scene.iter_section_keys()
+
+    assert scene.bounds_for_section(middle) == (1.0, 2.0, 0.0, 1.0, 0.0, 0.0)
+    assert scene.visible_bounds() == (0.0, 3.0, 0.0, 1.0, 0.0, 0.0)
+
+    scene.set_section_visible(middle, False)
+    assert scene.visible_bounds() == (0.0, 3.0, 0.0, 1.0, 0.0, 0.0)
+
+    scene.set_sections_visible([right], False)
+    assert scene.visible_bounds() == (0.0, 1.0, 0.0, 1.0, 0.0, 0.0)
+    scene.set_sections_visible([middle, right], True)
+    assert scene.visible_bounds() == (0.0, 3.0, 0.0, 1.0, 0.0, 0.0)
+    scene.set_sections_visible([left, middle, right], False)
+    assert scene.visible_bounds() is None
+    assert scene.scene_bounds() == (0.0, 3.0, 0.0, 1.0, 0.0, 0.0)
+
+
+def test_scene_manager_draws_volume_sections_from_cached_surfaces():
+    scene = SceneManager(vtkRenderer())
+    scene.load_model(_sample_model())
+    key = ("Zone", 1)
+
+    scene.set_section_visible(key, True)
+    mapper = scene.get_actor(key).GetMapper()
+    surface = scene.surface_cache.get(key)
+    assert mapper.IsA("vtkPolyDataMapper")
+    assert mapper.GetInput() is surface
+    assert surface.GetNumberOfCells() == 4
+
+    scene.set_section_visible(key, False)
+    assert mapper.GetInput().GetNumberOfCells() == 0
+    scene.set_section_visible(key, True)
+    assert mapper.GetInput() is surface
+
+
+def test_scene_manager_draws_unique_edges_in_wireframe_styles():
+    scene = SceneManager(vtkRenderer())
+    scene.load_model(CgnsModel(zones=[_boundary_zone()]))
+    left = ("Zone", 2)
+    grid = scene.get_actor(left).GetMapper().GetInput()
+
+    scene.set_render_style(RenderStyle.WIREFRAME)
+    edges = scene.get_actor(left).GetMapper().GetInput()
+    assert edges.GetNumberOfLines() == 5
+    assert edges.GetNumberOfPoints() == 4
+
+    # The two triangles are coplanar: their shared diagonal is not a feature
+    scene.set_render_style(RenderStyle.FEATURE_EDGES)
+    assert scene.get_actor(left).GetMapper().GetInput().GetNumberOfLines() == 4
+
+    scene.set_render_style(RenderStyle.SURFACE)
+    assert scene.get_actor(left).GetMapper().GetInput() is grid
+
+
+def test_scene_manager_draws_feature_edges_of_volume_surfaces():
+    scene = SceneManager(vtkRenderer())
+    scene.load_model(_sample_model())
+    key = ("Zone", 1)
+    scene.set_render_style(RenderStyle.FEATURE_EDGES)
+
+    scene.set_section_visible(key, True)
+    mapper = scene.get_actor(key).GetMapper()
+    assert mapper.GetInput().GetNumberOfLines() == 6
+    # Faces meet at 90 degrees along the axis edges, at about 125 along the others
+    scene.feature_angle = 100.0
+    assert mapper.GetInput().GetNumberOfLines() == 3
+
+    scene.set_section_visible(key, False)
+    assert mapper.GetInput().GetNumberOfLines() == 0
+
+
+def test_batched_scene_draws_section_edges():
+    scene = SceneManager(vtkRenderer(), batched=True)
+    scene.load_model(CgnsModel(zones=[_boundary_zone()]))
+    left, right = ("Zone", 2), ("Zone", 3)
+    actor = scene.get_actor(left)
+
+    scene.set_render_style(RenderStyle.WIREFRAME)
+    lines = actor.GetMapper().GetInput()
+    assert lines.GetNumberOfCells() == 9
+    assert {lines.GetCellType(cell) for cell in range(9)} == {VTK_LINE}
+    assert scene.get_key_for_actor(actor, 0) == left
+    assert scene.get_key_for_actor(actor, 8) == right
+
+    scene.set_section_visible(left, False)
+    assert actor.GetMapper().GetInput().GetNumberOfCells() == 4
+
+    scene.set_render_style(RenderStyle.SURFACE)
+    assert actor.GetMapper().GetInput().GetNumberOfCells() == 1
+
+
+def test_scene_manager_draws_lod_proxies_while_interactive():
+    scene = SceneManager(vtkRenderer(), batched=True)
+    scene.load_model(CgnsModel(zones=[_boundary_zone()]))
+    batch_actor = scene.get_actor(("Zone", 2))
+    full = batch_actor.GetMapper()
+
+    scene.set_interactive(True)
+    assert batch_actor.GetMapper() is full  # below lod_cells: nothing to simplify
+    scene.set_interactive(False)
+
+    scene.lod_cells = 2
+    scene.prepare_lod()
+    scene.set_interactive(True)
+    proxy = batch_actor.GetMapper().GetInput()
+    assert batch_actor.GetMapper() is not full
+    assert 0 < proxy.GetNumberOfCells() <= 3
+    assert proxy.GetCellData().GetScalars().GetName() == "SectionIndex"
+    assert batch_actor.GetMapper().GetLookupTable() is full.GetLookupTable()
+
+    scene.set_interactive(False)
+    assert batch_actor.GetMapper() is full
+    assert full.GetInput().GetNumberOfCells() == 3
+
+
+def test_scene_manager_rebuilds_lod_proxies_of_changed_data():
+    ready = threading.Event()
+    scene = SceneManager(vtkRenderer(), surface_workers=1, on_surface_ready=ready.set)
+    try:
+        scene.load_model(CgnsModel(zones=[_boundary_zone()]))
+        scene.lod_cells = 1
+        actor = scene.get_actor(("Zone", 2))
+
+        scene.set_interactive(True)
+        # Until the worker is done the proxy is the bounding box outline
+        assert actor.GetMapper().GetInput().GetNumberOfLines() == 12
+        assert ready.wait(5.0)
+        scene.apply_ready_surfaces()
+        assert actor.GetMapper().GetInput().GetNumberOfPolys() > 0
+        scene.set_interactive(False)
+
+        # The edges drawn in wireframe are new data: their proxy is built anew
+        scene.set_render_style(RenderStyle.WIREFRAME)
+        scene.set_interactive(True)
+        assert actor.GetMapper().GetInput().GetNumberOfPolys() == 0
+    finally:
+        scene.close()
+
+
+def test_batched_scene_decimates_a_snapshot_of_rebuilt_cells(monkeypatch):
+    decimate = scene_module._decimate
+    started = threading.Event()
+    release = threading.Event()
+    seen: list[int] = []
+
+    def slow_decimate(source, target_cells):  # noqa: ANN001, ANN202
+        seen.append(source.GetNumberOfCells())
+        started.set()
+        release.wait(5.0)
+        seen.append(source.GetNumberOfCells())
+        return decimate(source, target_cells)
+
+    monkeypatch.setattr(scene_module, "_decimate", slow_decimate)
+    ready = threading.Event()
+    scene = SceneManager(
+        vtkRenderer(), batched=True, surface_workers=1, on_surface_ready=ready.set
+    )
+    try:
+        scene.load_model(CgnsModel(zones=[_boundary_zone()]))
+        scene.lod_cells = 1
+        batch_actor = scene.get_actor(("Zone", 2))
+        scene.prepare_lod()
+        assert started.wait(5.0)
+
+        # Hiding a section rebuilds the batch's cells while its proxy is pending
+        scene.set_section_visible(("Zone", 3), False)
+        assert batch_actor.GetMapper().GetInput().GetNumberOfCells() == 2
+        release.set()
+        assert ready.wait(5.0)
+        scene.apply_ready_surfaces()
+        assert seen == [3, 3]
+
+        # The proxy was built from the old cells: it is stale and built again
+        ready.clear()
+        scene.set_interactive(True)
+        assert batch_actor.GetMapper().GetInput().GetNumberOfLines() == 12
+        assert ready.wait(5.0)
+        scene.apply_ready_surfaces()
+        assert seen[2:] == [2, 2]
+        assert batch_actor.GetMapper().GetInput().GetNumberOfPolys() > 0
+    finally:
+        release.set()
+        scene.close()
+
+
+def test_scene_manager_reports_draw_stats_and_pipeline_time():
+    scene = SceneManager(vtkRenderer(), batched=True)
+    scene.take_pipeline_seconds()
+    scene.load_model(CgnsModel(zones=[_boundary_zone()]))
+
+    assert scene.take_pipeline_seconds() > 0.0
+    assert scene.take_pipeline_seconds() == 0.0
+    stats = scene.draw_stats()
+    assert (stats.actors, stats.cells) == (1, 3)
+    # Counted once until the scene changes
+    assert scene.draw_stats() is stats
+
+    scene.set_section_visible(("Zone", 1), True)
+    stats = scene.draw_stats()
+    assert stats.actors == 2
+    assert scene.take_pipeline_seconds() > 0.0
+    scene.set_section_visible(("Zone", 3), False)
+    assert scene.draw_stats().cells == stats.cells - 1
@@ -0,0 +1,126 @@
+"""Tests for the volume surface cache."""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+pytest.importorskip("vtkmodules.vtkCommonDataModel")
+
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+from cgns_gui.model import MeshData
+from cgns_gui.scene import _build_surface
+from cgns_gui.surfaces import ORIGINAL_CELL_IDS, SurfaceCache
+
+
+def _hex_block() -> MeshData:
+    """Two HEXA_8 cells side by side along x."""
+
+    points = np.array(
+        [[float(x), float(y), float(z)] for z in range(2) for y in range(2) for x in range(3)]
+    )
+
+    def node(x: int, y: int, z: int) -> int:
+        return z * 6 + y * 3 + x
+
+    connectivity = np.array(
+        [
+            [
+                node(x, 0, 0),
+                node(x + 1, 0, 0),
+                node(x + 1, 1, 0),
+                node(x, 1, 0),
+                node(x, 0, 1),
+                node(x + 1, 0, 1),
+                node(x + 1, 1, 1),
+                node(x, 1, 1),
+            ]
+            for x in range(2)
+        ]
+    )
+    return MeshData(points=points, connectivity=connectivity, cell_type="HEXA_8")
+
+
+def test_build_surface_keeps_exterior_faces_and_their_points():
+    mesh = _hex_block()
+    surface = _build_surface(mesh)
+
+    # 12 faces in total, the shared one is interior
+    assert surface.GetNumberOfCells() == 10
+    assert surface.GetNumberOfPoints() == 12
+    assert surface.GetBounds() == mesh.bounds()
+    parents = vtk_to_numpy(surface.GetCellData().GetArray(ORIGINAL_CELL_IDS))
+    assert np.bincount(parents).tolist() == [5, 5]
+
+
+def test_surface_cache_evicts_least_recently_used():
+    mesh = _hex_block()
+    size = _build_surface(mesh).GetActualMemorySize() * 1024
+    cache = SurfaceCache(_build_surface, max_bytes=2 * size)
+
+    first = cache.request("a", mesh)
+    assert cache.request("a", mesh) is first
+    cache.request("b", mesh)
+    cache.get("a")
+    cache.request("c", mesh)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.total_bytes == 2 * size
+
+
+def test_surface_cache_charges_entries_by_its_size_hook():
+    mesh = _hex_block()
+    cache = SurfaceCache(_build_surface, max_bytes=250, size=lambda surface: 100)
+
+    cache.request("a", mesh)
+    cache.request("b", mesh)
+    assert cache.total_bytes == 200
+    cache.request("c", mesh)
+
+    assert "a" not in cache
+    assert cache.total_bytes == 200
+
+
+def test_surface_cache_extracts_in_background():
+    ready = threading.Event()
+    cache = SurfaceCache(_build_surface, workers=1, on_ready=ready.set)
+    try:
+        assert cache.request("a", _hex_block()) is None
+        assert cache.is_pending("a")
+        assert ready.wait(5.0)
+
+        assert cache.take_ready() == ["a"]
+        assert not cache.is_pending("a")
+        assert cache.get("a").GetNumberOfCells() == 10
+    finally:
+        cache.close()
+
+
+def test_surface_cache_keeps_finished_surfaces_when_one_extraction_fails():
+    def extract(mesh: MeshData):  # noqa: ANN202
+        if mesh.connectivity.shape[0] == 1:
+            raise ValueError("broken section")
+        return _build_surface(mesh)
+
+    block = _hex_block()
+    broken = MeshData(points=block.points, connectivity=block.connectivity[:1], cell_type="HEXA_8")
+    done = threading.Semaphore(0)
+    cache = SurfaceCache(extract, workers=1, on_ready=done.release)
+    try:
+        assert cache.request("bad", broken) is None
+        assert cache.request("a", block) is None
+        assert done.acquire(timeout=5.0) and done.acquire(timeout=5.0)
+
+        assert cache.take_ready() == ["a"]
+        ((key, error),) = cache.take_failures()
+        assert key == "bad" and str(error) == "broken section"
+        assert cache.take_failures() == []
+        # Requesting the failed key again retries it
+        assert cache.request("bad", broken) is None
+        assert cache.is_pending("bad")
+    finally:
+        cache.close()
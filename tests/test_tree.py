@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QModelIndex, Qt
+
+from cgns_gui import tree as tree_module
+from cgns_gui.model import BoundaryInfo, CgnsModel, FamilyInfo, MeshData, Section, Zone
+from cgns_gui.tree import CgnsTreeModel
+
+FETCH_BATCH = 4
+
+
+def _zone(name: str, *, bodies: int = 1, family: str | None = None) -> Zone:
+    mesh = MeshData(
+        points=np.zeros((3, 3)),
+        connectivity=np.array([[0, 1, 2]]),
+        cell_type="TRI_3",
+    )
+    sections = [
+        Section(id=i + 1, name=f"Body{i + 1}", element_type="TRI_3", range=(1, 1), mesh=mesh)
+        for i in range(bodies)
+    ]
+    sections.append(
+        Section(
+            id=bodies + 1,
+            name="Wall",
+            element_type="TRI_3",
+            range=(1, 1),
+            mesh=mesh,
+            boundary=BoundaryInfo(name="Wall", family=family),
+        )
+    )
+    return Zone(name=name, sections=sections)
+
+
+@pytest.fixture(autouse=True)
+def _small_batches(monkeypatch):
+    monkeypatch.setattr(tree_module, "FETCH_BATCH", FETCH_BATCH)
+
+
+def test_tree_model_creates_rows_in_batches():
+    zones = [_zone(f"Zone#{i}", family="Wall") for i in range(FETCH_BATCH + 2)]
+    tree = CgnsTreeModel()
+    tree.begin_model(
+        CgnsModel(zones=zones, families={"Wall": FamilyInfo(name="Wall", bc_type="BCWall")})
+    )
+    for zone in zones:
+        tree.add_zone(zone)
+
+    # The Families group plus the first batch of zones
+    assert tree.rowCount() == FETCH_BATCH
+    assert tree.canFetchMore(QModelIndex())
+    tree.fetchMore(QModelIndex())
+    assert tree.rowCount() == len(zones) + 1
+    assert not tree.canFetchMore(QModelIndex())
+
+    family = tree.index(0, 0, tree.index(0, 0))
+    assert family.data(Qt.UserRole) == ("family", "Wall")
+    assert family.siblingAtColumn(2).data() == str(len(zones))
+    assert tree.hasChildren(family)
+    assert tree.rowCount(family) == 0
+    tree.fetchMore(family)
+    assert tree.rowCount(family) == FETCH_BATCH
+    assert len(tree.get_family_sections(family)) == len(zones)
+    assert len(tree.item_section_keys(family)) == len(zones)
+
+
+def test_tree_model_finds_rows_that_were_not_fetched():
+    zones = [_zone(f"Zone#{i}", bodies=FETCH_BATCH + 1) for i in range(FETCH_BATCH + 1)]
+    tree = CgnsTreeModel()
+    tree.begin_model(CgnsModel(zones=zones))
+    for zone in zones:
+        tree.add_zone(zone)
+
+    last_zone = zones[-1].name
+    index = tree.index_for_key((last_zone, FETCH_BATCH + 1))
+    assert index.data() == f"Body{FETCH_BATCH + 1}"
+    assert tree.section_key(index) == (last_zone, FETCH_BATCH + 1)
+    assert index.parent().data() == last_zone
+    assert tree.parent(index.parent()) == QModelIndex()
+
+    boundary = tree.index_for_key((last_zone, FETCH_BATCH + 2))
+    assert boundary.parent().data() == "Boundary Conditions"
+    assert not tree.flags(boundary.parent()) & Qt.ItemIsSelectable
+    assert tree.section_key(boundary) == (last_zone, FETCH_BATCH + 2)
+
+    zone, section = tree.section_info((last_zone, 1))
+    assert zone is zones[-1] and section is zones[-1].sections[0]
+    assert not tree.index_for_key(("Missing", 1)).isValid()
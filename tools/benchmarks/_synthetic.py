@@ -0,0 +1,133 @@
+"""Write synthetic CGNS/HDF5 files for the benchmark scripts.
+
+The files follow the on-disk layout produced by the CGNS library (``" data"``
+datasets, ``name``/``label``/``type`` attributes) so that both the pyCGNS and
+the h5py loader backends can read them.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import h5py
+import numpy as np
+
+_TYPE_CODES = {
+    np.dtype(np.int32): "I4",
+    np.dtype(np.int64): "I8",
+    np.dtype(np.float32): "R4",
+    np.dtype(np.float64): "R8",
+}
+
+
+def _node(parent: h5py.Group, name: str, label: str, data=None) -> h5py.Group:  # noqa: ANN001
+    group = parent.create_group(name)
+    group.attrs.create("name", np.bytes_(name), dtype="S33")
+    group.attrs.create("label", np.bytes_(label), dtype="S33")
+    group.attrs.create("flags", np.array([0], dtype=np.int32))
+    if data is None:
+        group.attrs.create("type", np.bytes_("MT"), dtype="S3")
+        return group
+    if isinstance(data, str):
+        group.attrs.create("type", np.bytes_("C1"), dtype="S3")
+        group.create_dataset(" data", data=np.frombuffer(data.encode(), dtype=np.int8))
+        return group
+    array = np.asarray(data)
+    group.attrs.create("type", np.bytes_(_TYPE_CODES[array.dtype]), dtype="S3")
+    # CGNS/HDF5 stores arrays with reversed (Fortran) dimensions
+    group.create_dataset(" data", data=array.T)
+    return group
+
+
+def _hex_block(n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return points, HEXA_8 connectivity and boundary QUAD_4 faces of an n^3 block."""
+
+    axis = np.linspace(0.0, 1.0, n + 1)
+    x, y, z = np.meshgrid(axis, axis, axis, indexing="ij")
+    points = np.column_stack([x.ravel(), y.ravel(), z.ravel()])
+    ids = np.arange((n + 1) ** 3).reshape(n + 1, n + 1, n + 1)
+    c = ids[:-1, :-1, :-1]
+    hexa = np.stack(
+        [
+            c,
+            ids[1:, :-1, :-1],
+            ids[1:, 1:, :-1],
+            ids[:-1, 1:, :-1],
+            ids[:-1, :-1, 1:],
+            ids[1:, :-1, 1:],
+            ids[1:, 1:, 1:],
+            ids[:-1, 1:, 1:],
+        ],
+        axis=-1,
+    ).reshape(-1, 8)
+    bottom = np.stack(
+        [ids[:-1, :-1, 0], ids[:-1, 1:, 0], ids[1:, 1:, 0], ids[1:, :-1, 0]],
+        axis=-1,
+    ).reshape(-1, 4)
+    return points, hexa, bottom
+
+
+def write_synthetic_cgns(
+    path: str | Path,
+    *,
+    zones: int = 4,
+    cells_per_axis: int = 20,
+    with_solution: bool = True,
+) -> Path:
+    """Write ``zones`` hexahedral blocks with a wall boundary and optional solution."""
+
+    path = Path(path)
+    points, hexa, wall = _hex_block(cells_per_axis)
+    with h5py.File(path, "w") as handle:
+        handle.attrs.create("name", np.bytes_("HDF5 MotherNode"), dtype="S33")
+        handle.attrs.create("label", np.bytes_("Root Node of HDF5 File"), dtype="S33")
+        handle.attrs.create("type", np.bytes_("MT"), dtype="S3")
+        handle.create_dataset(" format", data=np.frombuffer(b"NATIVE\x00", dtype=np.int8))
+        handle.create_dataset(
+            " hdf5version",
+            data=np.frombuffer(b"HDF5 Version 1.14.4".ljust(33, b"\x00"), dtype=np.int8),
+        )
+        _node(handle, "CGNSLibraryVersion", "CGNSLibraryVersion_t", np.array([4.2], np.float32))
+        base = _node(handle, "Base", "CGNSBase_t", np.array([3, 3], dtype=np.int32))
+        family = _node(base, "Wall", "Family_t")
+        _node(family, "FamilyBC", "FamilyBC_t", "BCWall")
+        for index in range(zones):
+            offset = points + np.array([float(index), 0.0, 0.0])
+            sizes = np.array([[len(points), len(hexa), 0]], dtype=np.int32)
+            zone = _node(base, f"Zone{index + 1}", "Zone_t", sizes)
+            _node(zone, "ZoneType", "ZoneType_t", "Unstructured")
+            coords = _node(zone, "GridCoordinates", "GridCoordinates_t")
+            for axis, column in zip("XYZ", offset.T, strict=True):
+                _node(coords, f"Coordinate{axis}", "DataArray_t", np.ascontiguousarray(column))
+            volume = _node(zone, "Hexa", "Elements_t", np.array([17, 0], dtype=np.int32))
+            _node(volume, "ElementRange", "IndexRange_t", np.array([1, len(hexa)], np.int32))
+            _node(
+                volume,
+                "ElementConnectivity",
+                "DataArray_t",
+                (hexa.reshape(-1) + 1).astype(np.int32),
+            )
+            surface = _node(zone, "Wall", "Elements_t", np.array([7, 0], dtype=np.int32))
+            _node(
+                surface,
+                "ElementRange",
+                "IndexRange_t",
+                np.array([len(hexa) + 1, len(hexa) + len(wall)], np.int32),
+            )
+            _node(
+                surface,
+                "ElementConnectivity",
+                "DataArray_t",
+                (wall.reshape(-1) + 1).astype(np.int32),
+            )
+            zone_bc = _node(zone, "ZoneBC", "ZoneBC_t")
+            bc = _node(zone_bc, "Wall", "BC_t", "FamilySpecified")
+            _node(bc, "FamilyName", "FamilyName_t", "Wall")
+            _node(bc, "GridLocation", "GridLocation_t", "FaceCenter")
+            if with_solution:
+                solution = _node(zone, "FlowSolution", "FlowSolution_t")
+                _node(solution, "GridLocation", "GridLocation_t", "Vertex")
+                rng = np.random.default_rng(index)
+                for name in ("Density", "Pressure", "VelocityX", "VelocityY", "VelocityZ"):
+                    _node(solution, name, "DataArray_t", rng.random(len(points)))
+    return path
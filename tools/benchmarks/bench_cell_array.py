@@ -0,0 +1,78 @@
+"""Benchmark VTK cell-array construction for every supported element type.
+
+Compares the legacy per-cell ``vtkIdList`` loop with the bulk
+offsets/connectivity path used by ``SceneManager._build_unstructured_grid``
+and prints cells per second for each element type.
+
+Usage::
+
+    python tools/benchmarks/bench_cell_array.py --cells 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from vtkmodules.vtkCommonCore import vtkIdList
+from vtkmodules.vtkCommonDataModel import vtkCellArray
+
+from cgns_gui.scene import _ELEMENT_TYPE_TO_VTK, _build_cell_array
+
+_NODES_PER_CELL = {
+    "BAR_2": 2,
+    "TRI_3": 3,
+    "QUAD_4": 4,
+    "TETRA_4": 4,
+    "PYRA_5": 5,
+    "PENTA_6": 6,
+    "HEXA_8": 8,
+}
+
+
+def _legacy_cell_array(connectivity: np.ndarray) -> vtkCellArray:
+    cell_array = vtkCellArray()
+    for cell in connectivity:
+        ids = vtkIdList()
+        for idx in cell:
+            ids.InsertNextId(int(idx))
+        cell_array.InsertNextCell(ids)
+    return cell_array
+
+
+def _cells_per_second(builder, connectivity: np.ndarray, repeat: int) -> float:  # noqa: ANN001
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        builder(connectivity)
+        best = min(best, time.perf_counter() - start)
+    return connectivity.shape[0] / max(best, 1e-12)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cells", type=int, default=100_000, help="cells per element type")
+    parser.add_argument("--repeat", type=int, default=3, help="best-of repetitions")
+    parser.add_argument(
+        "--legacy-cells",
+        type=int,
+        default=None,
+        help="cells used for the legacy loop (defaults to --cells)",
+    )
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    legacy_cells = args.legacy_cells or args.cells
+    print(f"{'type':<10}{'legacy cells/s':>18}{'bulk cells/s':>18}{'speedup':>10}")
+    for element_type in _ELEMENT_TYPE_TO_VTK:
+        nodes = _NODES_PER_CELL[element_type]
+        connectivity = rng.integers(0, args.cells, size=(args.cells, nodes), dtype=np.int64)
+        legacy = _cells_per_second(_legacy_cell_array, connectivity[:legacy_cells], 1)
+        bulk = _cells_per_second(_build_cell_array, connectivity, args.repeat)
+        print(f"{element_type:<10}{legacy:>18,.0f}{bulk:>18,.0f}{bulk / legacy:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
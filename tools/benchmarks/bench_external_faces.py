@@ -0,0 +1,92 @@
+"""Benchmark NumPy external-face extraction against VTK's geometry filter.
+
+Builds a structured block of about ``--cells`` HEXA_8 cells (and the same
+block split into TETRA_4 cells), then times, best of ``--repeat``:
+
+* ``external_faces``: the NumPy routine of :mod:`cgns_gui.model`;
+* ``surface``: that routine plus the polydata built for rendering;
+* ``vtkGeometryFilter``: VTK's filter on the equivalent unstructured grid.
+
+Usage::
+
+    python tools/benchmarks/bench_external_faces.py --cells 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from vtkmodules.vtkFiltersGeometry import vtkGeometryFilter
+from vtkmodules.vtkRenderingCore import vtkRenderer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synthetic import _hex_block  # noqa: E402
+
+from cgns_gui.model import MeshData, external_faces  # noqa: E402
+from cgns_gui.scene import SceneManager, _build_surface  # noqa: E402
+
+# Freudenthal split of a hexahedron around its 0-6 diagonal (conforming between blocks)
+_HEX_TO_TETS = np.array(
+    [[0, 1, 2, 6], [0, 2, 3, 6], [0, 3, 7, 6], [0, 7, 4, 6], [0, 4, 5, 6], [0, 5, 1, 6]]
+)
+
+
+def _mesh(cell_type: str, cells: int) -> MeshData:
+    per_hex = 6 if cell_type == "TETRA_4" else 1
+    n = max(round((cells / per_hex) ** (1 / 3)), 1)
+    points, hexa, _ = _hex_block(n)
+    connectivity = hexa if per_hex == 1 else hexa[:, _HEX_TO_TETS].reshape(-1, 4)
+    return MeshData(points=points, connectivity=connectivity, cell_type=cell_type)
+
+
+def _geometry_filter(grid) -> int:  # noqa: ANN001
+    surface_filter = vtkGeometryFilter()
+    surface_filter.SetInputData(grid)
+    surface_filter.Update()
+    return surface_filter.GetOutput().GetNumberOfCells()
+
+
+def _best(function, repeat: int) -> tuple[float, object]:  # noqa: ANN001
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cells", type=int, default=1_000_000, help="approximate cell count")
+    parser.add_argument("--repeat", type=int, default=3, help="best-of repetitions")
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'type':<8}{'cells':>12}{'faces':>10}{'numpy s':>10}{'surface s':>11}"
+        f"{'vtk s':>9}{'vtk/numpy':>11}"
+    )
+    scene = SceneManager(vtkRenderer())
+    for cell_type in ("HEXA_8", "TETRA_4"):
+        mesh = _mesh(cell_type, args.cells)
+        numpy_time, faces = _best(lambda mesh=mesh: external_faces(mesh), args.repeat)
+        surface_time, _ = _best(lambda mesh=mesh: _build_surface(mesh), args.repeat)
+        grid = scene._build_unstructured_grid(mesh)
+        vtk_time, vtk_faces = _best(lambda grid=grid: _geometry_filter(grid), args.repeat)
+        if vtk_faces != faces.face_count:
+            print(f"warning: VTK found {vtk_faces} faces, NumPy {faces.face_count}")
+        print(
+            f"{cell_type:<8}{mesh.connectivity.shape[0]:>12,}{faces.face_count:>10,}"
+            f"{numpy_time:>10.3f}{surface_time:>11.3f}{vtk_time:>9.3f}"
+            f"{vtk_time / numpy_time:>11.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
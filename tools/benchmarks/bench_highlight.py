@@ -0,0 +1,112 @@
+"""Benchmark click-to-render latency of section highlighting.
+
+Builds a scene of many small boundary sections, then times a sequence of
+simulated clicks: ``SceneManager.highlight`` on a random section followed by
+a render of an offscreen window.  The highlight step and the render step are
+reported separately (median and 95th percentile, in milliseconds).
+
+Usage::
+
+    python tools/benchmarks/bench_highlight.py --sections 100 10000 100000
+    python tools/benchmarks/bench_highlight.py --sections 100000 --batched
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import vtkmodules.vtkRenderingOpenGL2  # noqa: F401  # registers the render window
+from vtkmodules.vtkRenderingCore import vtkRenderer, vtkRenderWindow
+
+from cgns_gui.model import CgnsModel, MeshData, Section, Zone
+from cgns_gui.scene import SceneManager
+
+
+def _model(sections: int, cells_per_section: int) -> CgnsModel:
+    """One zone of ``sections`` strips of triangles sharing a point array."""
+
+    columns = cells_per_section // 2 + 1
+    x, y = np.meshgrid(np.arange(columns, dtype=float), np.arange(sections + 1, dtype=float))
+    points = np.column_stack([x.ravel(), y.ravel(), np.zeros(x.size)])
+    items = []
+    for index in range(sections):
+        lower = index * columns + np.arange(columns - 1)
+        upper = lower + columns
+        connectivity = np.concatenate(
+            [
+                np.column_stack([lower, lower + 1, upper]),
+                np.column_stack([lower + 1, upper + 1, upper]),
+            ]
+        )
+        items.append(
+            Section(
+                id=index + 1,
+                name=f"BC{index + 1}",
+                element_type="TRI_3",
+                range=(index + 1, index + 1),
+                mesh=MeshData(points=points, connectivity=connectivity, cell_type="TRI_3"),
+            )
+        )
+    return CgnsModel(zones=[Zone(name="Zone", sections=items)])
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    values = np.asarray(samples) * 1e3
+    return float(np.median(values)), float(np.percentile(values, 95))
+
+
+def _measure(sections: int, clicks: int, batched: bool, cells: int) -> tuple[float, ...]:
+    renderer = vtkRenderer()
+    window = vtkRenderWindow()
+    window.SetOffScreenRendering(1)
+    window.SetSize(640, 480)
+    window.AddRenderer(renderer)
+
+    start = time.perf_counter()
+    scene = SceneManager(renderer, batched=batched)
+    scene.load_model(_model(sections, cells))
+    window.Render()
+    build = time.perf_counter() - start
+
+    keys = list(scene.iter_section_keys())
+    rng = np.random.default_rng(0)
+    highlight_times: list[float] = []
+    render_times: list[float] = []
+    for index in rng.integers(0, len(keys), clicks):
+        start = time.perf_counter()
+        scene.highlight(keys[index])
+        middle = time.perf_counter()
+        window.Render()
+        highlight_times.append(middle - start)
+        render_times.append(time.perf_counter() - middle)
+    window.Finalize()
+    return (build, *_percentiles(highlight_times), *_percentiles(render_times))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--clicks", type=int, default=50)
+    parser.add_argument("--cells-per-section", type=int, default=8)
+    parser.add_argument("--batched", action="store_true", help="merge sections per zone")
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'sections':>10}{'build s':>10}{'highlight ms':>14}{'p95':>8}"
+        f"{'render ms':>11}{'p95':>8}"
+    )
+    for sections in args.sections:
+        build, highlight, highlight_p95, render, render_p95 = _measure(
+            sections, args.clicks, args.batched, args.cells_per_section
+        )
+        print(
+            f"{sections:>10,}{build:>10.2f}{highlight:>14.3f}{highlight_p95:>8.3f}"
+            f"{render:>11.2f}{render_p95:>8.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
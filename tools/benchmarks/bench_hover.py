@@ -0,0 +1,174 @@
+"""Benchmark the per-event cost of hover picking on large scenes.
+
+Builds a grid of square QUAD_4 sections facing the camera, renders it in an
+offscreen window and moves a simulated cursor over random positions.  For
+every position it times the work a hover does on the GUI thread (the pick
+ray, ``SceneManager.ray_query`` and the ``SceneManager.hover`` restyle) and
+on the hover worker (``RayQuery.run``), then a full ``vtkCellPicker`` pass
+for comparison.  Cell locators are built by the surface workers, as in the
+viewer, during a warm-up pass over the same positions; that one-off cost is
+reported as well.  Moves whose locators were evicted from the size-capped
+cache and are being rebuilt are counted as deferred (the viewer retries
+them).  Times are medians and 95th percentiles, in milliseconds.
+
+Usage::
+
+    python tools/benchmarks/bench_hover.py --sections 100 --cells-per-section 100000
+    python tools/benchmarks/bench_hover.py --sections 10000 --cells-per-section 1000
+    python tools/benchmarks/bench_hover.py --sections 100000 --cells-per-section 100 --batched
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import vtkmodules.vtkRenderingOpenGL2  # noqa: F401  # registers the render window
+from vtkmodules.vtkRenderingCore import vtkCellPicker, vtkRenderer, vtkRenderWindow
+
+from cgns_gui.model import CgnsModel, MeshData, Section, Zone
+from cgns_gui.scene import SceneManager
+from cgns_gui.selection import PICK_TOLERANCE, pick_ray
+
+
+def _model(sections: int, cells_per_section: int) -> CgnsModel:
+    """One zone of ``sections`` unit squares of ``cells_per_section`` quads each."""
+
+    n = max(int(np.sqrt(cells_per_section)), 1)
+    axis = np.linspace(0.0, 1.0, n + 1)
+    x, y = np.meshgrid(axis, axis, indexing="ij")
+    square = np.column_stack([x.ravel(), y.ravel(), np.zeros(x.size)])
+    ids = np.arange((n + 1) ** 2).reshape(n + 1, n + 1)
+    quads = np.column_stack(
+        [
+            ids[:-1, :-1].ravel(),
+            ids[1:, :-1].ravel(),
+            ids[1:, 1:].ravel(),
+            ids[:-1, 1:].ravel(),
+        ]
+    )
+    side = int(np.ceil(np.sqrt(sections)))
+    items = []
+    for index in range(sections):
+        points = square + (index % side, index // side, 0.0)
+        first = index * len(quads) + 1
+        items.append(
+            Section(
+                id=index + 1,
+                name=f"Wall{index + 1}",
+                element_type="QUAD_4",
+                range=(first, first + len(quads) - 1),
+                mesh=MeshData(points=points, connectivity=quads, cell_type="QUAD_4"),
+            )
+        )
+    return CgnsModel(zones=[Zone(name="Zone", sections=items)])
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    values = np.asarray(samples) * 1e3
+    return float(np.median(values)), float(np.percentile(values, 95))
+
+
+def _measure(
+    sections: int,
+    cells: int,
+    moves: int,
+    picker_moves: int,
+    workers: int,
+    batched: bool,
+) -> tuple[float, ...]:
+    renderer = vtkRenderer()
+    window = vtkRenderWindow()
+    window.SetOffScreenRendering(1)
+    window.SetSize(800, 800)
+    window.AddRenderer(renderer)
+    scene = SceneManager(renderer, batched=batched, surface_workers=workers)
+    scene.load_model(_model(sections, cells))
+    renderer.ResetCamera()
+    window.Render()
+
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(50.0, 750.0, size=(moves, 2))
+    start = time.perf_counter()
+    for x, y in positions:
+        ray_start, ray_end, tolerance = pick_ray(renderer, x, y)
+        scene.ray_query(ray_start, ray_end, tolerance=tolerance)
+    while scene.locators_pending:
+        time.sleep(0.01)
+        scene.apply_ready_surfaces()
+    warmup = time.perf_counter() - start
+
+    gui_times: list[float] = []
+    worker_times: list[float] = []
+    deferred = 0
+    for x, y in positions:
+        start = time.perf_counter()
+        ray_start, ray_end, tolerance = pick_ray(renderer, x, y)
+        query = scene.ray_query(ray_start, ray_end, tolerance=tolerance)
+        middle = time.perf_counter()
+        if query is None:
+            deferred += 1
+            gui_times.append(middle - start)
+            continue
+        hit = query.run()
+        end = time.perf_counter()
+        scene.hover(None if hit is None else hit[0])
+        gui_times.append(middle - start + time.perf_counter() - end)
+        worker_times.append(end - middle)
+
+    picker = vtkCellPicker()
+    picker.SetTolerance(PICK_TOLERANCE)
+    picker.PickFromListOn()
+    for actor in scene.iter_pickable_actors():
+        picker.AddPickList(actor)
+    picker_times: list[float] = []
+    for x, y in positions[:picker_moves]:
+        start = time.perf_counter()
+        picker.Pick(x, y, 0, renderer)
+        picker_times.append(time.perf_counter() - start)
+    window.Finalize()
+    scene.close()
+    return (
+        warmup,
+        deferred,
+        *_percentiles(gui_times),
+        *_percentiles(worker_times),
+        *_percentiles(picker_times),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, nargs="+", default=[100, 10_000])
+    parser.add_argument("--cells-per-section", type=int, default=10_000)
+    parser.add_argument("--moves", type=int, default=200)
+    parser.add_argument("--picker-moves", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=2, help="surface worker threads")
+    parser.add_argument("--batched", action="store_true", help="merge sections per zone")
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'sections':>10}{'cells':>13}{'warmup s':>10}{'deferred':>10}{'gui ms':>9}{'p95':>8}"
+        f"{'worker ms':>11}{'p95':>8}{'picker ms':>11}{'p95':>8}"
+    )
+    for sections in args.sections:
+        row = _measure(
+            sections,
+            args.cells_per_section,
+            args.moves,
+            args.picker_moves,
+            args.workers,
+            args.batched,
+        )
+        warmup, deferred, gui, gui_p95, worker, worker_p95, picker, picker_p95 = row
+        cells = sections * max(int(np.sqrt(args.cells_per_section)), 1) ** 2
+        print(
+            f"{sections:>10,}{cells:>13,}{warmup:>10.2f}{deferred:>10}{gui:>9.3f}{gui_p95:>8.3f}"
+            f"{worker:>11.3f}{worker_p95:>8.3f}{picker:>11.2f}{picker_p95:>8.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
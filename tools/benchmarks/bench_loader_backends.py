@@ -0,0 +1,79 @@
+"""Compare the pyCGNS and h5py loader backends on the same CGNS files.
+
+Pass one or more existing files, or let the script write a synthetic case
+(hexahedral zones with a wall boundary and a FlowSolution the viewer never
+displays).
+
+Usage::
+
+    python tools/benchmarks/bench_loader_backends.py case.cgns other.cgns
+    python tools/benchmarks/bench_loader_backends.py --zones 8 --cells-per-axis 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synthetic import write_synthetic_cgns  # noqa: E402
+
+from cgns_gui.backends import available_backends  # noqa: E402
+from cgns_gui.loader import CgnsLoader  # noqa: E402
+
+
+def _measure(backend: str, path: Path, repeat: int) -> tuple[float, int, int]:
+    best = float("inf")
+    cells = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model = CgnsLoader(backend=backend).load(path)
+        best = min(best, time.perf_counter() - start)
+        cells = sum(zone.total_cells for zone in model.zones)
+    tracemalloc.start()
+    CgnsLoader(backend=backend).load(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, cells, peak
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--zones", type=int, default=4)
+    parser.add_argument("--cells-per-axis", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = list(args.files)
+        if not files:
+            files.append(
+                write_synthetic_cgns(
+                    Path(tmp) / "synthetic.cgns",
+                    zones=args.zones,
+                    cells_per_axis=args.cells_per_axis,
+                )
+            )
+        print(f"{'file':<24}{'backend':<10}{'seconds':>10}{'cells':>12}{'traced MiB':>12}")
+        for path in files:
+            for backend in available_backends():
+                try:
+                    seconds, cells, peak = _measure(backend, path, args.repeat)
+                except ImportError as exc:
+                    print(f"{path.name:<24}{backend:<10}  skipped: {exc}")
+                    continue
+                print(
+                    f"{path.name:<24}{backend:<10}{seconds:>10.3f}{cells:>12,}"
+                    f"{peak / 2**20:>12.1f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
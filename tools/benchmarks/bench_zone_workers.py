@@ -0,0 +1,74 @@
+"""Measure how multi-zone loading scales with the loader's worker pool.
+
+Loads the same file with 1, 2, 4, ... workers (up to ``--max-workers``) and
+reports the best wall time, the speed-up over one worker and whether the
+zone order matched the single-worker result.
+
+Usage::
+
+    python tools/benchmarks/bench_zone_workers.py case.cgns --backend h5py
+    python tools/benchmarks/bench_zone_workers.py --zones 512 --cells-per-axis 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synthetic import write_synthetic_cgns  # noqa: E402
+
+from cgns_gui.loader import CgnsLoader  # noqa: E402
+
+
+def _worker_counts(maximum: int) -> list[int]:
+    counts = [1]
+    while counts[-1] * 2 <= maximum:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != maximum:
+        counts.append(maximum)
+    return counts
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file", nargs="?", type=Path)
+    parser.add_argument("--backend", default="pycgns")
+    parser.add_argument("--zones", type=int, default=256)
+    parser.add_argument("--cells-per-axis", type=int, default=10)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file or write_synthetic_cgns(
+            Path(tmp) / "zones.cgns",
+            zones=args.zones,
+            cells_per_axis=args.cells_per_axis,
+            with_solution=False,
+        )
+        print(f"{'workers':>8}{'seconds':>10}{'speed-up':>10}  order")
+        baseline: float | None = None
+        reference: list[str] | None = None
+        for workers in _worker_counts(max(1, args.max_workers)):
+            best = float("inf")
+            for _ in range(args.repeat):
+                loader = CgnsLoader(backend=args.backend, workers=workers)
+                start = time.perf_counter()
+                model = loader.load(path)
+                best = min(best, time.perf_counter() - start)
+            names = [zone.name for zone in model.zones]
+            reference = reference or names
+            baseline = baseline or best
+            order = "same" if names == reference else "DIFFERENT"
+            print(f"{workers:>8}{best:>10.3f}{baseline / best:>9.2f}x  {order}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())